@@ -0,0 +1,20 @@
+from typing import Any
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+from src.fjml import data_types as dt
+
+
+class BenchActions(dt.EventContainer):
+
+    def bench_click(self, e: Any) -> NoReturn:
+        self.clicks += 1
+
+    def _importer(self) -> NoReturn:
+        self.clicks: int = 0
+
+    def _page_setup(self) -> NoReturn:
+        self.group_assign(self.page, {"bgcolor":"grey50"})
@@ -0,0 +1,170 @@
+from __future__ import annotations
+import os, json
+from dataclasses import dataclass, asdict
+from typing import Any, Sequence, Mapping
+
+from src.fjml.object_enums import *
+
+
+ACTION_IMPORT: Mapping[str, str] = {"import":"BenchActions", "from":"benchmarks.actions"}
+IMPORT_FOLDER: str = "extra"
+STYLE_SHEET_NAME: str = "style_sheet"
+
+
+@dataclass
+class ProgramShape:
+    controls: int = 200
+    depth: int = 3
+    routes: int = 5
+    loop_size: int = 10
+    loop_depth: int = 1
+    style_size: int = 20
+    imports: int = 4
+    
+    @property
+    def data(self) -> Mapping[str, int]:
+        return asdict(self)
+
+
+class ProgramGenerator:
+    
+    __slots__ = ("shape",)
+    
+    def __init__(self, shape: ProgramShape) -> None:
+        self.shape: ProgramShape = shape
+    
+    def style_name(self, index: int) -> str:
+        return f"style_{index % max(self.shape.style_size, 1)}"
+    
+    def unpack(self, index: int) -> Mapping[str, Any]:
+        if not self.shape.style_size:
+            return {}
+        return {ControlKeys.UNPACK:{RefsKeys.STYLING:self.style_name(index)}}
+    
+    def text(self, value: Any) -> Mapping[str, Any]:
+        return {
+            ControlKeys.CONTROL_TYPE:"Text",
+            ControlKeys.SETTINGS:{"value":value, "size":14}
+        }
+    
+    def loop(self, level: int) -> Mapping[str, Any]:
+        control: Mapping[str, Any] = self.text(
+            {ControlKeys.CONTROL_TYPE:LoopKeys.LOOP_INDEX, LoopKeys.IDX:[0, 0]}
+        )
+        
+        if level < self.shape.loop_depth - 1:
+            control = {
+                ControlKeys.CONTROL_TYPE:"Row",
+                ControlKeys.SETTINGS:{"controls":self.loop(level + 1)}
+            }
+        
+        return {
+            ControlKeys.CONTROL_TYPE:LoopKeys.LOOP,
+            LoopKeys.DEPTH:self.shape.loop_depth,
+            LoopKeys.ITERATOR:[f"item {i}" for i in range(self.shape.loop_size)],
+            LoopKeys.CONTROL:control
+        }
+    
+    def nest(self, index: int, depth: int) -> Mapping[str, Any]:
+        controls: Sequence[Mapping[str, Any]] = [self.text(f"control {index} level {depth}")]
+        
+        if depth > 1:
+            controls.append(self.nest(index, depth - 1))
+        
+        return {
+            ControlKeys.CONTROL_TYPE:"Column",
+            ControlKeys.SETTINGS:dict(
+                {"controls":controls, "spacing":depth},
+                **self.unpack(index + depth)
+            )
+        }
+    
+    def control(self, index: int) -> Mapping[str, Any]:
+        content: Mapping[str, Any] = self.nest(index, max(self.shape.depth, 1))
+        
+        if self.shape.loop_size and self.shape.loop_depth and index % 4 == 0:
+            content[ControlKeys.SETTINGS]["controls"].append(
+                {
+                    ControlKeys.CONTROL_TYPE:"Row",
+                    ControlKeys.SETTINGS:{"controls":self.loop(0)}
+                }
+            )
+        
+        return {
+            ControlKeys.VAR_NAME:f"control_{index}",
+            ControlKeys.CONTROL_TYPE:"Container",
+            ControlKeys.SETTINGS:{
+                "content":content,
+                "padding":4,
+                "on_click":{EventKeys.FUNC:"bench_click"}
+            }
+        }
+    
+    def route_name(self, index: int) -> str:
+        return "/" if not index else f"/route_{index}"
+    
+    def route(self, index: int) -> Mapping[str, Any]:
+        routes: int = max(self.shape.routes, 1)
+        
+        return {
+            ControlKeys.ROUTE:self.route_name(index),
+            ControlKeys.SETTINGS:{
+                "controls":[
+                    {RefsKeys.REFS:f"control_{i}"} 
+                    for i in range(index, self.shape.controls, routes)
+                ],
+                "scroll":"auto"
+            }
+        }
+    
+    def style_sheet(self) -> Mapping[str, Any]:
+        return {
+            self.style_name(i):{
+                "horizontal_alignment":{
+                    ControlKeys.CONTROL_TYPE:"CrossAxisAlignment",
+                    ControlKeys.ATTR:"CENTER"
+                },
+                "tight":bool(i % 2)
+            } for i in range(self.shape.style_size)
+        }
+    
+    @property
+    def routes(self) -> Sequence[str]:
+        return [self.route_name(i) for i in range(max(self.shape.routes, 1))]
+    
+    def files(self) -> Mapping[str, Mapping[str, Any]]:
+        controls: Sequence[Mapping[str, Any]] = [
+            self.control(i) for i in range(self.shape.controls)
+        ]
+        imports: int = self.shape.imports
+        files: dict[str, Mapping[str, Any]] = {
+            os.path.join(IMPORT_FOLDER, f"file_{i}.json"):{
+                MarkupKeys.CONTROLS:controls[i::imports]
+            } for i in range(imports)
+        }
+        
+        files["ui.json"] = {
+            MarkupKeys.HEADER:{
+                "program_name":"Benchmark",
+                "import_folder":IMPORT_FOLDER,
+                "style_sheet_name":STYLE_SHEET_NAME,
+                "action_import":ACTION_IMPORT
+            },
+            MarkupKeys.IMPORTS:[{ImportKeys.SOURCE:f"file_{i}"} for i in range(imports)],
+            MarkupKeys.CONTROLS:[] if imports else controls,
+            MarkupKeys.UI:[self.route(i) for i in range(max(self.shape.routes, 1))]
+        }
+        files[f"{STYLE_SHEET_NAME}.style.json"] = self.style_sheet()
+        return files
+    
+    def write(self, path: str) -> str:
+        name: str
+        data: Mapping[str, Any]
+        file_path: str
+        
+        os.makedirs(os.path.join(path, IMPORT_FOLDER), exist_ok=True)
+        for name, data in self.files().items():
+            file_path = os.path.join(path, name)
+            with open(file_path, "w") as file:
+                json.dump(data, file)
+        return path
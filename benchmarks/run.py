@@ -0,0 +1,189 @@
+from __future__ import annotations
+import os, sys, json, time, argparse, tempfile, tracemalloc, statistics
+from dataclasses import fields
+from typing import Any, Callable, Sequence, Mapping, Union
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+from src.fjml import Compiler, Backend, HeadlessPage
+from src.fjml.program_format import CompiledFileHandler, CompiledProgram
+from .generator import ProgramShape, ProgramGenerator
+
+
+SCHEMA_VERSION: int = 1
+
+
+class StageResult:
+
+    __slots__ = ("name", "times", "peak_memory", "units")
+
+    def __init__(self, name: str, units: int) -> None:
+        self.name: str = name
+        self.times: list[float] = []
+        self.peak_memory: int = 0
+        self.units: int = units
+
+    @property
+    def data(self) -> Mapping[str, Any]:
+        best: float = min(self.times)
+        return {
+            "min_seconds":best,
+            "mean_seconds":statistics.fmean(self.times),
+            "max_seconds":max(self.times),
+            "units":self.units,
+            "throughput_per_second":self.units / best if best else None,
+            "peak_memory_bytes":self.peak_memory,
+        }
+
+
+class BenchmarkSuite:
+
+    __slots__ = ("shape", "repeat", "path", "generator", "compiled_path", "results")
+
+    def __init__(self, shape: ProgramShape, repeat: int = 5, path: Union[str, None] = None) -> None:
+        self.shape: ProgramShape = shape
+        self.repeat: int = max(repeat, 1)
+        self.path: str = path or tempfile.mkdtemp(prefix="fjml_bench_")
+        self.generator: ProgramGenerator = ProgramGenerator(shape)
+        self.compiled_path: str = os.path.join(self.path, "compiled.fjml")
+        self.results: dict[str, StageResult] = {}
+
+    def measure(self, name: str, units: int, func: Callable[[], Any], setup: Callable[[], Any] = lambda: None) -> NoReturn:
+        i: int
+        start: float
+        result: StageResult = StageResult(name, units)
+
+        for i in range(self.repeat):
+            setup()
+            start = time.perf_counter()
+            func()
+            result.times.append(time.perf_counter() - start)
+
+        setup()
+        tracemalloc.start()
+        try:
+            func()
+            result.peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.results[name] = result
+
+    def compile(self) -> NoReturn:
+        Compiler(self.path, self.compiled_path).compile()
+
+    def load(self) -> CompiledProgram:
+        return CompiledFileHandler.load(self.compiled_path)
+
+    def initialize(self) -> HeadlessPage:
+        page: HeadlessPage = HeadlessPage()
+        Backend(self.load(), page).initialize()
+        return page
+
+    def run(self) -> Mapping[str, Any]:
+        route: str
+        routes: Sequence[str] = self.generator.routes
+        pages: list[HeadlessPage] = []
+
+        self.generator.write(self.path)
+        self.measure("compile", self.shape.controls, self.compile)
+        self.measure("load", 1, self.load)
+        self.measure("initialize", 1, self.initialize)
+
+        def new_page() -> NoReturn:
+            if pages:
+                pages.pop().close()
+            pages.append(self.initialize())
+
+        for route in routes:
+            self.measure(
+                f"render:{route}", 1,
+                lambda: pages[-1].go(route), new_page
+            )
+        self.measure(
+            "render:all", len(routes),
+            lambda: [pages[-1].go(route) for route in routes], new_page
+        )
+        if pages:
+            pages[-1].close()
+
+        return self.report()
+
+    def report(self) -> Mapping[str, Any]:
+        name: str
+        result: StageResult
+
+        return {
+            "schema":SCHEMA_VERSION,
+            "python":sys.version.split()[0],
+            "shape":self.shape.data,
+            "program_size_bytes":os.path.getsize(self.compiled_path),
+            "repeat":self.repeat,
+            "stages":{name:result.data for name, result in self.results.items()},
+        }
+
+
+def compare(current: Mapping[str, Any], baseline: Mapping[str, Any], threshold: float) -> Sequence[str]:
+    name: str
+    data: Mapping[str, Any]
+    ratio: float
+    regressions: list[str] = []
+
+    for name, data in current["stages"].items():
+        if name not in baseline["stages"] or not baseline["stages"][name]["min_seconds"]:
+            continue
+        ratio = data["min_seconds"] / baseline["stages"][name]["min_seconds"]
+        if ratio > threshold:
+            regressions.append(f"{name}: {ratio:.2f}x slower than baseline")
+    return regressions
+
+
+def arguments(argv: Union[Sequence[str], None] = None) -> argparse.Namespace:
+    field: Any
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Time compile, load, initialize and route rendering of a synthetic FJML program"
+    )
+
+    for field in fields(ProgramShape):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}", type=int, default=field.default
+        )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=str, default="")
+    parser.add_argument("--baseline", type=str, default="")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    return parser.parse_args(argv)
+
+
+def main(argv: Union[Sequence[str], None] = None) -> int:
+    file: Any
+    baseline: Mapping[str, Any]
+    regressions: Sequence[str] = []
+    args: argparse.Namespace = arguments(argv)
+    shape: ProgramShape = ProgramShape(
+        **{field.name:getattr(args, field.name) for field in fields(ProgramShape)}
+    )
+    report: Mapping[str, Any] = BenchmarkSuite(shape, args.repeat).run()
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+        regressions = compare(report, baseline, args.threshold)
+        report = dict(report, regressions=regressions)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
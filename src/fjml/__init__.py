@@ -1,5 +1,7 @@
 from .display.builder import Backend
+from .display.headless import HeadlessPage
 from . import data_types
+from .instrumentation import Instrumentation, RingBufferSink, JsonLinesSink, ChromeTraceSink
 from .compiler.compiler import Compiler, load_program
 from .registry.control_register import ControlRegistryOperations
 from .constant_controls import SizeAwareControl, CustomResponsiveRow
@@ -7,23 +7,21 @@ if TYPE_CHECKING:
 
 
 class Checker:
-    data: Sequence[tuple[str, Any]]
     names: Sequence[str]
     dtypes: dt.TypeHints
     optional: Sequence[str]
     
     @classmethod
     def correct(self, data: JsonDict) -> Mapping:
-        self.data = data.items()
-        return self.validate_dict()
+        return self.validate_dict(data.items())
     
     @classmethod
-    def validate_dict(self) -> Mapping:
+    def validate_dict(self, data: Sequence[tuple[str, Any]]) -> Mapping:
         key: str
         value: Any
         result: Mapping = {MarkupKeys.SKIP:False}
 
-        for key, value in self.data:
+        for key, value in data:
             if key not in self.names:
                 continue
             if isinstance(value, self.dtypes[key]):
@@ -1,4 +1,5 @@
-import io, os, json, time, operator, functools
+import io, os, gc, json, operator, functools, warnings, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import(
     Any, Union, 
     Final, Callable, 
@@ -18,6 +19,7 @@ from ..display.builder import Backend
 from ..object_enums import *
 from ..registry.control_register import ControlRegistryOperations
 from ..utils import Utilities, import_module
+from ..program_format import CompiledFileHandler
 from . import checks
 from .. import (
     data_types as dt,
@@ -25,33 +27,25 @@ from .. import (
     operation_classes as opc,
     constant_controls,
     constants,
+    instrumentation as ins,
     utils
 )
 
 
-def timeit(func: Callable) -> Callable:
-    @functools.wraps(func)
-    def timeit_wrapper(*args, **kwargs) -> Any:
-        start_time: float = time.perf_counter()
-        result: Any = func(*args, **kwargs)
-        end_time: float = time.perf_counter()
-        print(f"Took {(end_time - start_time):.4f} seconds")
-        return result
-
-    return timeit_wrapper
-
-
 Tools: Utilities = Utilities()
-CompileHandler: utils.CompiledFileHandler = utils.CompiledFileHandler()
+CompileHandler: CompiledFileHandler = CompiledFileHandler()
 MarkupType: TypeAlias = Union[Sequence[dt.JsonDict], dt.JsonDict]
 VALID_KEYS: Final[Sequence[str]] = [
     MarkupKeys.UI, MarkupKeys.IMPORTS, 
     MarkupKeys.CONTROLS, MarkupKeys.HEADER
 ]
 valid_imports: tuple[dt.ThirdPartyExtension, dt.UIImports] = (dt.ThirdPartyExtension, dt.UIImports)
+MAIN_SOURCE: Final[str] = "<ui.json>"
+LoadedSource: TypeAlias = tuple[dt.SourceFileModel, Union[dt.JsonDict, None]]
+ParsedSource: TypeAlias = tuple[dt.ParsedControls, dt.ParsedUserInterface, opc.ControlDependencies]
 
 
-def control_filter(keys: set[str], controls: Sequence[str]) -> Callable[[Iterable], Iterator[str]]:
+def control_filter(keys: set[str], controls: Mapping[str, dt.ControlJsonScheme]) -> Callable[[Iterable], Iterator[str]]:
     def func(name: str) -> bool:
         return not (
             name in keys or name in constants.MARKUP_SPECIFIC_CONTROLS 
@@ -64,6 +58,7 @@ class Compiler:
 
     __slots__ = (
         "control_settings",
+        "control_stamps",
         "code",
         "controls",
         "parsed_controls",
@@ -76,17 +71,35 @@ class Compiler:
         "controls_registry",
         "are_registries_joined",
         "style_sheet",
+        "style_sheet_controls",
         "dependent_refs",
         "params",
-        "control_param_types"
+        "control_param_types",
+        "control_sources",
+        "incremental",
+        "cache",
+        "sources",
+        "source_data",
+        "workers",
+        "strict",
+        "runtime_hints",
+        "type_checker",
+        "instrumentation"
     )
+    
+    forked: Union["Compiler", None] = None
 
-    def __init__(self, program_path: str, compile_path: str) -> NoReturn:
+    def __init__(
+        self, program_path: str, compile_path: str, 
+        incremental: bool = False, workers: int = 1, strict: bool = False,
+        instrumentation: Union[ins.Instrumentation, None] = None
+    ) -> NoReturn:
         self.params: dt.ParamGenerator = dt.ParamGenerator(program_path, compile_path)
         self.params.parse_extensions()
         self.imports_path: str = self.params.imports_path
         self.code: dt.JsonDict = self.params.ui_code
         self.style_sheet: opc.StyleSheet
+        self.style_sheet_controls: set[str] = set()
         self.used_controls: set[str] = set([ControlKeys.VIEW])
         self.custom_controls: dt.ControlRegistryJsonScheme
         self.dependent_refs: opc.ControlDependencies = opc.ControlDependencies()
@@ -98,12 +111,31 @@ class Compiler:
         self.controls: dt.ControlMap = dt.ControlMap()
         self.control_param_types: Mapping[str, dt.TypeHints] = {}
         self.control_settings: Mapping[str, Sequence[str]] = {}
+        self.control_stamps: Mapping[str, tuple] = {}
+        self.control_sources: Mapping[str, tuple[str, str]] = {}
         self.parsed_controls: dt.ParsedControls = {}
         self.parsed_ui: dt.ParsedUserInterface = {}
+        self.incremental: bool = incremental
+        self.workers: int = workers
+        self.strict: bool = strict
+        self.runtime_hints: dict[str, dt.TypeHints] = {}
+        self.type_checker: opc.TypeCheck = opc.TypeCheck()
+        self.instrumentation: ins.Instrumentation = instrumentation or ins.Instrumentation()
+        self.cache: Union[dt.CompileCacheModel, None] = None
+        self.sources: dict[str, dt.SourceFileModel] = {}
+        self.source_data: dict[str, dt.JsonDict] = {}
+        if self.incremental:
+            self.cache = utils.CompileCacheHandler.load(compile_path)
+        if self.cache and self.cache.options != self.options:
+            self.cache = None
         self.setup()
     
+    @property
+    def options(self) -> Mapping[str, Any]:
+        return {"strict":self.strict}
+    
     def setup(self) -> NoReturn:
-        self.style_sheet: opc.StyleSheet = opc.StyleSheet(self.params.style_sheet)
+        self.style_sheet: opc.StyleSheet = self.load_style_sheet()
         custom_controls: Sequence[dt.ControlRegisterInterface] = self.add_constant_controls(
             self.parse_custom_controls(self.params.custom_controls)
         )
@@ -113,6 +145,15 @@ class Compiler:
                 map(lambda control: dt.ControlRegistryModel(**control), custom_controls)
             )
     
+    def load_style_sheet(self) -> opc.StyleSheet:
+        if self.cache and self.cache.style_sheet_hash == self.params.style_sheet_hash:
+            self.style_sheet_controls = self.cache.style_sheet_controls
+            return self.cache.style_sheet
+        
+        style_sheet: opc.StyleSheet = opc.StyleSheet(self.params.style_sheet)
+        self.style_sheet_controls = style_sheet.scan.control_types
+        return style_sheet
+    
     def parse_custom_controls(self, data: Sequence[dt.ExtensionType]) -> Sequence[dt.ControlRegisterInterface]:
         value: dt.ExtensionType
         
@@ -185,9 +226,7 @@ class Compiler:
 
         for name in c_filter(self.used_controls):
             
-            control = control_scheme[ControlRegKeys.CONTROL_TYPES][
-                control_scheme[ControlRegKeys.CONTROLS].index(name)
-            ]
+            control = control_scheme[ControlRegKeys.CONTROLS][name]
             
             control_keys.add(name)
             
@@ -201,6 +240,16 @@ class Compiler:
             )
             
             self.control_settings[name] = control[ControlRegKeys.VALID_SETTINGS]
+            self.control_stamps[name] = (
+                tuple(control[ControlRegKeys.VALID_SETTINGS]), 
+                tuple(sorted(control[ControlRegKeys.TYPE_HINTS].items()))
+            )
+            self.control_sources[name] = (
+                control[ControlRegKeys.SOURCE], control[ControlRegKeys.ATTR]
+            )
+
+    def control_stamp(self, name: str) -> Union[tuple, None]:
+        return self.control_stamps.get(name, None)
 
     def __load_controls(self) -> NoReturn:
         if not self.controls_registry:
@@ -215,59 +264,141 @@ class Compiler:
         self.control_loader(self.controls_registry)
 
     def __load_program(self) -> NoReturn:
+        model: dt.SourceFileModel
+        
+        self.used_controls.update(self.style_sheet_controls)
+        self.__load_sources()
+        for model in self.sources.values():
+            self.used_controls.update(model.used_controls)
         self.__load_controls()
-        self.update_used_controls(self.style_sheet.data)
-        self.update_used_controls(self.code[MarkupKeys.UI])
-        self.update_used_controls(self.code[MarkupKeys.CONTROLS])
-        self.__parse_imports()
+        self.__invalidate_stale_controls()
 
     def compile(self) -> NoReturn:
-        self.__load_program()
-        self.parsed_controls.update(
-            self.__parse_controls(self.code[MarkupKeys.CONTROLS])
-        )
-        self.validate_main_file()
-        self.__parse_ui(self.code[MarkupKeys.UI])
+        trace: dict[str, Any]
+        
+        with self.instrumentation.span(TraceKeys.COMPILE, "load"):
+            self.validate_main_file()
+            self.__load_program()
+        with self.instrumentation.span(TraceKeys.COMPILE, "parse") as trace:
+            self.__parse_sources()
+            trace.update(controls=len(self.parsed_controls), routes=len(self.parsed_ui))
         
         self.dependent_refs.update_cache()
         
-        self.params.save_program(
-            dt.CompiledModel(
-                self.parsed_controls, self.style_sheet,
-                self.parsed_ui, self.controls,
-                self.routes, self.control_settings, self.dependent_refs,
-                self.control_param_types, self.params.action_code, 
-                self.params.program_name
+        with self.instrumentation.span(TraceKeys.COMPILE, "save"):
+            CompileHandler.save(
+                self.params.compile_path,
+                dt.CompiledModel(
+                    self.parsed_controls, self.style_sheet,
+                    self.parsed_ui, self.controls,
+                    self.routes, self.control_settings, self.dependent_refs,
+                    self.control_param_types, self.params.action_code, 
+                    self.params.program_name, self.control_sources
+                )
+            )
+        
+        if self.incremental:
+            self.save_cache()
+    
+    def save_cache(self) -> NoReturn:
+        name: str
+        
+        utils.CompileCacheHandler.save(
+            self.params.compile_path,
+            dt.CompileCacheModel(
+                self.sources,
+                {name:self.control_stamp(name) for name in self.control_settings},
+                self.params.style_sheet_hash, self.style_sheet,
+                self.style_sheet_controls, constants.COMPILE_CACHE_VERSION,
+                self.options
             )
         )
     
-    def load_file(self, source: str) -> Sequence[dt.NamedControlDict]:
-        program: io.TextIOWrapper
-        file: Sequence[dt.NamedControlDict]
+    def is_cached(self, source: str, file_hash: str) -> bool:
+        if not self.cache or source not in self.cache.sources:
+            return False
+        return self.cache.sources[source].file_hash == file_hash
+    
+    def read_file(self, source: str) -> Union[bytes, None]:
+        program: io.BufferedReader
         path: str = os.path.join(self.imports_path, source)
         
         if not os.path.exists(path):
-            return []
+            return None
         
-        with open(path, "r") as program:
-            file = json.load(program)
-            self.validate_imports(source, file)
-            self.update_used_controls(file[MarkupKeys.CONTROLS])
-            return file[MarkupKeys.CONTROLS]
-            
-        return []
-
-    def __parse_imports(self) -> NoReturn:
+        with open(path, "rb") as program:
+            return program.read()
+    
+    def read_source(self, source: str, raw: Union[bytes, None] = None) -> dt.JsonDict:
+        file: dt.JsonDict
+        
+        if source == MAIN_SOURCE:
+            return {
+                MarkupKeys.CONTROLS:self.code[MarkupKeys.CONTROLS],
+                MarkupKeys.UI:self.code[MarkupKeys.UI]
+            }
+        
+        file = json.loads(raw if raw is not None else self.read_file(source))
+        self.validate_imports(source, file)
+        return {MarkupKeys.CONTROLS:file[MarkupKeys.CONTROLS]}
+    
+    def load_file(self, source: str, raw: Union[bytes, None]) -> Union[LoadedSource, None]:
+        file_hash: str
+        data: dt.JsonDict
+        
+        if raw is None:
+            return None
+        
+        file_hash = utils.content_hash(raw)
+        if self.is_cached(source, file_hash):
+            return self.cache.sources[source], None
+        
+        data = self.read_source(source, raw)
+        if not data[MarkupKeys.CONTROLS]:
+            return None
+        
+        return self.make_source(file_hash, data), data
+    
+    def make_source(self, file_hash: str, data: dt.JsonDict) -> dt.SourceFileModel:
+        item: Any
+        name: Any
+        scan: utils.MarkupScan
+        model: dt.SourceFileModel = dt.SourceFileModel(
+            file_hash, set(), opc.ControlDependencies()
+        )
+        
+        for item in data[MarkupKeys.CONTROLS] + data.get(MarkupKeys.UI, []):
+            scan = Tools.scan_markup(item)
+            model.used_controls.update(scan.control_types)
+            if not isinstance(item, Mapping):
+                continue
+            name = item.get(ControlKeys.VAR_NAME, item.get(ControlKeys.ROUTE, None))
+            if isinstance(name, str):
+                model.refs.setdefault(name, set()).update(scan.refs)
+        
+        return model
+    
+    def add_source(self, source: str, model: dt.SourceFileModel, data: Union[dt.JsonDict, None]) -> NoReturn:
+        self.sources[source] = model
+        if data is not None:
+            self.source_data[source] = data
+    
+    def reload_source(self, source: str) -> NoReturn:
+        data: dt.JsonDict = self.read_source(source)
+        self.add_source(
+            source, self.make_source(self.sources[source].file_hash, data), data
+        )
+    
+    def import_paths(self) -> Sequence[str]:
         import_data: Sequence[dt.ImportDict] = self.code.get(
             MarkupKeys.IMPORTS, None
         )
         data: dt.JsonDict
         source: str
         paths: Sequence[str] = []
-        json_data: Sequence[Sequence[dt.NamedControlDict]] = []
-
+        
         if not import_data:
-            return self.__load_controls()
+            return paths
 
         for data in import_data:
             source = data.get(ImportKeys.SOURCE, "")
@@ -280,38 +411,192 @@ class Compiler:
                     paths.append(os.path.join(data[ImportKeys.FROM], f"{i}.json"))
             else:
                 paths.append(f"{source}.json")
-                
-        for path in paths:
-            data = self.load_file(path)
-            if not data:
-                continue
-            json_data.append(data)
+        
+        return paths
 
-        self.__load_controls()
-        if not json_data:
+    def __load_sources(self) -> NoReturn:
+        path: str
+        data: dt.JsonDict
+        loaded: Union[LoadedSource, None]
+        paths: Sequence[str] = self.import_paths()
+        
+        for path, loaded in zip(paths, map(self.load_file, paths, map(self.read_file, paths))):
+            if loaded:
+                self.add_source(path, *loaded)
+        
+        if self.is_cached(MAIN_SOURCE, self.params.ui_hash):
+            self.add_source(MAIN_SOURCE, self.cache.sources[MAIN_SOURCE], None)
+        else:
+            data = self.read_source(MAIN_SOURCE)
+            self.add_source(
+                MAIN_SOURCE, self.make_source(self.params.ui_hash, data), data
+            )
+        
+        self.__invalidate_dependents()
+
+    def __invalidate_dependents(self) -> NoReturn:
+        name: str
+        model: dt.SourceFileModel
+        stale: Sequence[str]
+        changed: set[str] = set()
+        
+        if not self.cache:
             return
+        
+        for name, model in self.cache.sources.items():
+            if name not in self.sources or name in self.source_data:
+                changed.update(model.names)
+        
+        for name in self.source_data:
+            changed.update(self.defined_names(self.source_data[name]))
+        
+        while True:
+            stale = [
+                name for name, model in self.sources.items()
+                if name not in self.source_data and model.references & changed
+            ]
+            if not stale:
+                return
+            for name in stale:
+                changed.update(self.sources[name].names)
+                self.reload_source(name)
 
-        for data in json_data:
-            self.parsed_controls.update(self.__parse_controls(data))
+    def __invalidate_stale_controls(self) -> NoReturn:
+        name: str
+        model: dt.SourceFileModel
+        control_name: str
+        
+        if not self.cache:
+            return
+        
+        for name, model in tuple(self.sources.items()):
+            if name in self.source_data:
+                continue
+            for control_name in model.used_controls:
+                if self.cache.control_settings.get(control_name) != self.control_stamp(control_name):
+                    self.reload_source(name)
+                    break
+
+    def defined_names(self, data: dt.JsonDict) -> set[str]:
+        item: Any
+        names: set[str] = set()
+        key: str
+        
+        for key in (ControlKeys.VAR_NAME, ControlKeys.ROUTE):
+            for item in data.get(MarkupKeys.CONTROLS, []) + data.get(MarkupKeys.UI, []):
+                if isinstance(item, Mapping) and isinstance(item.get(key, None), str):
+                    names.add(item[key])
+        return names
 
-    def update_used_controls(self, data: MarkupType) -> NoReturn:
-        self.used_controls.update(
-            Tools.find_values(
-                data, ControlKeys.CONTROL_TYPE, 
-                constants.MARKUP_SPECIFIC_CONTROLS
-            )
-        )
+    def __parse_sources(self) -> NoReturn:
+        name: str
+        parsed: Union[ParsedSource, None]
+        model: dt.SourceFileModel
+        
+        for name, parsed in zip(self.source_data, self.parse_detached_sources()):
+            if parsed is None:
+                self.parse_source((self.sources[name], self.source_data[name]))
+                continue
+            model = self.sources[name]
+            model.controls, model.ui, model.dependencies = parsed
+            self.attach_controls(model)
+        for model in self.sources.values():
+            self.merge_source(model)
+    
+    def parse_detached_sources(self) -> Sequence[Union[ParsedSource, None]]:
+        executor: ProcessPoolExecutor
+        name: str
+        sources: Sequence[str] = list(self.source_data)
+        
+        if (
+            self.workers < 2 or len(sources) < 2 
+            or "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            return [None] * len(sources)
+        
+        for name in self.controls:
+            self.type_checker.prepare(self.hints(name))
+        Compiler.forked = self
+        gc.freeze()
+        try:
+            with ProcessPoolExecutor(
+                min(self.workers, len(sources)), multiprocessing.get_context("fork")
+            ) as executor:
+                return list(executor.map(parse_forked, sources))
+        finally:
+            gc.unfreeze()
+            Compiler.forked = None
+    
+    def parse_detached(self, source: str) -> Union[ParsedSource, None]:
+        model: dt.SourceFileModel = self.sources[source]
+        
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                self.parse_source((model, self.source_data[source]))
+            except Exception:
+                return None
+        if caught:
+            return None
+        
+        self.detach_controls(model)
+        return model.controls, model.ui, model.dependencies
+    
+    def detach_controls(self, model: dt.SourceFileModel) -> NoReturn:
+        self.walk_controls(model, lambda control: None)
+    
+    def attach_controls(self, model: dt.SourceFileModel) -> NoReturn:
+        self.walk_controls(model, lambda control: self.controls[control.control_name])
+    
+    @staticmethod
+    def walk_controls(
+        model: dt.SourceFileModel, resolve: Callable[[Any], Union[dt.ControlType, None]]
+    ) -> NoReturn:
+        value: Any
+        item: Any
+        control: Any
+        stack: list[Any] = list(model.controls.values())
+        settings: list[dt.ControlSettings] = [view.settings for view in model.ui.values()]
+        
+        while stack or settings:
+            while stack:
+                control = stack.pop()
+                control.control = resolve(control)
+                settings.append(control.settings)
+            for value in settings.pop().values():
+                if isinstance(value, dt.NestedControlModel):
+                    stack.append(value)
+                elif isinstance(value, list):
+                    stack.extend(
+                        item for item in value if isinstance(item, dt.NestedControlModel)
+                    )
+    
+    def parse_source(self, source: tuple[dt.SourceFileModel, dt.JsonDict]) -> dt.SourceFileModel:
+        model: dt.SourceFileModel
+        data: dt.JsonDict
+        
+        model, data = source
+        model.controls = self.__parse_controls(data[MarkupKeys.CONTROLS], model)
+        if MarkupKeys.UI in data:
+            model.ui = self.__parse_ui(data[MarkupKeys.UI], model)
+        return model
+    
+    def merge_source(self, model: dt.SourceFileModel) -> NoReturn:
+        self.parsed_controls.update(model.controls)
+        self.parsed_ui.update(model.ui)
+        self.routes.update(model.ui)
+        self.dependent_refs.merge(model.dependencies)
 
     def __parse_controls(
-        self, controls: Sequence[dt.NamedControlDict]
+        self, controls: Sequence[dt.NamedControlDict], model: dt.SourceFileModel
     ) -> dt.ParsedControls:
         parsed_data: dt.ParsedControls = {}
         data: dt.NamedControlDict
 
         for data in self.parse_iterator(controls, checks.NamedControlCheck):
-            self.dependent_refs.add_dependencies(
+            model.dependencies.add_refs(
                 data[ControlKeys.VAR_NAME], 
-                data.get(ControlKeys.SETTINGS, {})
+                model.refs.get(data[ControlKeys.VAR_NAME], ())
             )
             parsed_data[data[ControlKeys.VAR_NAME]] = self.make_control_model(data)
 
@@ -348,23 +633,71 @@ class Compiler:
 
     def make_nested_control(self, data: Mapping) -> dt.NestedControlModel:
         control_name: str = data[ControlKeys.CONTROL_TYPE]
+        settings: dt.ControlSettings = self.parse_nest(
+            self.param_filter(control_name, data)
+        )
         return dt.NestedControlModel(
             control_name=control_name,
             control=self.controls[control_name],
-            settings=self.parse_nest(
-                self.param_filter(control_name, data)
+            settings=settings,
+            plan=self.make_plan(control_name, settings)
+        )
+    
+    def hints(self, name: str) -> dt.TypeHints:
+        if name not in self.runtime_hints:
+            self.runtime_hints[name] = (
+                Tools.get_hints(self.controls[name]) 
+                if self.control_param_types.get(name) else {}
             )
+        return self.runtime_hints[name]
+    
+    def make_plan(self, name: str, settings: dt.ControlSettings) -> dt.RenderPlan:
+        key: str
+        index: Union[int, None]
+        op: str
+        value: Any
+        hints: dt.TypeHints = self.hints(name)
+        plan: dt.RenderPlan = dt.RenderPlan.from_settings(settings)
+        dynamic: set[str] = plan.keys
+        
+        for key, index, op in plan.steps:
+            value = settings[key] if index is None else settings[key][index]
+            if op == RenderOps.EVAL and isinstance(value[EventKeys.EVAL], str):
+                opc.compile_eval(value[EventKeys.EVAL])
+        literals: dt.ControlSettings = {
+            key:value for key, value in settings.items() 
+            if key in hints and key not in dynamic and key != ControlKeys.UNPACK
+        }
+        checked: dt.ControlSettings = self.type_checker.type_rectification(
+            dict(literals), hints
         )
+        
+        for key, value in literals.items():
+            if checked[key] is value:
+                continue
+            if self.strict:
+                raise errors.InvalidTypeError(key, value, hints[key], f"{name} setting")
+            warnings.warn(
+                f"{name} setting {key}, expected type of {hints[key]}, "
+                f"instead received type of {type(value)}, it was replaced with {checked[key]!r}",
+                stacklevel=2
+            )
+            settings[key] = checked[key]
+        
+        plan.checks = frozenset(dynamic.intersection(hints))
+        return plan
 
     def make_control_model(self, data: dt.NamedControlDict) -> dt.ControlModel:
         control_name: str = data[ControlKeys.CONTROL_TYPE]
+        settings: dt.ControlSettings = self.parse_nest(
+            self.param_filter(control_name, data)
+        )
         return dt.ControlModel(
             control_name=control_name,
             name=data[ControlKeys.VAR_NAME],
             control=self.controls[control_name],
-            settings=self.parse_nest(
-                self.param_filter(control_name, data)
-            )
+            settings=settings,
+            plan=self.make_plan(control_name, settings)
         )
     
     def param_filter(self, name: str, data: dt.ControlDict) -> dt.ControlSettings:
@@ -374,29 +707,32 @@ class Compiler:
             ControlKeys.UNPACK
         )
 
-    def __parse_ui(self, ui_data: Sequence[dt.RouteDict]) -> NoReturn:
+    def __parse_ui(
+        self, ui_data: Sequence[dt.RouteDict], model: dt.SourceFileModel
+    ) -> dt.ParsedUserInterface:
         route_dict: dt.RouteDict
-        data: tuple[str, dt.JsonDict]
+        view: opc.UIViews
+        parsed_ui: dt.ParsedUserInterface = {}
 
         for route_dict in self.parse_iterator(ui_data, checks.RouteCheck):
-            self.routes.add(route_dict[ControlKeys.ROUTE])
-            self.dependent_refs.add_dependencies(
+            model.dependencies.add_refs(
                 route_dict[ControlKeys.ROUTE], 
-                route_dict[ControlKeys.SETTINGS]
+                model.refs.get(route_dict[ControlKeys.ROUTE], ())
             )
-            self.parsed_ui[route_dict[ControlKeys.ROUTE]] = opc.UIViews(
+            view = opc.UIViews(
                 route_dict[ControlKeys.ROUTE], 
                 self.parse_nest(
                     self.param_filter(ControlKeys.VIEW, route_dict)
                 )
             )
+            view.plan = self.make_plan(ControlKeys.VIEW, view.settings)
+            parsed_ui[route_dict[ControlKeys.ROUTE]] = view
 
-        self.__load_controls()
+        return parsed_ui
     
     def parse_iterator(self, data: Sequence[Mapping], checker: type[checks.Checker]) -> Generator[Mapping, None, None]:
         value: Mapping
         res: Union[Mapping, None]
-        is_route: bool = checker == checks.RouteCheck
         
         for value in data:
             res = checker.correct(value, self)
@@ -405,8 +741,12 @@ class Compiler:
             yield res
 
 
+def parse_forked(source: str) -> Union[ParsedSource, None]:
+    return Compiler.forked.parse_detached(source)
+
+
 def load_program(compiled_path: str, page: ft.Page) -> ft.Page:
     return Backend(
-        CompileHandler.load(compiled_path), page
+        CompileHandler.load_shared(compiled_path), page
     ).initialize()
 
@@ -83,9 +83,11 @@ class CustomResponsiveRow(SizeAwareControl):
         vertical_alignment: ft.CrossAxisAlignment = ft.CrossAxisAlignment.START,
         max_height: int = -1,
         min_height: int = -1,
+        on_resize: Optional[Callable[[ft.ControlEvent], NoReturn]] = None,
         **kwargs,
     ) -> NoReturn:
-        super().__init__(**kwargs)
+        super().__init__(on_resize=self.__handle_canvas_resize, **kwargs)
+        self.row_resize_callback: Optional[Callable[[ft.ControlEvent], NoReturn]] = on_resize
         self.max_height: int = max_height
         self.min_height: int = min_height
         self.resize_interval: int = 10
@@ -98,9 +100,6 @@ class CustomResponsiveRow(SizeAwareControl):
         self.vertical_alignment: ft.CrossAxisAlignment = vertical_alignment
         self.alignment: ft.MainAxisAlignment = alignment
         self.run_spacing: int = run_spacing
-        self.on_resize: Optional[Callable[[ControlEvent], NoReturn]] = (
-            self.__handle_canvas_resize
-        )
 
         self.content: ft.Container = ft.Container(
             ft.Row(
@@ -117,11 +116,12 @@ class CustomResponsiveRow(SizeAwareControl):
         )
 
     def __handle_canvas_resize(self, e: ft.ControlEvent) -> NoReturn:
-        self.size = (e.width, e.height)
-        self.controls = [
-            self.change_control_width(control) for control in self.controls
-        ]
-        e.page.update()
+        control: ft.Control
+
+        for control in self.controls:
+            self.change_control_width(control)
+        if self.row_resize_callback:
+            self.row_resize_callback(e)
 
     def change_control_width(self, control: ft.Control) -> ft.Control:
         control.width = return_new_width(
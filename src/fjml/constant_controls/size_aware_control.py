@@ -38,10 +38,15 @@ class SizeAwareControl(cv.Canvas):
         return self.size[1]
 
     def __handle_canvas_resize(self, e: ControlEvent) -> NoReturn:
-        self.size = (int(e.width), int(e.height))
+        size: tuple[int, int] = (int(e.width), int(e.height))
+
+        if size == self.size:
+            return
+
+        self.size = size
+        if self.resize_callback:
+            self.resize_callback(e)
         try:
             self.update()
         except AssertionError:
             pass
-        if self.resize_callback:
-            self.resize_callback(e)
@@ -5,17 +5,47 @@ import pathlib as Path
 MODULE_PATH: str = Path.PurePath(__file__).parent
 
 OPERATION_ARGS: Final[Sequence[str]] = ["make", "registry"]
+LOOP_TEMPLATE_CACHE_SIZE: Final[int] = 128
+LOOP_WINDOW_SIZE: Final[int] = 50
+LOOP_WINDOW_THRESHOLD: Final[float] = 400.0
+LOOP_PAGE_SIZE: Final[int] = 100
+VALIDATOR_CACHE_SIZE: Final[int] = 4096
+EVAL_CACHE_SIZE: Final[int] = 1024
+TYPE_HINT_CACHE_SIZE: Final[int] = 2048
+REF_ACCESSOR_CACHE_SIZE: Final[int] = 1024
+CALL_OFFLOAD_WORKERS: Final[int] = 8
+TRACE_BUFFER_SIZE: Final[int] = 10000
+VIEW_CACHE_SIZE: Final[int] = 0
+VIEW_CACHE_BUDGET: Final[int] = 32 * 1024 * 1024
 MARKUP_SPECIFIC_CONTROLS: Final[Sequence[str]] = ["loop", "loop_index"]
+CONTROL_CHILD_ATTRS: Final[Sequence[str]] = [
+    "content", "controls", "actions", "leading", "title", "subtitle", "trailing", "label",
+    "icon", "icon_content", "selected_icon", "selected_icon_content", "prefix", "suffix",
+    "header", "middle", "cancel", "message", "badge", "placeholder", "additional_info",
+    "hint_content", "error_content", "label_content", "tab_content", "delete_icon",
+    "background", "secondary_background", "content_when_dragging", "content_feedback",
+    "appbar", "bottom_appbar", "navigation_bar", "floating_action_button", "drawer",
+    "end_drawer", "bar_leading", "bar_trailing", "view_leading", "view_trailing",
+    "left_axis", "top_axis", "right_axis", "bottom_axis", "destinations", "tabs",
+    "segments", "items", "options", "spans", "cells", "columns", "rows"
+]
 CONTROL_REGISTRY_PATH: Final[str] = str(
+    Path.PurePath(MODULE_PATH, "registry", "control_registry")
+)
+LEGACY_CONTROL_REGISTRY_PATH: Final[str] = str(
     Path.PurePath(MODULE_PATH, "registry\\control_registry")
 )
 
 NULL: Final[str] = "<NULL>"
+COMPILE_CACHE_EXTENSION: Final[str] = ".cache"
+COMPILE_CACHE_VERSION: Final[int] = 8
+PROGRAM_FILE_MAGIC: Final[bytes] = b"FJML"
+PROGRAM_FILE_VERSION: Final[int] = 3
+NESTED_CONTROL_TAG: Final[str] = "<NESTED>"
 INVALID_STYLE_KEYS: Final[Sequence[str]] = ["refs", "code_refs", "styling", "func", "route", "call", "_unpack"]
 RANGE_PARAM_LENGTH: Final[Sequence[int]] = [1, 2, 3]
 EMPTY_REGISTRY_FILE: Final[Mapping] = {
-    "Controls": [],
-    "ControlTypes": [],
+    "Controls": {},
 }
 
 FUNCTION_FILE_TEXT: Final[str] = """import flet as ft
@@ -1,5 +1,5 @@
 from __future__ import annotations
-import io, json, types, inspect, os, enum
+import io, json, types, inspect, os, enum, itertools
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass, field
 from typing import (
@@ -13,7 +13,8 @@ from typing import (
     NotRequired,
     Type,
     Sequence,
-    Mapping
+    Mapping,
+    Iterator
 )
 
 try:
@@ -25,6 +26,7 @@ import flet as ft
 
 from . import utils
 from .object_enums import *
+from .constants import LOOP_PAGE_SIZE
 
 if TYPE_CHECKING:
     from .display.renderer import Renderer
@@ -41,6 +43,7 @@ SerializedTypeHints: TypeAlias = Mapping[str, str]
 TypeHintMap: TypeAlias = Mapping[str, TypeHints]
 ControlType: TypeAlias = Union[ft.Control, enum.Enum, types.FunctionType, CallableInstance]
 ControlMap: TypeAlias = dict[str, ControlType]
+PlanStep: TypeAlias = tuple[str, Union[int, None], str]
 
 class ControlRegisterInterface(TypedDict):
     name: str
@@ -58,8 +61,7 @@ class ControlJsonScheme(TypedDict):
 
 
 class ControlRegistryJsonScheme(TypedDict):
-    Controls: Sequence[str]
-    ControlTypes: Sequence[ControlJsonScheme]
+    Controls: Mapping[str, ControlJsonScheme]
 
 
 class ControlDict(TypedDict):
@@ -109,17 +111,231 @@ class UserInterfaceDict(TypedDict):
     UI: Sequence[RouteDict]
 
 
+class PagedSource(metaclass=ABCMeta):
+    
+    @abstractmethod
+    def fetch_page(self, offset: int, limit: int) -> Sequence: ...
+    
+    @classmethod
+    def __subclasshook__(cls, subclass: type) -> bool:
+        if cls is PagedSource and callable(getattr(subclass, "fetch_page", None)):
+            return True
+        return NotImplemented
+
+
+class LoopSource:
+    
+    __slots__ = (
+        "source", "limit", "items", "offset", "iterator", "exhausted", "is_async", "is_paged"
+    )
+    
+    def __init__(self, source: Any, limit: Union[int, None] = None) -> NoReturn:
+        self.source: Any = source
+        self.limit: Union[int, None] = (
+            limit if isinstance(limit, int) and limit >= 0 else None
+        )
+        self.items: list[Any] = []
+        self.offset: int = 0
+        self.iterator: Any = None
+        self.exhausted: bool = False
+        self.is_async: bool = hasattr(source, "__aiter__")
+        self.is_paged: bool = isinstance(source, PagedSource)
+    
+    def bound(self, stop: int) -> int:
+        if self.limit is None:
+            return stop
+        return min(stop, self.limit)
+    
+    def __iter__(self) -> Iterator[Any]:
+        if self.is_paged:
+            return self.pages()
+        return itertools.islice(self.source, self.limit)
+    
+    def pages(self) -> Iterator[Any]:
+        page: Sequence
+        stop: int
+        offset: int = 0
+        
+        while True:
+            stop = self.bound(offset + LOOP_PAGE_SIZE)
+            if offset >= stop:
+                return
+            page = self.source.fetch_page(offset, stop - offset)
+            yield from page
+            if len(page) < stop - offset:
+                return
+            offset += len(page)
+    
+    def slice(self, start: int, stop: int) -> Sequence:
+        stop = self.bound(stop)
+        if start >= stop:
+            return []
+        
+        if self.is_paged:
+            return list(self.source.fetch_page(start, stop - start))
+        if utils.is_sequence_not_str(self.source):
+            return self.source[start:stop]
+        
+        if self.iterator is None:
+            self.iterator = iter(self.source)
+        while not self.exhausted and self.offset + len(self.items) < stop:
+            try:
+                self.items.append(next(self.iterator))
+            except StopIteration:
+                self.exhausted = True
+        return self.items[max(start - self.offset, 0):stop - self.offset]
+    
+    async def aslice(self, start: int, stop: int) -> Sequence:
+        if not self.is_async:
+            return self.slice(start, stop)
+        
+        stop = self.bound(stop)
+        if self.iterator is None:
+            self.iterator = self.source.__aiter__()
+        while not self.exhausted and self.offset + len(self.items) < stop:
+            try:
+                self.items.append(await self.iterator.__anext__())
+            except StopAsyncIteration:
+                self.exhausted = True
+        return self.items[max(start - self.offset, 0):stop - self.offset]
+    
+    def release(self, stop: int) -> NoReturn:
+        count: int = min(stop - self.offset, len(self.items))
+        
+        if count > 0:
+            del self.items[:count]
+            self.offset += count
+
+
+class RenderPlan:
+    
+    __slots__ = ("steps", "list_keys", "checks")
+    
+    phases: Mapping[tuple[bool, str], int] = {
+        (False, RenderOps.ROUTE):0,
+        (False, RenderOps.FUNC):0,
+        (False, RenderOps.CALL):0,
+        (False, RenderOps.EVAL):0,
+        (True, RenderOps.CALL):1,
+        (True, RenderOps.EVAL):1,
+        (False, RenderOps.NESTED):2,
+        (False, RenderOps.STYLE):3,
+        (False, RenderOps.REF):3,
+        (False, RenderOps.LOOP):3,
+        (False, RenderOps.CONTROL):3,
+        (True, RenderOps.NESTED):4,
+        (True, RenderOps.REF):4,
+        (True, RenderOps.CONTROL):4,
+    }
+    
+    def __init__(
+        self, steps: Sequence[PlanStep] = (), checks: Union[Sequence[str], None] = None
+    ) -> NoReturn:
+        self.steps: tuple[PlanStep, ...] = tuple(map(tuple, steps))
+        self.list_keys: set[str] = {
+            step[0] for step in self.steps if step[1] is not None
+        }
+        self.checks: Union[frozenset[str], None] = (
+            None if checks is None else frozenset(checks)
+        )
+    
+    def __reduce__(self) -> tuple[type, tuple]:
+        return RenderPlan, (self.steps, self.checks)
+    
+    @property
+    def keys(self) -> set[str]:
+        return {step[0] for step in self.steps}
+    
+    @classmethod
+    def phase(cls, step: PlanStep) -> int:
+        return cls.phases[(step[1] is not None, step[2])]
+    
+    @staticmethod
+    def dict_op(value: Mapping) -> Union[str, None]:
+        if EventKeys.ROUTE in value:
+            return RenderOps.ROUTE
+        if EventKeys.FUNC in value:
+            return RenderOps.FUNC
+        if EventKeys.CALL in value:
+            return RenderOps.CALL
+        if EventKeys.EVAL in value:
+            return RenderOps.EVAL
+        if RefsKeys.STYLING in value:
+            return RenderOps.STYLE
+        if RefsKeys.REFS in value or RefsKeys.CODE_REFS in value:
+            return RenderOps.REF
+        if ControlKeys.CONTROL_TYPE in value:
+            if value[ControlKeys.CONTROL_TYPE] == ControlKeys.LOOP:
+                return RenderOps.LOOP
+            return RenderOps.CONTROL
+    
+    @staticmethod
+    def item_op(value: Any) -> Union[str, None]:
+        if isinstance(value, NestedControlModel):
+            return RenderOps.NESTED
+        if not isinstance(value, Mapping):
+            return
+        if EventKeys.CALL in value:
+            return RenderOps.CALL
+        if EventKeys.EVAL in value:
+            return RenderOps.EVAL
+        if RefsKeys.REFS in value or RefsKeys.CODE_REFS in value:
+            return RenderOps.REF
+        if ControlKeys.CONTROL_TYPE in value:
+            return RenderOps.CONTROL
+    
+    @classmethod
+    def from_settings(cls, settings: ControlSettings) -> RenderPlan:
+        key: str
+        value: Any
+        i: int
+        op: Union[str, None]
+        steps: list[PlanStep] = []
+        
+        for key, value in settings.items():
+            if key == ControlKeys.UNPACK:
+                continue
+            if isinstance(value, NestedControlModel):
+                steps.append((key, None, RenderOps.NESTED))
+            elif isinstance(value, Mapping):
+                op = cls.dict_op(value)
+                if op:
+                    steps.append((key, None, op))
+            elif utils.is_sequence_not_str(value):
+                for i, item in enumerate(value):
+                    op = cls.item_op(item)
+                    if op:
+                        steps.append((key, i, op))
+        
+        return cls(sorted(steps, key=cls.phase))
+    
+    def merge(self, plan: RenderPlan, keys: Sequence[str] = ()) -> RenderPlan:
+        replaced: set[str] = plan.keys
+        return RenderPlan(
+            sorted(
+                [step for step in self.steps if step[0] not in replaced] + list(plan.steps), 
+                key=self.phase
+            ),
+            None if self.checks is None else self.checks.union(keys)
+        )
+
+
 class NestedControlModel:
     
-    __slots__ = ("control_name", "control", "settings")
+    __slots__ = ("control_name", "control", "settings", "plan")
     
     def __init__(
         self, control_name: str = "",
-        control: ControlType = None, settings: ControlSettings = {}
+        control: ControlType = None, settings: ControlSettings = {},
+        plan: Union[RenderPlan, None] = None
     ) -> NoReturn:
         self.control_name: str = control_name
         self.control: ControlType = control
         self.settings: ControlSettings = settings
+        self.plan: Union[RenderPlan, None] = plan
+    
+    def __reduce__(self) -> tuple[type, tuple]:
+        return NestedControlModel, (self.control_name, self.control, self.settings, self.plan)
     
     def build(self, parser: types.MethodType[Renderer]) -> ControlType:
         if callable(self.control):
@@ -130,7 +346,8 @@ class NestedControlModel:
                 **parser(
                     self.settings,
                     types=self.control_name,
-                    ignore=True
+                    ignore=True,
+                    plan=self.plan
                 )
             )
             
@@ -138,16 +355,21 @@ class NestedControlModel:
 
 class ControlModel:
     
-    __slots__ = ("name", "control_name", "control", "settings")
+    __slots__ = ("name", "control_name", "control", "settings", "plan")
     
     def __init__(
         self, name: str = "", control_name: str = "",
-        control: ControlType = None, settings: NestedControlModel = NestedControlModel()
+        control: ControlType = None, settings: NestedControlModel = NestedControlModel(),
+        plan: Union[RenderPlan, None] = None
     ) -> NoReturn:
         self.name: str = name
         self.control_name: str = control_name
         self.control: ControlType = control
         self.settings: NestedControlModel = settings
+        self.plan: Union[RenderPlan, None] = plan
+    
+    def __reduce__(self) -> tuple[type, tuple]:
+        return ControlModel, (self.name, self.control_name, self.control, self.settings, self.plan)
     
     def build(self, parser: types.MethodType[Renderer]) -> ControlType:
         if callable(self.control):
@@ -155,7 +377,8 @@ class ControlModel:
                 **parser(
                     self.settings,
                     types=self.control_name,
-                    ignore=True
+                    ignore=True,
+                    plan=self.plan
                 )
             )
             
@@ -176,6 +399,56 @@ UIViewMap: TypeAlias = Mapping[str, UIViews]
 
 ParsedUserInterface: TypeAlias = dict[str, UIViews]
 ParsedControls: TypeAlias = dict[str, ControlModel]
+
+
+class SourceFileModel:
+    
+    __slots__ = ("file_hash", "used_controls", "refs", "controls", "ui", "dependencies")
+    
+    def __init__(
+        self, file_hash: str, used_controls: set[str], 
+        dependencies: opc.ControlDependencies
+    ) -> NoReturn:
+        self.file_hash: str = file_hash
+        self.used_controls: set[str] = used_controls
+        self.refs: Mapping[str, set[str]] = {}
+        self.controls: ParsedControls = {}
+        self.ui: ParsedUserInterface = {}
+        self.dependencies: opc.ControlDependencies = dependencies
+    
+    @property
+    def names(self) -> set[str]:
+        return set(self.controls).union(self.ui)
+    
+    @property
+    def references(self) -> set[str]:
+        name: str
+        result: set[str] = set()
+        
+        for name in self.dependencies.get_data:
+            result.update(self.dependencies.get_data[name])
+        return result
+
+
+class CompileCacheModel:
+    __slots__ = [
+        "version", "sources", "control_settings", 
+        "style_sheet_hash", "style_sheet", "style_sheet_controls", "options"
+    ]
+    def __init__(
+        self, sources: Mapping[str, SourceFileModel], 
+        control_settings: Mapping[str, tuple],
+        style_sheet_hash: str, style_sheet: opc.StyleSheet, 
+        style_sheet_controls: set[str], version: int = 0,
+        options: Mapping[str, Any] = {}
+    ) -> NoReturn:
+        self.version: int = version
+        self.options: Mapping[str, Any] = options
+        self.sources: Mapping[str, SourceFileModel] = sources
+        self.control_settings: Mapping[str, tuple] = control_settings
+        self.style_sheet_hash: str = style_sheet_hash
+        self.style_sheet: opc.StyleSheet = style_sheet
+        self.style_sheet_controls: set[str] = style_sheet_controls
 AnyCallable: TypeAlias = Union[Callable[[...], Any], Awaitable[Callable[[...], Any]]]
 
 
@@ -183,7 +456,7 @@ class ParamGenerator:
     __slots__ = (
         "header", "program_path", "custom_controls", "style_sheet", 
         "imports_path", "ui_code", "compile_path", "program_name",
-        "extensions", "action_code"
+        "extensions", "action_code", "ui_hash", "style_sheet_hash"
     )
     
     def __init__(self, program_path: str, compile_path: str) -> NoReturn:
@@ -195,6 +468,8 @@ class ParamGenerator:
         self.imports_path: str = ""
         self.action_code: bytes
         self.ui_code: JsonDict = {}
+        self.ui_hash: str = ""
+        self.style_sheet_hash: str = ""
         self.header: Header = Header()
         if not self.program_path_check:
             raise FileNotFoundError(
@@ -209,9 +484,6 @@ class ParamGenerator:
     def join(self, end_path: str) -> str:
         return os.path.join(self.program_path, end_path)
     
-    def save_program(self, compiled_program: CompiledModel) -> NoReturn:
-        utils.CompiledFileHandler.save(self.compile_path, compiled_program)
-    
     def parse_extensions(self) -> NoReturn:
         self.header.parse_extensions(
             inspect.currentframe().f_back.f_back.f_globals
@@ -220,7 +492,8 @@ class ParamGenerator:
         self.action_code = self.header.action
     
     def setup(self) -> NoReturn:
-        file: io.TextIOWrapper
+        file: io.BufferedReader
+        raw: bytes
         ui_code_path: str = self.join("ui.json")
         
         if not os.path.exists(ui_code_path):
@@ -228,10 +501,13 @@ class ParamGenerator:
                 f'File, "ui.json" in path "{self.program_path}" does not exist'
             )
         
-        with open(ui_code_path, "r") as file:
-            self.ui_code = json.load(file)
-            self.validate_ui_format()
-            self.header.load_dict(self.ui_code[MarkupKeys.HEADER])
+        with open(ui_code_path, "rb") as file:
+            raw = file.read()
+        
+        self.ui_hash = utils.content_hash(raw)
+        self.ui_code = json.loads(raw)
+        self.validate_ui_format()
+        self.header.load_dict(self.ui_code[MarkupKeys.HEADER])
         
         self.program_name = self.header.program_name
         
@@ -243,8 +519,10 @@ class ParamGenerator:
 
         style_path: str = self.join(f"{self.header.style_sheet_name}.style.json")
         if os.path.exists(style_path):
-            with open(style_path, "r") as file:
-                self.style_sheet = json.load(file)
+            with open(style_path, "rb") as file:
+                raw = file.read()
+            self.style_sheet_hash = utils.content_hash(raw)
+            self.style_sheet = json.loads(raw)
     
     def validate_ui_format(self) -> NoReturn:
         if not isinstance(self.ui_code, Mapping):
@@ -323,14 +601,15 @@ class CompiledModel:
         "controls", "style_sheet", "ui", 
         "control_awaitable", "control_map", "routes", 
         "dependencies", "type_hints", "program_name",
-        "control_settings", "methods"
+        "control_settings", "methods", "control_sources"
     ]
     def __init__(
         self, controls: ParsedControls, style_sheet: opc.StyleSheet, 
         ui: Mapping[str, UIViews], 
         control_map: ControlMap, routes: Sequence[str], control_settings: Sequence[str],
         dependencies: opc.ControlDependencies, type_hints: TypeHintMap, 
-        methods: Type[EventContainer], program_name: str = ""
+        methods: Type[EventContainer], program_name: str = "",
+        control_sources: Mapping[str, tuple[str, str]] = {}
     ) -> NoReturn:
         
         self.methods: bytes = methods
@@ -343,6 +622,7 @@ class CompiledModel:
         self.type_hints: TypeHintMap = type_hints
         self.dependencies: opc.ControlDependencies = dependencies
         self.control_settings: Mapping[str, Sequence[str]] = control_settings
+        self.control_sources: Mapping[str, tuple[str, str]] = control_sources
 
 
 @dataclass
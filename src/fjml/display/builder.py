@@ -1,12 +1,14 @@
 from __future__ import annotations
 from functools import partial
 from types import MethodType
-import operator
+import operator, asyncio
 from typing import (
     Any,
     Callable,
     Sequence,
-    Mapping
+    Mapping,
+    Optional,
+    Union
 )
 try:
     from typing import NoReturn
@@ -21,6 +23,7 @@ from .. import (
     error_types as err, 
     data_types as dt, 
     operation_classes as opc,
+    instrumentation as ins,
     utils
 )
 
@@ -38,32 +41,36 @@ class Backend:
     def __init__(self, compiled_program: dt.CompiledModel, page: ft.Page) -> NoReturn:
         self.preserve_control_bucket: opc.PreserveControlContainer
         self.methods = compiled_program.methods
-        self.ui: Mapping[str, opc.UIViews] = compiled_program.ui
-        self.control_map: dt.ControlMap = compiled_program.control_map
-        self.controls: dt.ParsedControls = compiled_program.controls
-        self.type_hints: dt.TypeHintMap = compiled_program.type_hints
-        self.control_settings: Mapping[str, Sequence[str]] = (
+        self.ui: Mapping[str, opc.UIViews] = utils.session_overlay(compiled_program.ui)
+        self.control_map: dt.ControlMap = utils.session_overlay(compiled_program.control_map)
+        self.controls: dt.ParsedControls = utils.session_overlay(compiled_program.controls)
+        self.type_hints: dt.TypeHintMap = utils.session_overlay(compiled_program.type_hints)
+        self.control_settings: Mapping[str, Sequence[str]] = utils.session_overlay(
             compiled_program.control_settings
         )
         self.view_operations: opc.ViewOperations
         self._importer: Callable[[Backend], NoReturn]
         self._page_setup: Callable[[Backend], NoReturn]
         self.dict_to_control: Callable[[Renderer, dt.ControlDict], dt.ControlType]
-        self.eval_locals: opc.EvalLocalData = opc.EvalLocalData()
         self.page: ft.Page = page
+        self.instrumentation: ins.Instrumentation = ins.Instrumentation()
+        self.update_count: int = 0
+        self.view_cache: opc.ViewCache = opc.ViewCache()
+        self.updates: opc.UpdateCoalescer = opc.UpdateCoalescer(self.__send_update)
         self.__renderer: Renderer = None
         self.__initialize: bool = False
+        self.__route_build: Union[opc.RouteBuild, None] = None
         self.tools: utils.Utilities = utils.Utilities()
         self.style_sheet: opc.StyleSheet = compiled_program.style_sheet
         self.setup_functions: opc.SetupFunctions = opc.SetupFunctions(self)
-        self.dependency_bucket: opc.ControlDependencies = compiled_program.dependencies
+        self.dependency_bucket: opc.ControlDependencies = compiled_program.dependencies.overlay()
         self.preserve_control_bucket = opc.PreserveControlContainer()
-        self.object_bucket: opc.ObjectContainer = opc.ObjectContainer()
+        self.object_bucket: opc.ObjectContainer = opc.ObjectContainer(self.page)
         self.property_bucket: opc.PropertyContainer = opc.PropertyContainer(
             self, self.tools
         )
         self.program_name: str = compiled_program.program_name
-        self.eval_locals.mass_add({"ft":ft, "self":self})
+        self.eval_locals: opc.EvalLocalData = opc.EvalLocalData(scope={"ft":ft, "self":self})
     
     def initialize(self) -> ft.Page:
         if not self.__initialize:
@@ -107,6 +114,29 @@ class Backend:
             raise err.UndefinedMethodError("_importer")
     
     def update(self) -> NoReturn:
+        self.updates.request()
+    
+    def batch(self) -> opc.UpdateCoalescer:
+        return self.updates
+    
+    def scoped_update(self, controls: Sequence[ft.Control]) -> NoReturn:
+        if not controls:
+            return
+        if self.updates.active:
+            return self.update()
+        
+        self.update_count += 1
+        self.page.update(*controls)
+    
+    def rebuild_control(self, var_name: str) -> Union[Sequence[str], asyncio.Future]:
+        loop: Optional[asyncio.AbstractEventLoop] = opc.CallableObject.running_loop()
+        
+        if loop is None:
+            return self.view_operations.rebuild(var_name)
+        return loop.run_in_executor(None, self.view_operations.rebuild, var_name)
+    
+    def __send_update(self) -> NoReturn:
+        self.update_count += 1
         self.page.update()
     
     def change_route(self, e: ft.ControlEvent, route: str) -> NoReturn:
@@ -120,27 +150,75 @@ class Backend:
     def get_routes(self) -> Sequence[str]:
         return list(map(operator.attrgetter("route"), self.page.views))
     
-    def __add_make_view(self, route: str) -> NoReturn:
+    def __add_view(self, route: str, view: ft.View) -> NoReturn:
         if route in self.get_routes:
             del self.page.views[self.get_routes.index(route)]
-            
-        self.view_operations.add_view(
-            self.view_operations.make_view(self.ui[route])
-        )
-        self.update()
+        
+        self.view_operations.add_view(view)
     
-    def __valid_route(self, route: str) -> bool:
-        return self.get_current_route == route and route != "/"
+    def __build_views(
+        self, build: opc.RouteBuild
+    ) -> tuple[Sequence[tuple[str, ft.View]], Mapping[str, Any]]:
+        route: str
+        staged: dict[str, Any] = {}
+        routes: Sequence[str] = [
+            "/", *filter(lambda route: route == build.route and route != "/", self.ui)
+        ]
+        
+        with self.__renderer.lock:
+            build.check()
+            self.__renderer.route_build = build
+            self.__renderer.staged = staged
+            try:
+                return [
+                    (route, self.view_operations.make_view(self.ui[route])) 
+                    for route in routes
+                ], staged
+            except err.RouteBuildCancelledError:
+                self.__renderer.reset()
+                raise
+            finally:
+                self.__renderer.route_build = None
+                self.__renderer.staged = None
     
     async def __create_ui(self, e: ft.RouteChangeEvent) -> NoReturn:
         route: str
+        view: ft.View
+        trace: dict[str, Any]
+        views: Sequence[tuple[str, ft.View]]
+        controls: Mapping[str, Any]
+        build: opc.RouteBuild = opc.RouteBuild(self.get_current_route)
+        updates: int = self.update_count
+        hits: int = self.view_cache.hits
         
         if not self.__initialize:
-            raise InitializationError()
+            raise err.InitializationError()
         
-        self.__add_make_view("/")
-        for route in filter(self.__valid_route, self.ui):
-            self.__add_make_view(route)
+        if self.__route_build is not None:
+            self.__route_build.cancel()
+        self.__route_build = build
+        
+        with self.instrumentation.span(TraceKeys.ROUTE, build.route) as trace:
+            try:
+                views, controls = await asyncio.get_running_loop().run_in_executor(
+                    None, self.__build_views, build
+                )
+            except err.RouteBuildCancelledError:
+                views, controls = [], {}
+            
+            if build.cancelled:
+                trace.update(cancelled=True)
+                return
+            
+            with self.batch():
+                self.mass_assign(controls)
+                for route, view in views:
+                    self.__add_view(route, view)
+                self.update()
+            trace.update(
+                views=len(views), cached=self.view_cache.hits - hits, 
+                updates=self.update_count - updates
+            )
     
     def get_attr(self, attr_name: str, default: Any = None) -> Any:
         return getattr(self, attr_name, default)
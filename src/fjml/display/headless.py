@@ -0,0 +1,142 @@
+from __future__ import annotations
+import asyncio, inspect
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Callable,
+    Awaitable,
+    Sequence,
+    Mapping,
+    TypeAlias,
+    Union
+)
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+import flet as ft
+
+
+ControlTree: TypeAlias = Mapping[str, Any]
+
+
+class HeadlessStorage(dict):
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return super().get(key, default)
+
+    def set(self, key: str, value: Any) -> NoReturn:
+        self[key] = value
+
+    def contains_key(self, key: str) -> bool:
+        return key in self
+
+    def remove(self, key: str) -> NoReturn:
+        self.pop(key, None)
+
+    def get_keys(self, key_prefix: str = "") -> Sequence[str]:
+        return [key for key in self if key.startswith(key_prefix)]
+
+
+class HeadlessPage:
+
+    def __init__(self, route: str = "/") -> NoReturn:
+        self.route: str = route
+        self.views: list[ft.View] = []
+        self.title: str = ""
+        self.theme: Any = None
+        self.dark_theme: Any = None
+        self.theme_mode: Any = None
+        self.bgcolor: Any = None
+        self.fonts: Any = None
+        self.horizontal_alignment: Any = None
+        self.vertical_alignment: Any = None
+        self.on_route_change: Union[Callable, None] = None
+        self.on_view_pop: Union[Callable, None] = None
+        self.client_storage: HeadlessStorage = HeadlessStorage()
+        self.session: HeadlessStorage = HeadlessStorage()
+        self.update_count: int = 0
+        self.route_history: list[str] = []
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+
+    def update(self, *controls: ft.Control) -> NoReturn:
+        self.update_count += 1
+
+    def go(self, route: str, skip_route_change_event: bool = False, **kwargs: Any) -> NoReturn:
+        self.route = route
+        self.route_history.append(route)
+        if not skip_route_change_event:
+            self.dispatch(self.on_route_change, ft.RouteChangeEvent(route))
+        self.update()
+
+    def pop_view(self) -> NoReturn:
+        if self.views:
+            self.dispatch(self.on_view_pop, ft.ViewPopEvent(self.views[-1]))
+
+    def run_task(self, handler: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Future:
+        return self.run(handler(*args, **kwargs))
+
+    def dispatch(self, handler: Union[Callable, None], event: ft.ControlEvent) -> Any:
+        if handler is None:
+            return
+        return self.run(handler(event))
+
+    def run(self, result: Any) -> Union[Future, asyncio.Task]:
+        future: Future = Future()
+
+        if not inspect.isawaitable(result):
+            future.set_result(result)
+            return future
+
+        try:
+            if asyncio.get_running_loop() is self.loop:
+                return self.loop.create_task(result)
+        except RuntimeError:
+            pass
+        
+        if self.loop.is_running():
+            return asyncio.run_coroutine_threadsafe(result, self.loop)
+
+        future.set_result(self.loop.run_until_complete(result))
+        return future
+
+    def join(self) -> NoReturn:
+        pending: set[asyncio.Task] = asyncio.all_tasks(self.loop)
+        
+        while pending:
+            self.loop.run_until_complete(asyncio.gather(*pending))
+            pending = {task for task in asyncio.all_tasks(self.loop) if not task.done()}
+
+    def close(self) -> NoReturn:
+        self.loop.close()
+
+    @staticmethod
+    def control_tree(control: ft.Control) -> ControlTree:
+        child: ft.Control
+
+        return {
+            "control":type(control).__name__,
+            "children":[
+                HeadlessPage.control_tree(child) for child in control._get_children()
+                if isinstance(child, ft.Control)
+            ]
+        }
+
+    @property
+    def tree(self) -> Sequence[ControlTree]:
+        return [self.control_tree(view) for view in self.views]
+
+    @property
+    def control_count(self) -> int:
+        stack: list[ft.Control] = list(self.views)
+        count: int = 0
+
+        while stack:
+            count += 1
+            stack.extend(
+                child for child in stack.pop()._get_children()
+                if isinstance(child, ft.Control)
+            )
+        return count
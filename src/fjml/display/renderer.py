@@ -1,6 +1,7 @@
 from __future__ import annotations
+import threading
 from functools import partial
-from copy import deepcopy
+from collections import OrderedDict
 from typing import (
     Any,
     Union,
@@ -9,6 +10,7 @@ from typing import (
     Mapping,
     TypeAlias,
     TYPE_CHECKING,
+    Iterable,
     Iterator
 )
 
@@ -23,6 +25,7 @@ from ..object_enums import *
 from .. import (
     data_types as dt,
     operation_classes as opc,
+    instrumentation as ins,
     utils,
     constants
 )
@@ -33,17 +36,7 @@ Tools: utils.Utilities = utils.Utilities()
 NullOrStr: tuple[type, type] = (str, type(None))
 ParsedLoopItem: TypeAlias = Union[ft.Control, dt.ControlDict]
 is_null_string: Callable[[Any], bool] = lambda obj: isinstance(obj, NullOrStr)
-loop_refs_check: Callable[[Mapping], str] = partial(
-    Tools.multi_dict_get, items=(
-        RefsKeys.REFS, RefsKeys.CODE_REFS
-    )
-)
-
-
 
-class ReferenceBooleanParams:
-    STYLING: tuple[str, ...] = (RefsKeys.REFS, RefsKeys.CODE_REFS, RefsKeys.STYLING)
-    NO_STYLING: tuple[str, ...] = (RefsKeys.REFS, RefsKeys.CODE_REFS)
 
 
 class Renderer:
@@ -56,15 +49,18 @@ class Renderer:
         "control_names", "depth_count", "__loop_depth",
         "__loop_values", "unpack_function",
         "control_model_filter", "control_model_map",
-        "ref_bool_params", "sanitizer", "list_parse_filter_func"
+        "sanitizer", "plan_ops", "loop_templates",
+        "bindings", "last_settings", "instrumentation",
+        "route_build", "lock", "runtime_refs", "staged"
     )
     
     def __init__(self, backend: Backend) -> NoReturn:
         self.control_model_filter: Callable[[str], bool]
         self.control_model_map: Callable[[str], tuple[str, dt.ControlModel]]
-        self.type_check: Callable[[dt.ControlSettings, dt.TypeHints], dt.ControlSettings]
+        self.type_check: Callable[
+            [dt.ControlSettings, dt.TypeHints, Union[frozenset[str], None]], dt.ControlSettings
+        ]
         self.unpack_function: Callable[[dt.ControlSettings], dt.ControlSettings]
-        self.ref_bool_params: ReferenceBooleanParams = ReferenceBooleanParams()
         self.backend: Backend = backend
         self.depth_count: int = 0
         self.__loop_depth: int = 0
@@ -74,27 +70,64 @@ class Renderer:
         self.has_attr: Callable[[Backend, str], bool] = self.backend.has_attr
         self.control_loader: opc.ControlLoader = opc.ControlLoader(self.backend)
         self.tools: utils.Utilities = self.backend.tools
+        self.instrumentation: ins.Instrumentation = self.backend.instrumentation
         self.get_ref: Callable[[Mapping], Any] = opc.Reference(self).get_ref
         self.event_parsers: opc.EventParser = opc.EventParser(self)
         self.use_bucket: Sequence[str] = []
         self.control_names: Sequence[str] = []
         self.unpack_function = opc.Unpacker(self).unpack
         self.type_check = opc.TypeCheck().type_rectification
-        self.list_parse_filter_func: Callable[[tuple[int, Any]], bool] = lambda x: (
-            isinstance(x[1], (Mapping, dt.NestedControlModel))
-        )
+        self.bindings: list[Union[opc.LoopWindow, opc.DeferredValue]] = []
+        self.last_settings: dt.ControlSettings = {}
+        self.route_build: Union[opc.RouteBuild, None] = None
+        self.runtime_refs: bool = False
+        self.staged: Union[dict[str, Any], None] = None
+        self.lock: threading.RLock = threading.RLock()
+        self.loop_templates: OrderedDict[int, tuple[dt.LoopDict, opc.LoopTemplate]] = OrderedDict()
+        self.plan_ops: Mapping[str, Callable[[Union[Sequence, Mapping], Union[int, str], Any], NoReturn]] = {
+            RenderOps.ROUTE:lambda container, key, data: self.event_parsers.route(key, data, container),
+            RenderOps.FUNC:lambda container, key, data: self.event_parsers.func(key, data, container),
+            RenderOps.CALL:lambda container, key, data: self.event_parsers.call(key, data, container),
+            RenderOps.EVAL:lambda container, key, data: self.event_parsers.eval(key, data, container),
+            RenderOps.NESTED:self.build_nested,
+            RenderOps.STYLE:self.apply_style,
+            RenderOps.REF:self.call_references,
+            RenderOps.LOOP:self.build_loop,
+            RenderOps.CONTROL:self.settings_to_controls
+        }
     
     @property
     def loop_values(self) -> Sequence:
         return self.__loop_values
     
+    def reset(self) -> NoReturn:
+        self.depth_count = 0
+        self.__loop_depth = 0
+        self.__loop_values = []
+        self.bindings.clear()
+        self.last_settings = {}
+        self.staged = None
+    
+    def get_control(self, var_name: str) -> Any:
+        staged: Union[dict[str, Any], None] = self.staged
+        
+        if staged is not None and var_name in staged:
+            return staged[var_name]
+        return self.get_attr(var_name)
+    
+    def set_control(self, var_name: str, value: Any = None) -> NoReturn:
+        if self.staged is not None:
+            self.staged[var_name] = value
+            return
+        self.set_attr(var_name, value)
+    
     def get_dependent_controls(self) -> Sequence[str]:
         x: str
-        data: Sequence[str] = self.use_bucket
+        data: Sequence[str] = list(self.use_bucket)
         data.extend(self.backend.preserve_control_bucket.data)
         
         for x in filter(lambda x: x not in data, self.backend.controls):
-            self.set_attr(x)
+            self.set_control(x)
             
         return data
     
@@ -118,29 +151,18 @@ class Renderer:
         var_name: str
         
         for var_name, control in self.control_gen():
-            self.set_attr(
-                var_name, control.build(
-                    self.settings_object_parsers
-                )
-            )
+            self.set_control(var_name, self.build_model(control))
 
     def ui_parser(self, control: dt.ControlDict) -> dt.ControlType:
-        self.register_controls(control)
-        self.backend.preserve_control_bucket.group_add(
-            self.tools.find_values(
-                control.get(ControlKeys.SETTINGS, {}), 
-                RefsKeys.REFS
-            )
-        )
+        scan: utils.MarkupScan = self.tools.scan_markup(control)
+        
+        self.control_loader.add_controls(scan.control_types)
+        self.backend.preserve_control_bucket.group_add(scan.refs)
         return self.create_control(control)
 
     def register_controls(self, control: dt.ControlDict) -> NoReturn:
         self.control_loader.add_controls(
-            self.tools.find_values(
-                json_obj=control, 
-                key=ControlKeys.CONTROL_TYPE, 
-                ignore=constants.MARKUP_SPECIFIC_CONTROLS
-            )
+            self.tools.scan_markup(control).control_types
         )
 
     def loop_init(self, data: dt.LoopDict) -> NoReturn:
@@ -153,65 +175,141 @@ class Renderer:
             self.__loop_values = [None for _ in range(depth)]
             self.depth_count = 0
 
-    def run_ui_loop(self, data: dt.LoopDict) -> Sequence[ParsedLoopItem]:
-        control_list: Sequence[ParsedLoopItem] = []
-        control: Mapping
-        call_name: Union[str, None]
-        content: Union[str, None]
-        value: Any
-        reference: Any
+    def run_ui_loop(self, data: dt.LoopDict, key: str = "controls") -> Sequence[ParsedLoopItem]:
+        control_list: Sequence[ParsedLoopItem]
         
         self.loop_init(data)
         if not self.__loop_depth:
-            return control_list
+            return []
         
         self.depth_count += 1
-        iterator: Sequence = self.tools.process_loop_iterator(
-            self, data[LoopKeys.ITERATOR]
+        control_list = self.loop_items(data, key)
+        self.depth_count -= 1
+        
+        return control_list
+    
+    def loop_template(self, data: dt.LoopDict) -> opc.LoopTemplate:
+        key: int = id(data)
+        
+        if key in self.loop_templates:
+            self.loop_templates.move_to_end(key)
+            return self.loop_templates[key][1]
+        
+        self.loop_templates[key] = (data, opc.LoopTemplate(data[LoopKeys.CONTROL]))
+        if len(self.loop_templates) > constants.LOOP_TEMPLATE_CACHE_SIZE:
+            self.loop_templates.popitem(last=False)
+        return self.loop_templates[key][1]
+    
+    def loop_items(self, data: dt.LoopDict, key: str = "controls") -> Sequence[ParsedLoopItem]:
+        window: opc.LoopWindow
+        template: opc.LoopTemplate = self.loop_template(data)
+        source: dt.LoopSource = dt.LoopSource(
+            self.tools.process_loop_iterator(self, data[LoopKeys.ITERATOR]),
+            data.get(LoopKeys.MAX_ITEMS, None)
+        )
+        
+        if not template.is_valid:
+            return []
+        
+        if not data.get(LoopKeys.WINDOW, None) and not source.is_async:
+            return self.iterate_loop(template, source)
+        
+        window = opc.LoopWindow(
+            self, template, source, key, data.get(LoopKeys.WINDOW, None),
+            self.depth_count, self.__loop_depth, self.__loop_values
         )
+        self.bindings.append(window)
+        if source.is_async:
+            self.backend.page.run_task(window.load)
+        return window.controls
+    
+    def iterate_loop(self, template: opc.LoopTemplate, iterator: Iterable) -> Sequence[ParsedLoopItem]:
+        control_list: Sequence[ParsedLoopItem] = []
+        control: dt.ControlDict
+        value: Any
+        reference: Any
+        
         for value in iterator:
-            control = deepcopy(data[LoopKeys.CONTROL])
             self.__loop_values[self.depth_count - 1] = value
+            control = template.fill(self.depth_count, self.__loop_values)
             
-            if loop_refs_check(control):
-                reference = self.tools.parse_reference(self, control)
+            if template.is_reference:
+                reference = self.get_ref(control)
                 if not reference: 
                     continue
                 control_list.append(reference)
                 continue
             
-            content = control.get(ControlKeys.CONTROL_TYPE, None)
-            call_name = control.get(EventKeys.CALL, None)
-            if not content and not call_name:
-                return []
-            
-            if content == ControlKeys.LOOP:
-                return []
-            
             control_list.append(
-                self.generate_list_control(
-                    call_name, content, control
+                self.defer(
+                    control_list, len(control_list),
+                    self.generate_list_control(
+                        template.call_name, template.content, control
+                    )
                 )
             )
 
         return control_list
+    
+    def window_items(self, window: opc.LoopWindow, values: Sequence) -> Sequence[ParsedLoopItem]:
+        state: tuple[int, int, Sequence]
+        windows: int
+        
+        with self.lock:
+            state = (self.depth_count, self.__loop_depth, self.__loop_values)
+            windows = len(self.bindings)
+            self.depth_count = window.depth_count
+            self.__loop_depth = window.loop_depth
+            self.__loop_values = list(window.loop_values)
+            try:
+                return self.iterate_loop(window.template, values)
+            finally:
+                self.depth_count, self.__loop_depth, self.__loop_values = state
+                del self.bindings[windows:]
+    
+    def bind_pending(self, control: dt.ControlType, start: int) -> dt.ControlType:
+        if len(self.bindings) > start:
+            self.bindings[start:] = [
+                binding for binding in self.bindings[start:] 
+                if not binding.bind(control, self.last_settings)
+            ]
+        return control
+    
+    def defer(
+        self, container: Union[Sequence, Mapping], key: Union[int, str], value: Any
+    ) -> Any:
+        if not isinstance(value, opc.DeferredValue):
+            return value
+        
+        self.bindings.append(value.target(container, key))
+        if isinstance(container, Mapping):
+            return None
+        return value
+    
+    def build_model(
+        self, model: Union[dt.NestedControlModel, dt.ControlModel, opc.UIViews]
+    ) -> dt.ControlType:
+        windows: int = len(self.bindings)
+        
+        if self.route_build is not None:
+            self.route_build.check()
+        if self.instrumentation.enabled:
+            return self.bind_pending(
+                self.instrumentation.build(
+                    getattr(model, "control_name", ControlKeys.VIEW), 
+                    getattr(model, "name", ""), model.build, self.settings_object_parsers
+                ), windows
+            )
+        return self.bind_pending(model.build(self.settings_object_parsers), windows)
 
     def generate_list_control(self, call_name: str, content: str, control: dt.JsonDict) -> ParsedLoopItem:
         if content:
-            control[ControlKeys.SETTINGS] = self.tools.search_and_sanitize(
-                control.get(ControlKeys.SETTINGS, {}),
-                self.depth_count, self.__loop_values
-            )
-                
             return self.create_control(control)
         
+        self.runtime_refs = True
         return self.backend.object_bucket.call_object(
             call_name, self.settings_object_parsers(
-                self.tools.search_and_sanitize(
-                    control.get(ControlKeys.SETTINGS, {}),
-                    self.depth_count, self.__loop_values
-                ), 
-                ignore=True
+                control.get(ControlKeys.SETTINGS, {}), ignore=True
             )
         )
 
@@ -220,24 +318,38 @@ class Renderer:
             code[ControlKeys.CONTROL_TYPE]
         ]
         
+        windows: int = len(self.bindings)
+        build: Callable[[Callable[..., dt.ControlSettings]], dt.ControlType]
+        
+        if self.route_build is not None:
+            self.route_build.check()
         if not callable(control):
             return control
         
-        return control(
-            **self.settings_object_parsers(
+        build = lambda parser: control(
+            **parser(
                 code.get(ControlKeys.SETTINGS, {}), 
                 self.backend.control_settings[code[ControlKeys.CONTROL_TYPE]],
                 code[ControlKeys.CONTROL_TYPE]
             )
         )
+        if self.instrumentation.enabled:
+            return self.bind_pending(
+                self.instrumentation.build(
+                    code[ControlKeys.CONTROL_TYPE], code.get(ControlKeys.VAR_NAME, ""), 
+                    build, self.settings_object_parsers
+                ), windows
+            )
+        return self.bind_pending(build(self.settings_object_parsers), windows)
     
     def settings_object_parsers(
         self, settings: dt.ControlSettings, valid_settings: Sequence[str] = [], 
-        types: str = "", ignore: bool = False
+        types: str = "", ignore: bool = False, plan: Union[dt.RenderPlan, None] = None
     ) -> dt.ControlSettings:
-        data: Union[Mapping, dt.ControlDict, dt.NestedControlModel]
         key: str
-        i: int
+        index: Union[int, None]
+        op: str
+        unpacked: dt.ControlSettings
         
         if not settings: 
             return {}
@@ -246,38 +358,49 @@ class Renderer:
             settings = self.tools.valid_param_filter(
                 settings, valid_settings, ControlKeys.UNPACK
             )
+            plan = None
+        else:
+            settings = dict(settings)
         
         if not settings:
             return {}
         
-        settings = self.events(
-            self.unpack_function(
-                settings
-            )
-        )
+        if plan is None:
+            plan = dt.RenderPlan.from_settings(settings)
+        
+        if ControlKeys.UNPACK in settings:
+            unpacked = self.unpack_function(settings)
+            plan = plan.merge(dt.RenderPlan.from_settings(unpacked), unpacked)
+        
+        for key in plan.list_keys:
+            settings[key] = list(settings[key])
+        
+        for key, index, op in plan.steps:
+            if index is None:
+                self.plan_ops[op](settings, key, settings[key])
+            else:
+                self.plan_ops[op](settings[key], index, settings[key][index])
         
-        for key, data in filter(lambda x: isinstance(x[1], dt.NestedControlModel), settings.items()):
-            settings[key] = data.build(self.settings_object_parsers)
-        
-        for key in self.tools.get_keys_with_dict(settings):
-            if self.tools.mass_any_contains(self.ref_bool_params.STYLING, settings[key]):
-                self.call_references(settings, key, settings[key], True)
-            elif ControlKeys.CONTROL_TYPE in settings[key]:
-                self.settings_to_controls(settings, key, settings[key], True)
-        
-        for key in self.tools.get_keys_with_list(settings):
-            for i, data in filter(self.list_parse_filter_func, enumerate(settings[key])):
-                if isinstance(data, dt.NestedControlModel):
-                    settings[key][i] = data.build(self.settings_object_parsers)
-                elif self.tools.mass_any_contains(self.ref_bool_params.NO_STYLING, data):
-                    self.call_references(settings[key], i, data)
-                elif ControlKeys.CONTROL_TYPE in data:
-                    self.settings_to_controls(settings[key], i, data)
-        
-        return self.type_check(
+        self.last_settings = self.type_check(
             settings, 
-            self.backend.type_hints.get(types, {})
+            self.backend.type_hints.get(types, {}),
+            plan.checks
         )
+        return self.last_settings
+    
+    def build_nested(
+        self, container: Union[Sequence, Mapping], 
+        key: Union[int, str], data: dt.NestedControlModel
+    ) -> NoReturn:
+        container[key] = self.build_model(data)
+    
+    def apply_style(self, container: Mapping, key: str, data: Mapping) -> NoReturn:
+        container[key] = self.backend.style_sheet.get_style(
+            data[RefsKeys.STYLING]
+        )
+    
+    def build_loop(self, container: Mapping, key: str, data: dt.LoopDict) -> NoReturn:
+        self.settings_to_controls(container, key, data, True)
 
     def call_references(
         self,
@@ -308,9 +431,9 @@ class Renderer:
         
         if use_loop:
             if data[ControlKeys.CONTROL_TYPE] == ControlKeys.LOOP:
-                container[key] = self.run_ui_loop(data)
-                self.depth_count = 0
-                self.__loop_values.clear()
+                container[key] = self.run_ui_loop(data, key)
+                if not self.depth_count:
+                    self.__loop_values.clear()
                 return
         
         new_data: Any = self.try_get_attribute(data)
@@ -320,30 +443,6 @@ class Renderer:
 
         container[key] = self.create_control(data)
 
-    def events(self, settings: dt.ControlSettings) -> dt.ControlSettings:
-        key: str
-        data: Mapping
-        i: int
-        
-        for key in self.tools.get_keys_with_dict(settings):
-            if EventKeys.ROUTE in settings[key]:
-                self.event_parsers.route(key, settings[key], settings)
-            elif EventKeys.FUNC in settings[key]:
-                self.event_parsers.func(key, settings[key], settings)
-            elif EventKeys.CALL in settings[key]:
-                self.event_parsers.call(key, settings[key], settings)
-            elif EventKeys.EVAL in settings[key]:
-                self.event_parsers.eval(key, settings[key], settings)
-        
-        for key in self.tools.get_keys_with_list(settings):
-            for i, data in filter(lambda x: isinstance(x[1], Mapping), enumerate(settings[key])):
-                if EventKeys.CALL in data:
-                    self.event_parsers.call(i, data, settings[key])
-                elif EventKeys.EVAL in data:
-                    self.event_parsers.eval(i, data, settings[key])
-
-        return settings
-    
     def try_get_attribute(self, data: dt.JsonDict) -> Any:
         if ControlKeys.ATTR in data:
             return getattr(
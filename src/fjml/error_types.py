@@ -1,4 +1,4 @@
-from typing import Literal, Any
+from typing import Literal, Any, Sequence
 
 try:
     from typing import NoReturn
@@ -47,6 +47,20 @@ class InitializationError(Exception):
         super().__init__(f"Backend was not Initialized.")
 
 
+class CyclicReferenceError(Exception):
+    __module__: str = "builtins"
+
+    def __init__(self, cycle: Sequence[str]) -> NoReturn:
+        super().__init__(f"Controls reference each other in a cycle, {' -> '.join(cycle)}.")
+
+
+class RouteBuildCancelledError(Exception):
+    __module__: str = "builtins"
+
+    def __init__(self, route: str) -> NoReturn:
+        super().__init__(f"Build of route, {route}, was cancelled by a newer route change.")
+
+
 class MissingKeyError(Exception):
     __module__: str = "builtins"
 
@@ -70,6 +84,23 @@ class RegistryFileNotFoundError(Exception):
         super().__init__("Registry file is missing or misplaced")
 
 
+class InvalidProgramFileError(Exception):
+    __module__: str = "builtins"
+
+    def __init__(self, reason: str) -> NoReturn:
+        super().__init__(f"Compiled program file is invalid, {reason}.")
+
+
+class UnimportableObjectError(Exception):
+    __module__: str = "builtins"
+
+    def __init__(self, module: str, name: str) -> NoReturn:
+        super().__init__(
+            f"Object, {module}.{name}, cannot be imported by a compiled program, "
+            "define it at the top level of an importable module."
+        )
+
+
 class InvalidKeyError(Exception):
     __module__: str = "builtins"
 
@@ -0,0 +1,265 @@
+from __future__ import annotations
+import io, os, json, time, inspect, functools, threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Sequence,
+    Mapping,
+    Union
+)
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+from .object_enums import *
+from .constants import TRACE_BUFFER_SIZE
+
+
+class TraceRecord:
+    
+    __slots__ = ("category", "name", "start", "duration", "thread", "data")
+    
+    def __init__(
+        self, category: str, name: str, start: float, duration: float, 
+        thread: int, data: Mapping[str, Any]
+    ) -> NoReturn:
+        self.category: str = category
+        self.name: str = name
+        self.start: float = start
+        self.duration: float = duration
+        self.thread: int = thread
+        self.data: Mapping[str, Any] = data
+    
+    @property
+    def to_dict(self) -> Mapping[str, Any]:
+        return {
+            "category":self.category,
+            "name":self.name,
+            "start":self.start,
+            "duration":self.duration,
+            "thread":self.thread,
+            "data":dict(self.data)
+        }
+
+
+class TraceSink(ABC):
+    
+    __slots__ = ()
+    
+    @abstractmethod
+    def write(self, record: TraceRecord) -> NoReturn:
+        ...
+    
+    def close(self) -> NoReturn:
+        ...
+
+
+class RingBufferSink(TraceSink):
+    
+    __slots__ = ("records",)
+    
+    def __init__(self, size: int = TRACE_BUFFER_SIZE) -> NoReturn:
+        self.records: deque[TraceRecord] = deque(maxlen=max(size, 1))
+    
+    def write(self, record: TraceRecord) -> NoReturn:
+        self.records.append(record)
+    
+    def select(self, category: Union[str, None] = None) -> Sequence[TraceRecord]:
+        record: TraceRecord
+        
+        return [
+            record for record in tuple(self.records) 
+            if category is None or record.category == category
+        ]
+    
+    def clear(self) -> NoReturn:
+        self.records.clear()
+
+
+class JsonLinesSink(TraceSink):
+    
+    __slots__ = ("path", "file")
+    
+    def __init__(self, path: str) -> NoReturn:
+        self.path: str = path
+        self.file: io.TextIOWrapper = open(path, "a", encoding="utf8")
+    
+    def write(self, record: TraceRecord) -> NoReturn:
+        self.file.write(json.dumps(record.to_dict, default=str) + "\n")
+    
+    def close(self) -> NoReturn:
+        self.file.close()
+
+
+class ChromeTraceSink(TraceSink):
+    
+    __slots__ = ("path", "file", "pid", "separator")
+    
+    def __init__(self, path: str) -> NoReturn:
+        self.path: str = path
+        self.pid: int = os.getpid()
+        self.separator: str = ""
+        self.file: io.TextIOWrapper = open(path, "w", encoding="utf8")
+        self.file.write("[\n")
+    
+    def write(self, record: TraceRecord) -> NoReturn:
+        self.file.write(
+            self.separator + json.dumps(
+                {
+                    "name":record.name,
+                    "cat":record.category,
+                    "ph":"X",
+                    "ts":record.start * 1e6,
+                    "dur":record.duration * 1e6,
+                    "pid":self.pid,
+                    "tid":record.thread,
+                    "args":record.data
+                }, default=str
+            )
+        )
+        self.separator = ",\n"
+    
+    def close(self) -> NoReturn:
+        if self.file.closed:
+            return
+        self.file.write("\n]\n")
+        self.file.close()
+
+
+class TraceSpan:
+    
+    __slots__ = ("instrumentation", "category", "name", "data", "start")
+    
+    def __init__(
+        self, instrumentation: Union[Instrumentation, None], category: str, 
+        name: str, data: Mapping[str, Any]
+    ) -> NoReturn:
+        self.instrumentation: Union[Instrumentation, None] = instrumentation
+        self.category: str = category
+        self.name: str = name
+        self.data: dict[str, Any] = dict(data)
+        self.start: float = 0.0
+    
+    def __enter__(self) -> dict[str, Any]:
+        self.start = time.perf_counter()
+        return self.data
+    
+    def __exit__(self, *args: Any) -> NoReturn:
+        if self.instrumentation is not None:
+            self.instrumentation.record(
+                self.category, self.name, self.start, 
+                time.perf_counter() - self.start, **self.data
+            )
+
+
+class Instrumentation:
+    
+    __slots__ = ("sinks", "enabled", "__lock")
+    
+    def __init__(self, sinks: Iterable[TraceSink] = ()) -> NoReturn:
+        self.sinks: list[TraceSink] = list(sinks)
+        self.enabled: bool = bool(self.sinks)
+        self.__lock: threading.Lock = threading.Lock()
+    
+    def add_sink(self, sink: TraceSink) -> TraceSink:
+        with self.__lock:
+            self.sinks.append(sink)
+            self.enabled = True
+        return sink
+    
+    def remove_sink(self, sink: TraceSink) -> NoReturn:
+        with self.__lock:
+            if sink in self.sinks:
+                self.sinks.remove(sink)
+            self.enabled = bool(self.sinks)
+    
+    def close(self) -> NoReturn:
+        sink: TraceSink
+        
+        with self.__lock:
+            for sink in self.sinks:
+                sink.close()
+            self.sinks.clear()
+            self.enabled = False
+    
+    def record(self, category: str, name: str, start: float, duration: float, **data: Any) -> NoReturn:
+        sink: TraceSink
+        record: TraceRecord
+        
+        if not self.enabled:
+            return
+        
+        record = TraceRecord(category, name, start, duration, threading.get_ident(), data)
+        with self.__lock:
+            for sink in self.sinks:
+                sink.write(record)
+    
+    def span(self, category: str, name: str, **data: Any) -> TraceSpan:
+        return TraceSpan(self if self.enabled else None, category, name, data)
+    
+    def build(
+        self, control_type: str, var_name: str, build: Callable[[Callable], Any], 
+        parser: Callable[..., Mapping[str, Any]]
+    ) -> Any:
+        start: float
+        result: Any
+        duration: float
+        parse_time: float = 0.0
+        
+        def timed_parser(*args: Any, **kwargs: Any) -> Mapping[str, Any]:
+            nonlocal parse_time
+            begin: float = time.perf_counter()
+            try:
+                return parser(*args, **kwargs)
+            finally:
+                parse_time += time.perf_counter() - begin
+        
+        start = time.perf_counter()
+        result = build(timed_parser)
+        duration = time.perf_counter() - start
+        self.record(
+            TraceKeys.CONTROL, control_type, start, duration, var_name=var_name, 
+            parse=parse_time, construct=duration - parse_time
+        )
+        return result
+    
+    def handler(self, name: str, handler: Callable, **data: Any) -> Callable:
+        if not self.enabled:
+            return handler
+        
+        if inspect.iscoroutinefunction(handler):
+            async def run_async_handler(*args: Any, **kwargs: Any) -> Any:
+                start: float = time.perf_counter()
+                try:
+                    return await handler(*args, **kwargs)
+                finally:
+                    self.record(
+                        TraceKeys.EVENT, name, start, time.perf_counter() - start, **data
+                    )
+            return run_async_handler
+        
+        def run_handler(*args: Any, **kwargs: Any) -> Any:
+            start: float = time.perf_counter()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                self.record(
+                    TraceKeys.EVENT, name, start, time.perf_counter() - start, **data
+                )
+        return run_handler
+    
+    def timed(self, category: str, name: Union[str, None] = None) -> Callable[[Callable], Callable]:
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def timed_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.span(category, name or func.__qualname__):
+                    return func(*args, **kwargs)
+            return timed_wrapper
+        return decorator
@@ -11,6 +11,8 @@ class EventKeys:
     CALL: str = "call"
     EVAL: str = "eval"
     ROUTE: str = "route"
+    OFFLOAD: str = "offload"
+    TIMEOUT: str = "timeout"
 
 
 class RefsKeys:
@@ -72,3 +74,47 @@ class LoopKeys:
     LOOP_INDEX: str = "loop_index"
     IDX: str = "idx"
     RANGE: str = "range"
+    WINDOW: str = "window"
+    MAX_ITEMS: str = "max_items"
+
+
+class WindowKeys:
+    SIZE: str = "size"
+    BUFFER: str = "buffer"
+    LIMIT: str = "limit"
+
+
+class RenderOps:
+    ROUTE: str = "route"
+    FUNC: str = "func"
+    CALL: str = "call"
+    EVAL: str = "eval"
+    NESTED: str = "nested"
+    STYLE: str = "style"
+    REF: str = "ref"
+    LOOP: str = "loop"
+    CONTROL: str = "control"
+
+
+class ProgramSections:
+    PROGRAM: str = "program"
+    METHODS: str = "methods"
+    CONTROLS: str = "controls"
+    UI: str = "ui"
+    STYLE_SHEET: str = "style_sheet"
+    DEPENDENCIES: str = "dependencies"
+    TYPE_HINTS: str = "type_hints"
+    CONTROL_REFS: str = "control_refs"
+    CONTROL_SETTINGS: str = "control_settings"
+    PROGRAM_NAME: str = "program_name"
+    ROUTES: str = "routes"
+    PLAN: str = "plan"
+    DEPENDENCY_DATA: str = "data"
+    DEPENDENCY_CACHE: str = "cache"
+
+
+class TraceKeys:
+    ROUTE: str = "route"
+    CONTROL: str = "control"
+    EVENT: str = "event"
+    COMPILE: str = "compile"
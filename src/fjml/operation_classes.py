@@ -1,18 +1,24 @@
 from __future__ import annotations
 from functools import partial, lru_cache
-from types import MethodType
-from collections import Counter
-import itertools, operator, copy, asyncio
+from types import MethodType, CodeType
+from collections import OrderedDict, ChainMap
+from collections.abc import MutableMapping
+import sys, builtins, itertools, operator, copy, asyncio, threading
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any, Literal, 
+    Awaitable,
     Sequence, 
     Callable, 
     TypeAlias,
     Iterable,
     TYPE_CHECKING,
     Mapping,
-    Iterator
+    Iterator,
+    Container,
+    Optional,
+    Union
 )
 
 try:
@@ -37,6 +43,7 @@ if TYPE_CHECKING:
     
 
 Tools: utils.Utilities = utils.Utilities()
+SlotTree: TypeAlias = Mapping[Union[str, int], Union["SlotTree", None]]
 PropertyLiteral: TypeAlias = Literal[
     PropertyKeys.SET, 
     PropertyKeys.GET, 
@@ -45,109 +52,240 @@ PropertyLiteral: TypeAlias = Literal[
 
 
 class ControlDependencies:
-    __slots__ = ("__data", "cache")
+    __slots__ = ("__data", "__reverse", "cache")
     
     def __init__(self) -> NoReturn:
-        self.__data: Mapping[str, Sequence[str]] = {}
-        self.cache: Mapping[str, Sequence[str]] = {}
+        self.__data: dict[str, set[str]] = {}
+        self.__reverse: dict[str, set[str]] = {}
+        self.cache: dict[str, Sequence[str]] = {}
+    
+    @classmethod
+    def from_data(
+        cls, data: Mapping[str, Sequence[str]], cache: Mapping[str, Sequence[str]]
+    ) -> ControlDependencies:
+        var_name: str
+        values: Sequence[str]
+        dependencies: ControlDependencies = cls()
+        
+        for var_name, values in data.items():
+            dependencies.add_refs(var_name, values)
+        dependencies.cache = dict(cache)
+        return dependencies
     
     def add_dependencies(self, var_name: str, settings: dt.ControlDict, update: bool = False) -> NoReturn:
+        self.add_refs(var_name, Tools.scan_markup(settings).refs, update)
+    
+    def overlay(self) -> ControlDependencies:
+        dependencies: ControlDependencies = ControlDependencies()
+        
+        dependencies.__data = utils.session_overlay(self.__data)
+        dependencies.__reverse = utils.session_overlay(self.__reverse)
+        dependencies.cache = utils.session_overlay(self.cache)
+        return dependencies
+    
+    @staticmethod
+    def link(index: MutableMapping[str, set[str]], name: str, values: Iterable[str]) -> NoReturn:
+        current: set[str] = index.get(name, set())
+        
+        if isinstance(index, ChainMap) and name not in index.maps[0]:
+            current = set(current)
+        current.update(values)
+        index[name] = current
+    
+    def add_refs(self, var_name: str, refs: Iterable[str], update: bool = False) -> NoReturn:
         val: str
-        func: Callable[[str], bool] = self.contains(var_name)
         
-        for val in itertools.filterfalse(func, Tools.find_values(settings, RefsKeys.REFS)):
-            self.add(var_name, val)
+        refs = set(refs).difference(self.__data.get(var_name, ()))
+        if refs:
+            self.link(self.__data, var_name, refs)
+        for val in refs:
+            self.link(self.__reverse, val, (var_name,))
         
         if update:
-            self.update_cache()
-    
-    def contains(self, var_name: str) -> Callable[[str], bool]:
-        return lambda dependency: dependency in self.__data.get(var_name, [])
+            self.update_cache(self.dependents(var_name))
     
-    def add(self, var_name: str, dependency: str) -> NoReturn:
-        if var_name in self.__data:
-            if not self.contains(var_name)(dependency):
-                return self.__data[var_name].append(dependency)
-        self.__data[var_name] = [dependency]
+    def merge(self, dependencies: ControlDependencies) -> NoReturn:
+        var_name: str
+        values: set[str]
+        
+        for var_name, values in dependencies.__data.items():
+            self.add_refs(var_name, values)
     
-    def _get(self, var_name: str) -> Sequence[str]:
+    def topological(
+        self, names: Iterable[str], done: Container[str] = ()
+    ) -> Sequence[str]:
+        root: str
         name: str
-        res: Sequence[str]
-        result: Sequence[str] = []
+        child: str
+        children: Iterator[str]
+        stack: list[tuple[str, Iterator[str]]]
+        path: list[str]
+        state: dict[str, bool] = {}
+        order: list[str] = []
         
-        if var_name in self.__data:
-            res = self.__data[var_name]
-            result.extend(res)
-            for name in res:
-                result.extend(self._get(name))
+        for root in names:
+            if root in state or root in done:
+                continue
+            
+            state[root] = False
+            path = [root]
+            stack = [(root, iter(sorted(self.__data.get(root, ()))))]
+            while stack:
+                name, children = stack[-1]
+                for child in children:
+                    if child in done or state.get(child, None):
+                        continue
+                    if child in state:
+                        raise err.CyclicReferenceError(path[path.index(child):] + [child])
+                    state[child] = False
+                    path.append(child)
+                    stack.append((child, iter(sorted(self.__data.get(child, ())))))
+                    break
+                else:
+                    stack.pop()
+                    path.pop()
+                    state[name] = True
+                    order.append(name)
         
-        return result
+        return order
+    
+    def closure(self, var_name: str, closures: Mapping[str, Sequence[str]]) -> Sequence[str]:
+        dependency: str
+        result: dict[str, None] = {}
+        
+        for dependency in sorted(self.__data.get(var_name, ())):
+            result.update(dict.fromkeys(closures.get(dependency, ())))
+            result[dependency] = None
+        
+        return list(result)
 
     def get(self, var_name: str, cache: bool = True) -> Sequence[str]:
-        res: Sequence[str]
+        name: str
+        closures: dict[str, Sequence[str]] = self.cache if cache else {}
         
-        if var_name in self.cache and cache:
-            return self.cache[var_name]
+        if var_name in closures:
+            return closures[var_name]
         
-        res = list(Counter(self._get(var_name)[::-1]))
-        if cache:
-            self.cache[var_name] = res
+        for name in self.topological((var_name,), closures):
+            closures[name] = self.closure(name, closures)
         
-        return res
+        return closures[var_name]
 
     @property
     def get_data(self) -> Mapping[str, Sequence[str]]:
-        return self.__data
+        name: str
+        values: set[str]
+        
+        return {name:sorted(values) for name, values in self.__data.items()}
+    
+    @property
+    def reverse(self) -> Mapping[str, set[str]]:
+        return self.__reverse
+    
+    def dependents(self, var_name: str) -> Sequence[str]:
+        name: str
+        stack: list[str] = [var_name]
+        affected: set[str] = {var_name}
+        
+        while stack:
+            for name in self.__reverse.get(stack.pop(), ()):
+                if name not in affected:
+                    affected.add(name)
+                    stack.append(name)
+        
+        return [name for name in self.topological(sorted(affected)) if name in affected]
     
-    def update_cache(self) -> NoReturn:
+    def update_cache(self, names: Union[Iterable[str], None] = None) -> NoReturn:
         name: str
-        for name in self.__data:
-            self.cache[name] = self.get(name, False)
+        
+        if names is None:
+            self.cache = {}
+            for name in list(self.__data):
+                self.get(name)
+            return
+        
+        for name in names:
+            self.cache[name] = self.closure(
+                name, {
+                    dependency:self.get(dependency) 
+                    for dependency in self.__data.get(name, ())
+                }
+            )
+
+
+@lru_cache(constants.EVAL_CACHE_SIZE)
+def compile_eval(source: str) -> CodeType:
+    return compile(source, "<fjml eval>", "eval")
 
 
 class EvalLocalData:
-    __data: Mapping[str, Any] = {}
+    __slots__ = ("__data", "__scope", "__globals")
     
-    @classmethod
-    def add(cls, name: str, obj: Any) -> NoReturn:
-        cls.__data[name] = obj
+    def __init__(self, data: Mapping[str, Any] = {}, scope: Mapping[str, Any] = {}) -> NoReturn:
+        self.__data: dict[str, Any] = dict(data)
+        self.__scope: dict[str, Any] = dict(scope, __builtins__=builtins)
+        self.__globals: dict[str, Any] = dict(self.__scope, **self.__data)
     
-    @classmethod
-    def delete(cls, name: str) -> NoReturn:
-        if name in cls.__data:
-            del cls.__data[name]
+    def add(self, name: str, obj: Any) -> NoReturn:
+        self.__data[name] = obj
+        self.__globals[name] = obj
     
-    @classmethod
-    def mass_add(cls, data: Mapping[str, Any]) -> NoReturn:
-        cls.__data.update(data)
+    def delete(self, name: str) -> NoReturn:
+        if name in self.__data:
+            del self.__data[name]
+            self.__restore(name)
+    
+    def mass_add(self, data: Mapping[str, Any]) -> NoReturn:
+        self.__data.update(data)
+        self.__globals.update(data)
         
-    @classmethod
-    def mass_delete(cls, data: Sequence[str]) -> NoReturn:
+    def mass_delete(self, data: Sequence[str]) -> NoReturn:
         name: str
         
-        for name in filter(partial(operator.contains, cls.data), data):
-            del cls.__data[name]
+        for name in list(filter(partial(operator.contains, self.__data), data)):
+            del self.__data[name]
+            self.__restore(name)
+    
+    def __restore(self, name: str) -> NoReturn:
+        if name in self.__scope:
+            self.__globals[name] = self.__scope[name]
+        else:
+            self.__globals.pop(name, None)
+    
+    def evaluate(self, source: str) -> Any:
+        return eval(compile_eval(source), self.__globals)
     
-    @classmethod
     @property
-    def data(cls) -> Mapping[str, Any]:
-        return cls.__data.copy()
+    def namespace(self) -> Mapping[str, Any]:
+        return self.__data
+    
+    @property
+    def data(self) -> Mapping[str, Any]:
+        return self.__data.copy()
 
 
 class UIViews:
-    __slots__ = ("route", "settings")
+    __slots__ = ("route", "settings", "plan")
     
-    def __init__(self, route: str, settings: dt.ControlSettings = {}) -> NoReturn:
+    def __init__(
+        self, route: str, settings: dt.ControlSettings = {}, 
+        plan: Optional[dt.RenderPlan] = None
+    ) -> NoReturn:
         self.route: str = route
         self.settings: dt.ControlSettings = settings
         self.settings[ControlKeys.ROUTE] = self.route
+        self.plan: Optional[dt.RenderPlan] = plan
+    
+    def __reduce__(self) -> tuple[type, tuple]:
+        return UIViews, (self.route, self.settings, self.plan)
     
     def build(self, parser: types.MethodType[Renderer]) -> ft.View:
         return ft.View(
             **parser(
                 self.settings,
                 types=ControlKeys.VIEW,
-                ignore=True
+                ignore=True,
+                plan=self.plan
             )
         )
     
@@ -183,24 +321,31 @@ class EventParser:
             settings[key] = None
             return
         
-        settings[key] = partial(self.change_route, route=data[ControlKeys.ROUTE])
+        settings[key] = self.__backend.instrumentation.handler(
+            data[ControlKeys.ROUTE], partial(self.change_route, route=data[ControlKeys.ROUTE]), 
+            event=key
+        )
             
 
     def call(self, key: str, data: dt.JsonDict, settings: dt.JsonDict) -> NoReturn:
+        self.__renderer.runtime_refs = True
         if not isinstance(data[EventKeys.CALL], str):
             settings[key] = None
             return
         
-        settings[key] = self.__backend.object_bucket.call_object(
-            data[EventKeys.CALL], self.get_settings(data)
+        settings[key] = self.__renderer.defer(
+            settings, key, self.__backend.object_bucket.call_object(
+                data[EventKeys.CALL], self.get_settings(data)
+            )
         )
 
     def eval(self, key: str, data: dt.JsonDict, settings: dt.JsonDict) -> NoReturn:
+        self.__renderer.runtime_refs = True
         if not isinstance(data[EventKeys.EVAL], str):
             settings[key] = None
             return
         
-        settings[key] = eval(data[EventKeys.EVAL], {}, self.__backend.eval_locals.data)
+        settings[key] = self.__backend.eval_locals.evaluate(data[EventKeys.EVAL])
 
     def func(self, key: str, data: dt.JsonDict, settings: dt.JsonDict) -> NoReturn:
         method: MethodType = self.get_attr(data[EventKeys.FUNC])
@@ -214,115 +359,524 @@ class EventParser:
             return
         
         settings[key] = partial(method, **self.get_settings(data))
+        if data.get(EventKeys.OFFLOAD, False) or data.get(EventKeys.TIMEOUT, None) is not None:
+            settings[key] = CallableObject.handler(
+                settings[key], data.get(EventKeys.TIMEOUT, None)
+            )
+        settings[key] = self.__backend.instrumentation.handler(
+            data[EventKeys.FUNC], settings[key], event=key
+        )
 
 
-class Reference:
+class LoopTemplate:
     
-    __slots__ = ("__renderer", "__get_attr")
+    __slots__ = ("control", "slots", "content", "call_name", "is_reference")
     
-    def __init__(self, renderer: Renderer) -> NoReturn:
-        self.__renderer: Renderer = renderer
-        self.__get_attr = self.__renderer.backend.get_attr
+    def __init__(self, control: dt.ControlDict) -> NoReturn:
+        self.control: dt.ControlDict = control
+        self.is_reference: bool = bool(
+            Tools.multi_dict_get(control, (RefsKeys.REFS, RefsKeys.CODE_REFS))
+        )
+        self.content: Union[str, None] = control.get(ControlKeys.CONTROL_TYPE, None)
+        self.call_name: Union[str, None] = control.get(EventKeys.CALL, None)
+        self.slots: SlotTree = self.find_slots(control)
+        
+        if not self.is_reference:
+            self.slots = {}
+            if isinstance(control.get(ControlKeys.SETTINGS, None), (Mapping, Sequence)):
+                self.slots = self.find_slots(control[ControlKeys.SETTINGS])
+                if self.slots:
+                    self.slots = {ControlKeys.SETTINGS:self.slots}
+    
+    @property
+    def is_valid(self) -> bool:
+        if self.is_reference:
+            return True
+        return bool(self.content or self.call_name) and self.content != ControlKeys.LOOP
+    
+    @classmethod
+    def find_slots(cls, data: Union[Mapping, Sequence]) -> SlotTree:
+        key: Union[str, int]
+        value: Any
+        child: SlotTree
+        slots: SlotTree = {}
+        items: Iterable[tuple[Union[str, int], Any]] = ()
+        
+        if isinstance(data, Mapping):
+            items = data.items()
+        elif utils.is_sequence_not_str(data):
+            items = enumerate(data)
+        
+        for key, value in items:
+            if isinstance(value, Mapping) and isinstance(key, str):
+                if value.get(ControlKeys.CONTROL_TYPE, "") == LoopKeys.LOOP_INDEX:
+                    slots[key] = None
+                    continue
+            if isinstance(value, Mapping) or utils.is_sequence_not_str(value):
+                child = cls.find_slots(value)
+                if child:
+                    slots[key] = child
+        
+        return slots
     
-    def attr_filter(self, obj: Any) -> Sequence[str]:
-        return tuple(
-            filter(lambda x: not x.startswith("_"), vars(obj))
+    @classmethod
+    def fill_slots(
+        cls, data: Union[Mapping, Sequence], slots: SlotTree, 
+        depth_count: int, loop_values: Sequence
+    ) -> Union[Mapping, Sequence]:
+        key: Union[str, int]
+        child: Union[SlotTree, None]
+        result: Union[dict, list] = (
+            dict(data) if isinstance(data, Mapping) else list(data)
         )
+        
+        for key, child in slots.items():
+            if child is None:
+                result[key] = Tools.sanitize(data[key], depth_count, loop_values)
+            else:
+                result[key] = cls.fill_slots(data[key], child, depth_count, loop_values)
+        
+        return result
     
-    def get_ref(self, ref: Mapping) -> Any:
-        result: Any
-        ref_type: str = Tools.refs_type(ref)
-        data: Any = ref.get(ref_type, None)
+    def fill(self, depth_count: int, loop_values: Sequence) -> dt.ControlDict:
+        if not self.slots:
+            return self.control
+        return self.fill_slots(self.control, self.slots, depth_count, loop_values)
+
+
+class LoopWindow:
+    
+    __slots__ = (
+        "renderer", "template", "source", "key", "size", "buffer", "limit", "scrolling",
+        "depth_count", "loop_depth", "loop_values", "controls", "chunks", "control", "shift"
+    )
+    
+    def __init__(
+        self, renderer: Renderer, template: LoopTemplate, source: dt.LoopSource, key: str, 
+        settings: Union[Mapping, bool, None], depth_count: int, loop_depth: int, loop_values: Sequence
+    ) -> NoReturn:
+        self.scrolling: bool = bool(settings)
+        if not isinstance(settings, Mapping):
+            settings = {}
         
-        if not data or not isinstance(data, str):
-            return
+        self.renderer: Renderer = renderer
+        self.template: LoopTemplate = template
+        self.source: dt.LoopSource = source
+        self.key: str = key
+        self.size: int = max(int(settings.get(WindowKeys.SIZE, constants.LOOP_WINDOW_SIZE)), 1)
+        self.buffer: int = max(int(settings.get(WindowKeys.BUFFER, self.size)), 0)
+        self.limit: Optional[int] = None
+        self.depth_count: int = depth_count
+        self.loop_depth: int = loop_depth
+        self.loop_values: Sequence = list(loop_values)
+        self.controls: list[ft.Control] = []
+        self.chunks: list[tuple[int, int, int]] = []
+        self.control: Optional[ft.Control] = None
+        self.shift: int = 0
         
-        if ref_type == RefsKeys.REFS:
-            result = self.__get_reference(data)
-        elif ref_type == RefsKeys.CODE_REFS:
-            result = self.__get_reference(data, True)
+        if self.scrolling:
+            self.limit = max(
+                int(settings.get(WindowKeys.LIMIT, (self.size + self.buffer) * 3)), 
+                self.size + self.buffer
+            )
+        if not self.source.is_async:
+            self.extend(self.size + self.buffer)
+    
+    @property
+    def start(self) -> int:
+        return self.chunks[0][0] if self.chunks else 0
+    
+    @property
+    def stop(self) -> int:
+        return self.chunks[-1][1] if self.chunks else 0
+    
+    @property
+    def live(self) -> int:
+        return len(self.controls)
+    
+    @property
+    def extent(self) -> Optional[float]:
+        extent: Any = getattr(self.control, "item_extent", None)
+        if isinstance(extent, (int, float)) and extent > 0:
+            return extent
+        return None
+    
+    @property
+    def trimmable(self) -> bool:
+        return self.limit is not None and self.live > self.limit and len(self.chunks) > 1
+    
+    @property
+    def threshold(self) -> float:
+        if self.extent is not None:
+            return self.extent * max(self.buffer, 1)
+        return constants.LOOP_WINDOW_THRESHOLD
+    
+    def append_chunk(self, start: int, values: Sequence) -> bool:
+        if not values:
+            return False
+        return self.add_chunk(start, values, self.renderer.window_items(self, values))
+    
+    async def window_items(self, values: Sequence) -> Sequence[ft.Control]:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.renderer.window_items, self, values
+        )
+    
+    def add_chunk(self, start: int, values: Sequence, items: Sequence[ft.Control]) -> bool:
+        count: int
         
-        if not result:
+        self.controls.extend(items)
+        self.chunks.append((start, start + len(values), len(items)))
+        if not self.scrolling:
+            self.source.release(self.stop)
+        
+        while self.trimmable and self.extent is not None:
+            count = self.chunks.pop(0)[2]
+            del self.controls[:count]
+            self.shift -= count
+        return True
+    
+    def extend(self, count: Optional[int] = None) -> bool:
+        return self.append_chunk(
+            self.stop, self.source.slice(self.stop, self.stop + (count or self.size))
+        )
+    
+    async def extend_async(self, count: Optional[int] = None) -> bool:
+        items: Sequence[ft.Control]
+        start: int = self.stop
+        values: Sequence = await self.source.aslice(start, start + (count or self.size))
+        
+        if not values:
+            return False
+        items = await self.window_items(values)
+        if start != self.stop:
+            return False
+        return self.add_chunk(start, values, items)
+    
+    async def prepend(self) -> bool:
+        items: Sequence[ft.Control]
+        stop: int = self.start
+        start: int = max(stop - self.size, 0)
+        
+        if start >= stop:
+            return False
+        
+        items = await self.window_items(await self.source.aslice(start, stop))
+        if stop != self.start:
+            return False
+        self.controls[0:0] = items
+        self.chunks.insert(0, (start, stop, len(items)))
+        self.shift += len(items)
+        
+        while self.trimmable:
+            del self.controls[self.live - self.chunks.pop()[2]:]
+        return True
+    
+    async def load(self) -> NoReturn:
+        if await self.extend_async(self.size + self.buffer):
+            self.refresh()
+        
+        while not self.scrolling and await self.extend_async():
+            self.refresh()
+    
+    def refresh(self) -> NoReturn:
+        shift: int = self.shift
+        
+        self.shift = 0
+        if self.control is None or not self.control.page:
             return
+        if shift and self.extent is not None:
+            return self.control.scroll_to(delta=shift * self.extent, duration=0)
+        self.control.update()
+    
+    def bind(self, control: ft.Control, settings: Mapping = {}) -> bool:
+        if getattr(control, self.key, None) is not self.controls:
+            return False
         
-        return self.__get_attr_index(ref, result, ref_type)
+        self.control = control
+        if self.scrolling and hasattr(control, "on_scroll"):
+            control.on_scroll = self.on_scroll
+        return True
     
-    def key_filter(self, data: tuple[str, Any]) -> bool:
-        return data[0] in (ControlKeys.ATTR, LoopKeys.IDX)
+    async def on_scroll(self, e: ft.OnScrollEvent) -> NoReturn:
+        changed: bool = False
+        threshold: float = self.threshold
+        
+        if e.max_scroll_extent - e.pixels <= threshold:
+            changed = await self.extend_async()
+        elif e.pixels - e.min_scroll_extent <= threshold:
+            changed = await self.prepend()
+        
+        if changed:
+            self.refresh()
+
+
+class RefAccessor:
     
-    def map_to_tuple(self, data) -> tuple[str, Any]:
-        return tuple(data.items())[0]
+    __slots__ = ("ref_type", "name", "steps")
+    
+    def __init__(self, ref: Mapping) -> NoReturn:
+        name: Any
+        
+        self.ref_type: str = Tools.refs_type(ref)
+        name = ref.get(self.ref_type, None)
+        self.name: Union[str, None] = name if name and isinstance(name, str) else None
+        self.steps: Union[Sequence[tuple[bool, Any]], None] = self.compile_steps(ref)
+    
+    @property
+    def is_valid(self) -> bool:
+        return self.name is not None and self.steps is not None
     
-    def __get_attr_index(self, mapping: Mapping, data: Any, ref_type: str) -> Any:
-        parse_attr_idx: Callable = partial(self.__parse_attr_idx, ref_type=ref_type)
-        group: Sequence = mapping.get(RefsKeys.GROUP, [])
-        result: Any = data
-        depth: int = 0
+    @staticmethod
+    def compile_steps(ref: Mapping) -> Union[Sequence[tuple[bool, Any]], None]:
         key: str
         value: Any
+        item: Any
+        items: Iterable[tuple[str, Any]]
+        steps: list[tuple[bool, Any]] = []
+        group: Any = ref.get(RefsKeys.GROUP, [])
         
         if not utils.is_sequence_not_str(group):
             return None
         
-        if not group:
-            for key, value in filter(self.key_filter, mapping.items()):
-                result = parse_attr_idx(result, key, value, depth)
-                depth += 1
-                if not result:
-                    return
-            return result
+        items = ref.items()
+        if group:
+            items = (
+                next(iter(item.items())) for item in group 
+                if isinstance(item, Mapping) and item
+            )
+        
+        for key, value in items:
+            if key == ControlKeys.ATTR:
+                if not isinstance(value, str):
+                    return None
+                steps.append((True, value))
+            elif key == LoopKeys.IDX:
+                steps.append((False, value))
+        
+        return tuple(steps)
+    
+    def resolve(self, lookup: Callable[[str, str], Any]) -> Any:
+        is_attr: bool
+        value: Any
+        result: Any
+        
+        if not self.is_valid:
+            return None
         
-        group = tuple(filter(lambda x: isinstance(x, Mapping), group))
+        result = lookup(self.ref_type, self.name)
+        if not result:
+            return None
         
-        for key, value in filter(self.key_filter, map(self.map_to_tuple, group)):
-            result = parse_attr_idx(result, key, value, depth)
-            depth += 1
+        for is_attr, value in self.steps:
+            if is_attr:
+                result = getattr(result, value, None)
+            else:
+                try:
+                    result = operator.getitem(result, value)
+                except:
+                    return None
             if not result:
-                return
+                return None
         
         return result
+
+
+class Reference:
     
-    def __parse_attr_idx(self, result: Any, key: str, value: Any, depth: int, ref_type: str) -> Any:
-        if key == ControlKeys.ATTR:
-            if not isinstance(value, str): 
-                return
-            return getattr(result, value, None)
+    __slots__ = ("__renderer", "__get_attr", "__namespace", "accessors")
+    
+    def __init__(self, renderer: Renderer) -> NoReturn:
+        self.__renderer: Renderer = renderer
+        self.__get_attr = self.__renderer.backend.get_attr
+        self.__namespace: Mapping[str, Any] = vars(self.__renderer.backend)
+        self.accessors: OrderedDict[int, tuple[Mapping, RefAccessor]] = OrderedDict()
+    
+    def accessor(self, ref: Mapping) -> RefAccessor:
+        key: int = id(ref)
+        
+        if key in self.accessors and self.accessors[key][0] is ref:
+            self.accessors.move_to_end(key)
+            return self.accessors[key][1]
         
-        if key == LoopKeys.IDX:
-            return self.__get_index(result, value)
+        self.accessors[key] = (ref, RefAccessor(ref))
+        if len(self.accessors) > constants.REF_ACCESSOR_CACHE_SIZE:
+            self.accessors.popitem(last=False)
+        return self.accessors[key][1]
+    
+    def get_ref(self, ref: Mapping) -> Any:
+        return self.accessor(ref).resolve(self.lookup)
+    
+    def lookup(self, ref_type: str, name: str) -> Any:
+        backend: Backend = self.__renderer.backend
         
+        if ref_type == RefsKeys.REFS:
+            if name in backend.controls:
+                return self.__renderer.get_control(name)
+            return None
+        
+        if ref_type != RefsKeys.CODE_REFS or name in backend.controls:
+            return None
+        self.__renderer.runtime_refs = True
+        if backend.property_bucket.contains(name):
+            return backend.property_bucket.call(name, PropertyKeys.GET)
+        if not name.startswith("_") and name in self.__namespace:
+            return self.__get_attr(name)
+        return None
 
-    def __get_reference(self, ref: str, is_code: bool = False) -> Any:
-        result: Any
+
+class DeferredValue:
+    __slots__ = ("awaitable", "container", "key", "control", "result", "resolved", "lock")
+    
+    def __init__(self, awaitable: Awaitable) -> NoReturn:
+        self.awaitable: Awaitable = awaitable
+        self.container: Union[Sequence, Mapping, None] = None
+        self.key: Union[int, str, None] = None
+        self.control: Optional[ft.Control] = None
+        self.result: Any = None
+        self.resolved: bool = False
+        self.lock: threading.Lock = threading.Lock()
+    
+    def target(self, container: Union[Sequence, Mapping], key: Union[int, str]) -> DeferredValue:
+        self.container = container
+        self.key = key
+        return self
+    
+    def bind(self, control: ft.Control, settings: Mapping = {}) -> bool:
+        value: Any
+        index: int
+        item: Any
+        
+        if self.container is settings:
+            self.attach(control)
+            return True
         
-        if is_code and ref not in self.__renderer.backend.controls:
-            if self.__renderer.backend.property_bucket.contains(ref):
-                return self.__renderer.backend.property_bucket.call(
-                    ref, PropertyKeys.GET
-                )
-            elif ref in self.attr_filter(self.__renderer.backend):
-                return self.__get_attr(ref)
-        elif ref in self.__renderer.backend.controls and not is_code:
-            return self.__get_attr(ref)
+        for value in filter(lambda value: isinstance(value, list), settings.values()):
+            for index, item in enumerate(value):
+                if item is self:
+                    del value[index]
+                    self.target(value, index).attach(control)
+                    return True
+        return False
     
-    @staticmethod
-    def __get_index(value: Any, index: dt.IndexType = None) -> Any:
+    def attach(self, control: ft.Control) -> NoReturn:
+        with self.lock:
+            self.control = control
+        self.apply()
+    
+    async def resolve(self) -> NoReturn:
+        result: Any
         
         try:
-            return operator.getitem(value, index)
-        except:
-            return None
+            result = await self.awaitable
+        except asyncio.TimeoutError:
+            return
+        
+        with self.lock:
+            self.result = result
+            self.resolved = True
+        self.apply()
+    
+    def apply(self) -> NoReturn:
+        result: Any
+        
+        with self.lock:
+            if not self.resolved or self.control is None:
+                return
+            result = self.result
+            self.resolved = False
+        
+        if isinstance(self.container, Mapping):
+            setattr(self.control, self.key, result)
+        else:
+            self.container.insert(min(self.key, len(self.container)), result)
+        if self.control.page:
+            self.control.update()
+
 
 class CallableObject:
-    __slots__ = ("obj", "name", "valid_args")
-    def __init__(self, obj: dt.AnyCallable, name: str) -> NoReturn:
+    __slots__ = ("obj", "name", "offload", "timeout", "is_async")
+    
+    executor: Optional[ThreadPoolExecutor] = None
+    
+    def __init__(
+        self, obj: dt.AnyCallable, name: str, 
+        offload: bool = False, timeout: Optional[float] = None
+    ) -> NoReturn:
         self.obj: dt.AnyCallable = obj
         self.name: str = name
-
-    def __call__(self, kwargs) -> Any:
-        if not inspect.isawaitable(self.obj):
-            return self.obj(**kwargs)
-        return asyncio.run(self.obj(**kwargs))
+        self.offload: bool = offload
+        self.timeout: Optional[float] = timeout
+        self.is_async: bool = inspect.iscoroutinefunction(obj)
+    
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        if cls.executor is None:
+            cls.executor = ThreadPoolExecutor(
+                constants.CALL_OFFLOAD_WORKERS, thread_name_prefix="fjml-call"
+            )
+        return cls.executor
+    
+    @classmethod
+    async def run(
+        cls, func: Callable, args: Sequence = (), kwargs: Mapping = {}, 
+        timeout: Optional[float] = None, offload: bool = True
+    ) -> Any:
+        result: Any
+        
+        if inspect.iscoroutinefunction(func):
+            result = func(*args, **kwargs)
+        elif offload or timeout is not None:
+            result = asyncio.get_running_loop().run_in_executor(
+                cls.get_executor(), partial(func, *args, **kwargs)
+            )
+        else:
+            result = func(*args, **kwargs)
+        
+        if not inspect.isawaitable(result):
+            return result
+        if timeout is None:
+            return await result
+        return await asyncio.wait_for(result, timeout)
+    
+    @classmethod
+    def handler(cls, func: Callable, timeout: Optional[float] = None) -> Callable[[ft.ControlEvent], Awaitable]:
+        async def run_handler(e: ft.ControlEvent) -> Any:
+            try:
+                return await cls.run(func, (e,), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+        return run_handler
+    
+    @staticmethod
+    def running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+    
+    def __call__(self, kwargs: Mapping[str, Any], page: Any = None) -> Any:
+        value: Any
+        result: Awaitable
+        deferred: DeferredValue
+        
+        if self.is_async or self.offload:
+            result = self.run(self.obj, kwargs=kwargs, timeout=self.timeout, offload=self.offload)
+        else:
+            value = self.obj(**kwargs)
+            if not inspect.isawaitable(value):
+                return value
+            result = self.run(lambda: value, timeout=self.timeout, offload=False)
+        
+        if page is None and self.running_loop() is None:
+            try:
+                return asyncio.run(result)
+            except asyncio.TimeoutError:
+                return None
+        
+        deferred = DeferredValue(result)
+        if page is not None:
+            page.run_task(deferred.resolve)
+        return deferred
 
 
 class PreserveControlContainer:
@@ -347,6 +901,185 @@ class PreserveControlContainer:
         return self.__data
 
 
+class UpdateCoalescer:
+    
+    __slots__ = ("__update", "__lock", "depth", "pending", "scheduled")
+    
+    def __init__(self, update: Callable[[], NoReturn]) -> NoReturn:
+        self.__update: Callable[[], NoReturn] = update
+        self.__lock: threading.Lock = threading.Lock()
+        self.depth: int = 0
+        self.pending: bool = False
+        self.scheduled: bool = False
+    
+    def __enter__(self) -> UpdateCoalescer:
+        with self.__lock:
+            self.depth += 1
+        return self
+    
+    def __exit__(self, *args: Any) -> NoReturn:
+        with self.__lock:
+            self.depth -= 1
+            if self.depth:
+                return
+        self.flush()
+    
+    @property
+    def active(self) -> bool:
+        with self.__lock:
+            return self.depth > 0
+    
+    def request(self) -> NoReturn:
+        loop: Optional[asyncio.AbstractEventLoop] = CallableObject.running_loop()
+        
+        with self.__lock:
+            self.pending = True
+            if self.depth or (loop is not None and self.scheduled):
+                return
+            self.scheduled = loop is not None
+        
+        if loop is None:
+            return self.flush()
+        loop.call_soon(self.flush)
+    
+    def flush(self) -> NoReturn:
+        with self.__lock:
+            self.scheduled = False
+            if not self.pending or self.depth:
+                return
+            self.pending = False
+        self.__update()
+
+
+class RouteBuild:
+    
+    __slots__ = ("route", "cancelled")
+    
+    def __init__(self, route: str) -> NoReturn:
+        self.route: str = route
+        self.cancelled: bool = False
+    
+    def cancel(self) -> NoReturn:
+        self.cancelled = True
+    
+    def check(self) -> NoReturn:
+        if self.cancelled:
+            raise err.RouteBuildCancelledError(self.route)
+
+
+class CachedView:
+    
+    __slots__ = ("view", "controls", "size")
+    
+    def __init__(self, view: ft.View, controls: Mapping[str, Any], size: int) -> NoReturn:
+        self.view: ft.View = view
+        self.controls: Mapping[str, Any] = controls
+        self.size: int = size
+
+
+def control_attrs(control: ft.Control) -> Iterator[tuple[str, Any]]:
+    attr: str
+    
+    for attr in constants.CONTROL_CHILD_ATTRS:
+        if isinstance(getattr(type(control), attr, None), property):
+            yield attr, getattr(control, attr)
+
+
+class ViewCache:
+    
+    __slots__ = ("views", "size", "budget", "usage", "hits")
+    
+    def __init__(
+        self, size: int = constants.VIEW_CACHE_SIZE, 
+        budget: int = constants.VIEW_CACHE_BUDGET
+    ) -> NoReturn:
+        self.views: OrderedDict[str, CachedView] = OrderedDict()
+        self.size: int = size
+        self.budget: int = budget
+        self.usage: int = 0
+        self.hits: int = 0
+    
+    def __contains__(self, route: str) -> bool:
+        return route in self.views
+    
+    def __len__(self) -> int:
+        return len(self.views)
+    
+    @classmethod
+    def measure_value(cls, value: Any, depth: int) -> int:
+        item: Any
+        size: int
+        
+        if isinstance(value, ft.Control):
+            return 0
+        size = sys.getsizeof(value)
+        if not depth:
+            return size
+        if isinstance(value, Mapping):
+            value = value.values()
+        elif not isinstance(value, (list, tuple, set)):
+            return size
+        return size + sum(cls.measure_value(item, depth - 1) for item in value)
+    
+    @classmethod
+    def measure(cls, view: ft.View) -> int:
+        control: ft.Control
+        value: Any
+        stack: list[ft.Control] = [view]
+        size: int = 0
+        
+        while stack:
+            control = stack.pop()
+            size += sys.getsizeof(control) + cls.measure_value(getattr(control, "__dict__", {}), 3)
+            for _, value in control_attrs(control):
+                if isinstance(value, ft.Control):
+                    stack.append(value)
+                elif isinstance(value, list):
+                    stack.extend(item for item in value if isinstance(item, ft.Control))
+        return size
+    
+    def get(self, route: str) -> Optional[CachedView]:
+        if route not in self.views:
+            return None
+        
+        self.views.move_to_end(route)
+        self.hits += 1
+        return self.views[route]
+    
+    def add(self, route: str, view: ft.View, controls: Mapping[str, Any]) -> NoReturn:
+        cached: CachedView
+        
+        self.invalidate(route)
+        if self.size <= 0:
+            return
+        
+        cached = CachedView(view, controls, self.measure(view))
+        if cached.size > self.budget:
+            return
+        
+        self.views[route] = cached
+        self.usage += cached.size
+        self.trim()
+    
+    def resize(self, size: Optional[int] = None, budget: Optional[int] = None) -> NoReturn:
+        if size is not None:
+            self.size = size
+        if budget is not None:
+            self.budget = budget
+        self.trim()
+    
+    def trim(self) -> NoReturn:
+        while self.views and (len(self.views) > self.size or self.usage > self.budget):
+            self.usage -= self.views.popitem(last=False)[1].size
+    
+    def invalidate(self, route: Optional[str] = None) -> NoReturn:
+        if route is None:
+            self.views.clear()
+            self.usage = 0
+        elif route in self.views:
+            self.usage -= self.views.pop(route).size
+
+
 class ViewOperations:
     __slots__ = (
         "__backend", "__page", "__renderer", 
@@ -361,16 +1094,18 @@ class ViewOperations:
         self.valid_args: Sequence[str] = Tools.get_object_args(ft.View)
     
     def set_view(self, route_name: str, view_settings: dt.ControlSettings) -> NoReturn:
-        if isinstance(route_name, str):
+        if not isinstance(route_name, str):
             raise err.InvalidTypeError("route_name", route_name, str)
         
-        if isinstance(view_settings, Mapping):
+        if not isinstance(view_settings, Mapping):
             raise err.InvalidTypeError("view_settings", view_settings, Mapping)
         
+        self.__backend.view_cache.invalidate(route_name)
+        self.__backend.dependency_bucket.add_dependencies(route_name, view_settings, update=True)
         self.__backend.ui[route_name] = UIViews(
             route_name, 
             Tools.valid_param_filter(
-                view_setting,
+                view_settings,
                 self.valid_args,
                 ControlKeys.UNPACK
             )
@@ -380,18 +1115,110 @@ class ViewOperations:
         self.__backend.page.views.append(view)
 
     def make_view(self, view_model: UIViews) -> ft.View:
+        name: str
+        view: ft.View
+        cached: Optional[CachedView]
         
         if view_model.route != self.__backend.get_current_route:
             return view_model.empty_view()
+        
+        cached = self.__backend.view_cache.get(view_model.route)
+        if cached is not None:
+            for name, control in cached.controls.items():
+                self.__renderer.set_control(name, control)
+            return cached.view
 
         self.__renderer.use_bucket = self.__backend.dependency_bucket.get(
             view_model.route
         )
+        self.__renderer.runtime_refs = False
         self.__renderer.create_controls()
 
-        return view_model.build(
-            self.__renderer.settings_object_parsers
+        try:
+            view = self.__renderer.build_model(view_model)
+        finally:
+            self.__renderer.bindings.clear()
+        
+        if self.__renderer.runtime_refs:
+            return view
+        self.__backend.view_cache.add(
+            view_model.route, view, 
+            {name:self.__renderer.get_control(name) for name in self.__backend.controls}
         )
+        return view
+    
+    @staticmethod
+    def swap_controls(
+        roots: Iterable[ft.Control], replacements: Mapping[int, ft.Control]
+    ) -> Sequence[ft.Control]:
+        control: ft.Control
+        attr: str
+        value: Any
+        items: list
+        stack: list[ft.Control] = list(roots)
+        parents: list[ft.Control] = []
+        
+        while stack:
+            control = stack.pop()
+            for attr, value in control_attrs(control):
+                if isinstance(value, ft.Control):
+                    if id(value) in replacements:
+                        setattr(control, attr, replacements[id(value)])
+                        parents.append(control)
+                    else:
+                        stack.append(value)
+                elif isinstance(value, list):
+                    if any(id(item) in replacements for item in value):
+                        items = [replacements.get(id(item), item) for item in value]
+                        setattr(control, attr, items)
+                        parents.append(control)
+                    stack.extend(
+                        item for item in value 
+                        if isinstance(item, ft.Control) and id(item) not in replacements
+                    )
+        
+        return list(dict.fromkeys(parents))
+    
+    def rebuild(self, var_name: str) -> Sequence[str]:
+        name: str
+        route: str
+        cached: CachedView
+        routes: set[str] = set(self.__backend.get_routes)
+        names: Sequence[str] = [
+            name for name in self.__backend.dependency_bucket.dependents(var_name) 
+            if name in self.__backend.controls
+        ]
+        old: Mapping[str, Any] = {name:self.__backend.get_attr(name) for name in names}
+        replacements: dict[int, ft.Control] = {}
+        
+        with self.__renderer.lock:
+            for route, cached in list(self.__backend.view_cache.views.items()):
+                if route not in routes and any(
+                    old[name] is not None and cached.controls.get(name) is old[name] 
+                    for name in names
+                ):
+                    self.__backend.view_cache.invalidate(route)
+            
+            names = [name for name in names if old[name] is not None]
+            try:
+                for name in names:
+                    self.__backend.set_attr(
+                        name, self.__renderer.build_model(self.__backend.controls[name])
+                    )
+                    replacements[id(old[name])] = self.__backend.get_attr(name)
+            finally:
+                self.__renderer.bindings.clear()
+            
+            for cached in self.__backend.view_cache.views.values():
+                for name in names:
+                    if cached.controls.get(name) is old[name]:
+                        cached.controls[name] = self.__backend.get_attr(name)
+            
+            self.__backend.scoped_update(
+                self.swap_controls(self.__backend.page.views, replacements)
+            )
+        
+        return names
     
     async def _view_pop(self, e: ft.ViewPopEvent) -> NoReturn:
         self.__backend.page.views.pop()
@@ -400,15 +1227,19 @@ class ViewOperations:
 
 
 class ObjectContainer:
-    __slots__ = ("__object_map", )
+    __slots__ = ("__object_map", "page")
     
-    def __init__(self) -> NoReturn:
+    def __init__(self, page: Optional[ft.Page] = None) -> NoReturn:
         self.__object_map: Mapping[str, CallableObject] = {}
+        self.page: Optional[ft.Page] = page
 
-    def set_object(self, name: str, obj: dt.AnyCallable) -> NoReturn:
+    def set_object(
+        self, name: str, obj: dt.AnyCallable, 
+        offload: bool = False, timeout: Optional[float] = None
+    ) -> NoReturn:
         if callable(obj):
             self.__object_map[name] = CallableObject(
-                name=name, obj=obj
+                name=name, obj=obj, offload=offload, timeout=timeout
             )
 
     def __get_object(self, name: str) -> CallableObject:
@@ -418,7 +1249,7 @@ class ObjectContainer:
         if name not in self.__object_map:
             return
         
-        return self.__get_object(name)(kwargs)
+        return self.__get_object(name)(kwargs, self.page)
 
     def delete_object(self, name: str) -> NoReturn:
         if name in self.__object_map:
@@ -428,12 +1259,11 @@ class ObjectContainer:
 
 class StyleSheet:
     __slots__ = (
-        "__renderer", "__data", "invalid_key_vals", 
-        "__is_set", "generate_path"
+        "__data", "invalid_key_vals", 
+        "__is_set", "generate_path", "scan"
     )
     
-    def __init__(self, data: dt.JsonDict = {}) -> NoReturn:
-        self.__renderer: Renderer
+    def __init__(self, data: dt.JsonDict = {}, validate: bool = True) -> NoReturn:
         self.__data: dt.JsonDict = data
         self.invalid_key_vals: Mapping = {
             ControlKeys.CONTROL_TYPE:(
@@ -443,7 +1273,10 @@ class StyleSheet:
         }
         self.__is_set: bool = False
         self.generate_path: MethodType = lru_cache(maxsize=32)(self.__generate_path)
-        self.__validate_style_sheet()
+        self.scan: Optional[utils.MarkupScan] = None
+        if validate:
+            self.scan = Tools.scan_markup(self.__data, constants.INVALID_STYLE_KEYS)
+            self.__validate_style_sheet()
 
     def get_style(self, path: str) -> dt.JsonDict:
         if not self.__is_set:
@@ -484,23 +1317,21 @@ class StyleSheet:
         return map(lambda x: x.split("."), splitted)
         
     def __validate_style_sheet(self) -> NoReturn:
-        invalid_keys: Sequence[str] = list(
-            Tools.m_find(self.__data, constants.INVALID_STYLE_KEYS, True)
-        )
+        invalid_keys: Sequence[str] = list(self.scan.invalid_keys)
         if invalid_keys:
             raise KeyError(f"The invalid keys of, {invalid_keys}, were found in the style sheet")
         
         invalid_values: Sequence[str] = list(
-            Tools.find_key_with_values(self.__data, self.invalid_key_vals)
+            self.scan.control_types.intersection(
+                self.invalid_key_vals[ControlKeys.CONTROL_TYPE]
+            )
         )
         if invalid_values:
             raise ValueError(f"The invalid values of, {invalid_values}, were found in the style sheet")
 
     def setter(self, renderer: Renderer) -> NoReturn:
-        if not self.__is_set:
-            self.__renderer: Renderer = renderer
-            self.__renderer.register_controls(self.__data)
-            self.__is_set = True
+        renderer.register_controls(self.__data)
+        self.__is_set = True
     
     @property
     def data(self) -> dt.JsonDict:
@@ -568,7 +1399,7 @@ class PropertyContainer:
         self.__props[name] = prop
     
     def validate_operator(self, operator: str) -> bool:
-        return operator in self.__is_valid_operator
+        return operator in self.__valid_operators
     
     def call(
         self, name: str, operation: PropertyLiteral = PropertyKeys.GET,
@@ -624,9 +1455,7 @@ class ControlLoader:
             if name not in self.control_registry[ControlRegKeys.CONTROLS]:
                 raise err.ControlNotFoundError(name, "")
 
-            registered_controls = self.control_registry[ControlRegKeys.CONTROL_TYPES][
-                self.control_registry[ControlRegKeys.CONTROLS].index(name)
-            ]
+            registered_controls = self.control_registry[ControlRegKeys.CONTROLS][name]
 
             self.__backend.type_hints[name] = utils.TypeHintSerializer.deserialize(
                 registered_controls[ControlRegKeys.TYPE_HINTS]
@@ -640,54 +1469,48 @@ class ControlLoader:
 
 class Unpacker:
     
-    __slots__ = ("__renderer", "unpack_data", "unpacker", "update_del", "get_style")
+    __slots__ = ("__renderer", "unpacker", "get_style")
     
     def __init__(self, renderer: Renderer) -> NoReturn:
         self.__renderer: Renderer = renderer
-        self.unpack_data: Any
         self.unpacker: Callable = Tools.unpack_validator
-        self.update_del: Callable
         self.get_style = self.__renderer.backend.style_sheet.get_style
     
     def unpack(self, settings: dt.ControlSettings) -> dt.ControlSettings:
-        self.unpack_data = settings.get(ControlKeys.UNPACK, None)
-        self.update_del = partial(
-            Tools.update_del_dict, main_dict=settings, 
-            delete_key=ControlKeys.UNPACK
+        res: dt.ControlSettings = self.resolve(settings.get(ControlKeys.UNPACK, None))
+        
+        Tools.update_del_dict(
+            main_dict=settings, delete_key=ControlKeys.UNPACK, update_dict=res
         )
-        return self.unpack_function()
+        return res
     
-    def unpack_function(self) -> dt.ControlSettings:
+    def resolve(self, unpack_data: Any) -> dt.ControlSettings:
         res: Any
-        success: bool
 
-        if not self.unpack_data or not isinstance(self.unpack_data, Mapping):
-            return self.update_del()
+        if not unpack_data or not isinstance(unpack_data, Mapping):
+            return {}
         
         res = self.unpacker(
-            self.unpack_data,
+            unpack_data,
             key=RefsKeys.CODE_REFS, 
             get_method=self.__renderer.get_ref, use_dict=True
         )
         if res:
-            return self.update_del(update_dict=res)
+            return res
         
-        res = self.unpacker(
-            self.unpack_data,
+        return self.unpacker(
+            unpack_data,
             key=RefsKeys.STYLING, 
             get_method=self.get_style
         )
-        if res:
-            return self.update_del(update_dict=res)
-        
-        return self.update_del()
 
 
 class TypeCheck:
     
-    __slots__ = ("keys", )
+    __slots__ = ("keys", "validators")
     
     def __init__(self) -> NoReturn:
+        self.validators: dict[int, tuple[dt.TypeHints, dict[str, tc.Validator]]] = {}
         self.keys: Sequence[str] = set([
             RefsKeys.REFS, RefsKeys.CODE_REFS, RefsKeys.STYLING, 
             ControlKeys.CONTROL_TYPE, EventKeys.CALL, EventKeys.FUNC, 
@@ -706,15 +1529,42 @@ class TypeCheck:
     def clean_list(self, data: Sequence) -> Sequence:
         return list(filter(self.list_filter, data))
     
-    def type_rectification(self, settings: dt.ControlSettings, types: dt.TypeHints = {}) -> dt.ControlSettings:
+    def get_validators(self, types: dt.TypeHints) -> dict[str, tc.Validator]:
+        key: int = id(types)
+        
+        if key not in self.validators:
+            if len(self.validators) >= constants.VALIDATOR_CACHE_SIZE:
+                self.validators.clear()
+            self.validators[key] = (types, {})
+        return self.validators[key][1]
+    
+    def prepare(self, types: dt.TypeHints) -> NoReturn:
+        key: str
+        validators: dict[str, tc.Validator] = self.get_validators(types)
+        
+        for key in types:
+            if key not in validators:
+                validators[key] = tc.validator(types[key])
+    
+    def type_rectification(
+        self, settings: dt.ControlSettings, types: dt.TypeHints = {}, 
+        keys: Union[Iterable[str], None] = None
+    ) -> dt.ControlSettings:
         key: str
         value: Any
+        validators: dict[str, tc.Validator]
         
         if not types:
             return settings
         
-        for key, value in filter(lambda x: x[0] in types, settings.items()):
-            if not tc.type_check(value, types[key]):
+        validators = self.get_validators(types)
+        for key in settings if keys is None else keys:
+            if key not in types or key not in settings:
+                continue
+            value = settings[key]
+            if key not in validators:
+                validators[key] = tc.validator(types[key])
+            if not validators[key](value):
                 if utils.is_sequence_not_str(value):
                     settings[key] = self.clean_list(value)
                 else:
@@ -0,0 +1,331 @@
+from __future__ import annotations
+import io, os, json, errno, struct, operator, threading
+from typing import (
+    Any,
+    Callable,
+    Sequence,
+    Mapping,
+    TypeAlias,
+    Union
+)
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+from .object_enums import *
+from .constants import (
+    PROGRAM_FILE_MAGIC, PROGRAM_FILE_VERSION, NESTED_CONTROL_TAG
+)
+from . import (
+    data_types as dt,
+    error_types as err,
+    operation_classes as opc,
+    utils
+)
+
+
+Tools: utils.Utilities = utils.Utilities()
+ObjectReference: TypeAlias = tuple[str, str]
+HEADER_FORMAT: struct.Struct = struct.Struct("<4sHH")
+SECTION_FORMAT: struct.Struct = struct.Struct("<16sQQ")
+
+
+def object_reference(obj: Any) -> ObjectReference:
+    if not isinstance(obj, type):
+        obj = type(obj)
+    if obj.__module__ == "__main__" or "<locals>" in obj.__qualname__:
+        raise err.UnimportableObjectError(obj.__module__, obj.__qualname__)
+    return obj.__module__, obj.__qualname__
+
+
+def resolve_reference(source: str, attr: str) -> Any:
+    return operator.attrgetter(attr)(utils.import_module(source))
+
+
+def encode_plan(plan: Union[dt.RenderPlan, None]) -> Union[Sequence[Any], None]:
+    if plan is None:
+        return None
+    return [
+        list(plan.steps), 
+        None if plan.checks is None else sorted(plan.checks)
+    ]
+
+
+def decode_plan(data: Union[Sequence[Any], None]) -> Union[dt.RenderPlan, None]:
+    if data is None:
+        return None
+    return dt.RenderPlan(*data)
+
+
+def encode_settings(value: Any) -> Any:
+    if isinstance(value, dt.NestedControlModel):
+        return {
+            NESTED_CONTROL_TAG:[
+                value.control_name, encode_settings(value.settings), 
+                encode_plan(value.plan)
+            ]
+        }
+    if isinstance(value, Mapping):
+        return {key:encode_settings(item) for key, item in value.items()}
+    if utils.is_sequence_not_str(value):
+        return [encode_settings(item) for item in value]
+    return value
+
+
+class CompiledProgram:
+    __slots__ = ("__buffer", "__sections", "__decoded", "__lock")
+
+    def __init__(self, buffer: bytes, sections: Mapping[str, tuple[int, int]]) -> NoReturn:
+        self.__buffer: memoryview = memoryview(buffer)
+        self.__sections: Mapping[str, tuple[int, int]] = sections
+        self.__decoded: dict[str, Any] = {}
+        self.__lock: threading.RLock = threading.RLock()
+
+    def read_section(self, name: str) -> Any:
+        offset: int
+        length: int
+
+        if name not in self.__sections:
+            raise err.InvalidProgramFileError(f"missing section, {name}")
+
+        offset, length = self.__sections[name]
+        return json.loads(bytes(self.__buffer[offset:offset+length]))
+
+    def section(self, name: str, decoder: Callable[[Any], Any]) -> Any:
+        if name not in self.__decoded:
+            with self.__lock:
+                if name not in self.__decoded:
+                    self.__decoded[name] = decoder(self.read_section(name))
+        return self.__decoded[name]
+
+    def decode_settings(self, value: Any) -> Any:
+        if isinstance(value, Mapping):
+            if NESTED_CONTROL_TAG in value:
+                return dt.NestedControlModel(
+                    control_name=value[NESTED_CONTROL_TAG][0],
+                    control=self.control_map[value[NESTED_CONTROL_TAG][0]],
+                    settings=self.decode_settings(value[NESTED_CONTROL_TAG][1]),
+                    plan=decode_plan(value[NESTED_CONTROL_TAG][2])
+                )
+            return {key:self.decode_settings(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.decode_settings(item) for item in value]
+        return value
+
+    def decode_control(self, name: str, data: dt.JsonDict) -> dt.ControlModel:
+        return dt.ControlModel(
+            name=name,
+            control_name=data[ControlKeys.CONTROL_TYPE],
+            control=self.control_map[data[ControlKeys.CONTROL_TYPE]],
+            settings=self.decode_settings(data[ControlKeys.SETTINGS]),
+            plan=decode_plan(data[ProgramSections.PLAN])
+        )
+
+    def decode_view(self, route: str, data: dt.JsonDict) -> opc.UIViews:
+        return opc.UIViews(
+            route, self.decode_settings(data[ControlKeys.SETTINGS]), 
+            decode_plan(data[ProgramSections.PLAN])
+        )
+
+    def decode_type_hints(self, name: str, has_hints: bool) -> dt.TypeHints:
+        if not has_hints:
+            return {}
+        return Tools.get_hints(self.control_map[name])
+
+    @property
+    def program(self) -> dt.JsonDict:
+        return self.section(ProgramSections.PROGRAM, dict)
+
+    @property
+    def program_name(self) -> str:
+        return self.program[ProgramSections.PROGRAM_NAME]
+
+    @property
+    def routes(self) -> set[str]:
+        return set(self.program[ProgramSections.ROUTES])
+
+    @property
+    def methods(self) -> type[dt.EventContainer]:
+        return self.section(
+            ProgramSections.METHODS,
+            lambda data: resolve_reference(*data)
+        )
+
+    @property
+    def control_map(self) -> dt.ControlMap:
+        return self.section(
+            ProgramSections.CONTROL_REFS,
+            lambda data: utils.LazyModelMap(
+                data, lambda name, ref: resolve_reference(*ref)
+            )
+        )
+
+    @property
+    def controls(self) -> dt.ParsedControls:
+        return self.section(
+            ProgramSections.CONTROLS,
+            lambda data: utils.LazyModelMap(data, self.decode_control)
+        )
+
+    @property
+    def ui(self) -> dt.ParsedUserInterface:
+        return self.section(
+            ProgramSections.UI,
+            lambda data: utils.LazyModelMap(data, self.decode_view)
+        )
+
+    @property
+    def type_hints(self) -> dt.TypeHintMap:
+        return self.section(
+            ProgramSections.TYPE_HINTS,
+            lambda data: utils.LazyModelMap(data, self.decode_type_hints)
+        )
+
+    @property
+    def control_settings(self) -> Mapping[str, Sequence[str]]:
+        return self.section(ProgramSections.CONTROL_SETTINGS, dict)
+
+    @property
+    def style_sheet(self) -> opc.StyleSheet:
+        return self.section(
+            ProgramSections.STYLE_SHEET,
+            lambda data: opc.StyleSheet(data, validate=False)
+        )
+
+    @property
+    def dependencies(self) -> opc.ControlDependencies:
+        return self.section(
+            ProgramSections.DEPENDENCIES,
+            lambda data: opc.ControlDependencies.from_data(
+                data[ProgramSections.DEPENDENCY_DATA],
+                data[ProgramSections.DEPENDENCY_CACHE]
+            )
+        )
+
+
+class CompiledFileHandler:
+    
+    __lock: threading.Lock = threading.Lock()
+    __programs: dict[str, tuple[tuple[int, int, int], CompiledProgram]] = {}
+
+    @staticmethod
+    def encode(data: dt.CompiledModel) -> Mapping[str, Any]:
+        name: str
+        control: dt.ControlModel
+        view: opc.UIViews
+
+        return {
+            ProgramSections.PROGRAM:{
+                ProgramSections.PROGRAM_NAME:data.program_name,
+                ProgramSections.ROUTES:sorted(data.routes),
+            },
+            ProgramSections.METHODS:object_reference(data.methods),
+            ProgramSections.CONTROL_REFS:dict(data.control_sources),
+            ProgramSections.CONTROL_SETTINGS:{
+                name:list(settings) for name, settings in data.control_settings.items()
+            },
+            ProgramSections.TYPE_HINTS:{
+                name:bool(hints) for name, hints in data.type_hints.items()
+            },
+            ProgramSections.CONTROLS:{
+                name:{
+                    ControlKeys.CONTROL_TYPE:control.control_name,
+                    ControlKeys.SETTINGS:encode_settings(control.settings),
+                    ProgramSections.PLAN:encode_plan(control.plan)
+                } for name, control in data.controls.items()
+            },
+            ProgramSections.UI:{
+                route:{
+                    ControlKeys.SETTINGS:encode_settings(view.settings),
+                    ProgramSections.PLAN:encode_plan(view.plan)
+                } for route, view in data.ui.items()
+            },
+            ProgramSections.STYLE_SHEET:data.style_sheet.data,
+            ProgramSections.DEPENDENCIES:{
+                ProgramSections.DEPENDENCY_DATA:data.dependencies.get_data,
+                ProgramSections.DEPENDENCY_CACHE:data.dependencies.cache
+            }
+        }
+
+    @staticmethod
+    def save(file_path: str, data: dt.CompiledModel) -> NoReturn:
+        file: io.BufferedWriter
+        name: str
+        payload: bytes
+        payloads: Sequence[tuple[str, bytes]] = [
+            (name, json.dumps(section, separators=(",", ":")).encode("utf8"))
+            for name, section in CompiledFileHandler.encode(data).items()
+        ]
+        offset: int = HEADER_FORMAT.size + SECTION_FORMAT.size * len(payloads)
+
+        with open(file_path, "wb") as file:
+            file.write(
+                HEADER_FORMAT.pack(PROGRAM_FILE_MAGIC, PROGRAM_FILE_VERSION, len(payloads))
+            )
+            for name, payload in payloads:
+                file.write(
+                    SECTION_FORMAT.pack(name.encode("utf8"), offset, len(payload))
+                )
+                offset += len(payload)
+            for name, payload in payloads:
+                file.write(payload)
+
+    @staticmethod
+    def load(file_path: str) -> CompiledProgram:
+        file: io.BufferedReader
+        buffer: bytes
+        magic: bytes
+        version: int
+        count: int
+        name: bytes
+        offset: int
+        length: int
+        sections: dict[str, tuple[int, int]] = {}
+
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), file_path)
+
+        with open(file_path, "rb") as file:
+            buffer = file.read()
+
+        if len(buffer) < HEADER_FORMAT.size:
+            raise err.InvalidProgramFileError("file is too small")
+
+        magic, version, count = HEADER_FORMAT.unpack_from(buffer)
+        if magic != PROGRAM_FILE_MAGIC:
+            raise err.InvalidProgramFileError("file is not an FJML program, please recompile it")
+        if version != PROGRAM_FILE_VERSION:
+            raise err.InvalidProgramFileError(
+                f"file version {version} is not supported, please recompile it"
+            )
+
+        for name, offset, length in SECTION_FORMAT.iter_unpack(
+            buffer[HEADER_FORMAT.size:HEADER_FORMAT.size + SECTION_FORMAT.size * count]
+        ):
+            sections[name.rstrip(b"\0").decode("utf8")] = (offset, length)
+
+        return CompiledProgram(buffer, sections)
+
+    @classmethod
+    def load_shared(cls, file_path: str) -> CompiledProgram:
+        stat: os.stat_result
+        stamp: tuple[int, int, int]
+        path: str = os.path.abspath(file_path)
+        
+        try:
+            stat = os.stat(path)
+        except OSError:
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), file_path)
+        
+        stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with cls.__lock:
+            if path not in cls.__programs or cls.__programs[path][0] != stamp:
+                cls.__programs[path] = (stamp, cls.load(path))
+            return cls.__programs[path][1]
+    
+    @classmethod
+    def clear_shared(cls) -> NoReturn:
+        with cls.__lock:
+            cls.__programs.clear()
@@ -1,6 +1,14 @@
-from typing import Union, Any, Mapping, Dict, Sequence, List, get_origin, get_args, Tuple, Set
+from typing import (
+    Union, Any, Mapping, Dict, Sequence, List, Callable, 
+    TypeAlias, get_origin, get_args, Tuple, Set
+)
+from functools import lru_cache
 from enum import Enum
 from .utils import is_sequence_not_str
+from .constants import VALIDATOR_CACHE_SIZE
+
+
+Validator: TypeAlias = Callable[[Any], bool]
 
 
 def _origin(data: Any) -> type:
@@ -25,56 +33,93 @@ def _new_isinstance(duck_type: type,  type_to_check: type) -> bool:
 _Sequences: tuple[type, ...] = (list, List, Tuple, Set, tuple, set, Sequence)
 
 
-def type_check(value: Any, dtype: type, depth: int=0) -> bool:
+def _accept(value: Any) -> bool:
+    return True
+
+
+def _union_validator(checks: tuple[Validator, ...]) -> Validator:
+    def check(value: Any) -> bool:
+        item: Validator
+        for item in checks:
+            if item(value):
+                return True
+        return False
+    return check
+
+
+def _sequence_validator(org: type, item: Validator) -> Validator:
+    def check(value: Any) -> bool:
+        return isinstance(value, org) and all(map(item, value))
+    return check
+
+
+def _mapping_validator(org: type, key: Validator, item: Validator) -> Validator:
+    def check(value: Any) -> bool:
+        param_k: Any
+        param_v: Any
+        
+        if not isinstance(value, org):
+            return False
+        for param_k, param_v in value.items():
+            if not key(param_k) or not item(param_v):
+                return False
+        return True
+    return check
+
+
+def _instance_validator(org: type, dtype: Any) -> Validator:
+    def check(value: Any) -> bool:
+        return isinstance(value, org) or issubclass(dtype, Enum)
+    return check
+
+
+def compile_validator(dtype: Any) -> Validator:
+    org: type
+    params: list
     
     if dtype == Any:
-        return True
+        return _accept
     
     if _new_isinstance(dtype, Union):
-        for param_t in get_args(dtype):
-            if type_check(value, param_t, depth=depth+1):
-                return True
-        return False
+        return _union_validator(tuple(map(validator, get_args(dtype))))
     
     org = _origin(dtype)
     if _new_isinstance(dtype, _Sequences):
-        if isinstance(value, org):  # outer level check
-            params = get_args(dtype)
-            if len(params) > 0:
-                param_t = params[0]
-            else:
-                return True
-            
-            for param_x in value:
-                if not type_check(param_x, param_t, depth=depth+1):
-                    return False
-            else:
-                return True
-        return False
+        params = list(get_args(dtype))
+        if not params:
+            return lambda value: isinstance(value, org)
+        return _sequence_validator(org, validator(params[0]))
     
     if _new_isinstance(dtype, (Mapping, dict, Dict)):
-        if isinstance(value, org):  # outer level check
-            param_t = list(get_args(dtype))
-            if not param_t:
-                return True
-            elif len(param_t) == 1:
-                param_t.append(Any)
-            elif len(param_t) > 2:
-                param_t = param_t[:2]
-                
-            for param_k, param_v in value.items():
-                if not type_check(param_k, param_t[0], depth=depth+1):
-                    return False
-                if not type_check(param_v, param_t[1], depth=depth+1):
-                    return False
-            else:
-                return True
-        return False
+        params = list(get_args(dtype))
+        if not params:
+            return lambda value: isinstance(value, org)
+        elif len(params) == 1:
+            params.append(Any)
+        return _mapping_validator(org, validator(params[0]), validator(params[1]))
     
     if _new_isinstance(dtype, (int, float)):
-        return isinstance(value, (int, float))
+        return lambda value: isinstance(value, (int, float))
     
     if isinstance(dtype, type):
+        if issubclass(dtype, Enum):
+            return _accept
         org = dtype
     
-    return isinstance(value, org) or issubclass(dtype, Enum)
+    return _instance_validator(org, dtype)
+
+
+@lru_cache(VALIDATOR_CACHE_SIZE)
+def _cached_validator(dtype: Any) -> Validator:
+    return compile_validator(dtype)
+
+
+def validator(dtype: Any) -> Validator:
+    try:
+        return _cached_validator(dtype)
+    except TypeError:
+        return compile_validator(dtype)
+
+
+def type_check(value: Any, dtype: type, depth: int=0) -> bool:
+    return validator(dtype)(value)
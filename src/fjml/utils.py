@@ -2,6 +2,8 @@ from __future__ import annotations
 from typing import (
     Callable,
     Any,
+    Iterable,
+    Iterator,
     Optional,
     Sequence,
     Mapping,
@@ -14,14 +16,17 @@ try:
 except:
     from typing_extensions import NoReturn
 
-from functools import lru_cache, partial
+from functools import lru_cache
+from collections import ChainMap
+from collections.abc import MutableMapping
 import importlib, inspect, os, io, operator
-import errno, dill, base64, copy, types
+import errno, dill, base64, copy, types, hashlib, threading
 
 from flet import Control
 
 from .constants import (
-    NULL, CONTROL_REGISTRY_PATH, EMPTY_REGISTRY_FILE
+    NULL, CONTROL_REGISTRY_PATH, EMPTY_REGISTRY_FILE, LEGACY_CONTROL_REGISTRY_PATH,
+    COMPILE_CACHE_EXTENSION, COMPILE_CACHE_VERSION, TYPE_HINT_CACHE_SIZE
 )
 from .error_types import RegistryFileNotFoundError
 from .object_enums import *
@@ -50,11 +55,69 @@ class ObjectSource:
 def is_sequence_not_str(value: Sequence) -> bool:
     return isinstance(value, Sequence) and not isinstance(value, str)
 
-class Utilities:
+def is_loop_source(value: Any) -> bool:
+    if is_sequence_not_str(value) or hasattr(value, "__aiter__"):
+        return True
+    if callable(getattr(value, "fetch_page", None)):
+        return True
+    return isinstance(value, Iterable) and not isinstance(value, (str, bytes, Mapping))
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class MarkupScan:
+    __slots__ = ("control_types", "refs", "code_refs", "styles", "events", "invalid_keys")
     
-    @staticmethod
-    def mass_any_contains(data: Sequence, obj: Any) -> bool:
-        return any(map(partial(operator.contains, obj), data))
+    def __init__(self) -> NoReturn:
+        self.control_types: set[str] = set()
+        self.refs: set[str] = set()
+        self.code_refs: set[str] = set()
+        self.styles: set[str] = set()
+        self.events: set[tuple[str, str]] = set()
+        self.invalid_keys: set[str] = set()
+
+
+def session_overlay(data: Mapping[str, Any]) -> ChainMap:
+    return ChainMap({}, types.MappingProxyType(data))
+
+
+class LazyModelMap(MutableMapping):
+    __slots__ = ("__data", "__pending", "__decoder", "__lock")
+
+    def __init__(self, data: Mapping[str, Any], decoder: Callable[[str, Any], Any]) -> NoReturn:
+        self.__data: dict[str, Any] = dict(data)
+        self.__pending: set[str] = set(self.__data)
+        self.__decoder: Callable[[str, Any], Any] = decoder
+        self.__lock: threading.Lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__pending:
+            with self.__lock:
+                if key in self.__pending:
+                    self.__data[key] = self.__decoder(key, self.__data[key])
+                    self.__pending.discard(key)
+        return self.__data[key]
+
+    def __setitem__(self, key: str, value: Any) -> NoReturn:
+        self.__data[key] = value
+        self.__pending.discard(key)
+
+    def __delitem__(self, key: str) -> NoReturn:
+        del self.__data[key]
+        self.__pending.discard(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.__data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__data)
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+
+class Utilities:
     
     @staticmethod
     def control_to_registry_interface(
@@ -114,17 +177,19 @@ class Utilities:
     @staticmethod
     def valid_param_filter(settings: dt.ControlSettings, valid_settings: list[str], extra: Union[str, Sequence[str]]) -> dt.ControlSettings:
         x: tuple[str, Any]
+        valid: set[str]
         
         if not (valid_settings and settings):
             return {}
         
+        valid = set(valid_settings)
         if extra:
             if isinstance(extra, str):
-                valid_settings.append(extra)
+                valid.add(extra)
             elif isinstance(extra, Sequence):
-                valid_settings.extend(extra)
+                valid.update(extra)
 
-        return {k:v for k,v in settings.items() if k in valid_settings}
+        return {k:v for k,v in settings.items() if k in valid}
 
     @staticmethod
     def get_keys_with_dict(settings: dt.JsonDict) -> Sequence[str]:
@@ -135,90 +200,38 @@ class Utilities:
         return filter(lambda x: is_sequence_not_str(settings[x]), settings)
 
     @staticmethod
-    def find_values(json_obj: dt.JsonDict, key: str, ignore: Sequence[str] = []) -> set[str]:
-        results: Sequence[str] = set()
+    def scan_markup(json_obj: dt.JsonDict, invalid_keys: Sequence[str] = ()) -> MarkupScan:
+        scan: MarkupScan = MarkupScan()
+        stack: list[Any] = [json_obj]
+        obj: Any
         k: str
         v: Any
-        item: Mapping
-        
-        if isinstance(json_obj, Mapping):
-            for k, v in json_obj.items():
-                if k == key and k not in ignore:
-                    results.add(v)
-                elif isinstance(v, Mapping) or is_sequence_not_str(v):
-                    results.update(Utilities.find_values(v, key, ignore))
-        elif is_sequence_not_str(json_obj):
-            for item in json_obj:
-                results.update(Utilities.find_values(item, key, ignore))
+        collectors: Mapping[str, set[str]] = {
+            ControlKeys.CONTROL_TYPE:scan.control_types,
+            RefsKeys.REFS:scan.refs,
+            RefsKeys.CODE_REFS:scan.code_refs,
+            RefsKeys.STYLING:scan.styles
+        }
+        events: tuple[str, ...] = (EventKeys.FUNC, EventKeys.CALL, EventKeys.EVAL)
         
-        return results
-    
-    @staticmethod
-    def m_find(json_obj: dt.JsonDict, keys: Sequence[str], return_keys: bool = False) -> set[str]:
-        results: set[str] = set()
-        k: str
-        v: Any
-        item: Mapping
-        
-        if return_keys:
-            if isinstance(json_obj, Mapping):
-                for k, v in json_obj.items():
-                    if k in keys:
-                        results.add(k)
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, Mapping):
+                for k, v in obj.items():
+                    if k in invalid_keys:
+                        scan.invalid_keys.add(k)
+                    if isinstance(v, str):
+                        if k in collectors:
+                            collectors[k].add(v)
+                        elif k in events:
+                            scan.events.add((k, v))
                     elif isinstance(v, Mapping) or is_sequence_not_str(v):
-                        results.update(Utilities.m_find(v, keys, return_keys))
-            elif is_sequence_not_str(json_obj):
-                for item in json_obj:
-                    results.update(Utilities.m_find(item, keys, return_keys))
-            
-            return results
-            
-        if isinstance(json_obj, Mapping):
-            for k, v in json_obj.items():
-                if k in keys:
-                    results.add(v)
-                elif isinstance(v, Mapping) or is_sequence_not_str(v):
-                    results.update(Utilities.m_find(v, keys, return_keys))
-        elif isinstance(json_obj, Sequence):
-            for item in json_obj:
-                results.update(Utilities.m_find(item, keys, return_keys))
-
-        return results
+                        stack.append(v)
+            elif is_sequence_not_str(obj):
+                stack.extend(obj)
+        
+        return scan
     
-    @staticmethod
-    def find_key_with_values(json_obj: dt.JsonDict, key_vals: Mapping[str, tuple[Any]], return_keys: bool = False) -> set[str]:
-        results: set[str] = set()
-        k: str
-        v: Any
-        item: Mapping
-
-        if return_keys:
-            if isinstance(json_obj, Mapping):
-                for k, v in json_obj.items():
-                    res = key_vals.get(k, NULL)
-                    if res != NULL and v in res:
-                        results.add(k)
-                    elif isinstance(v, Mapping) or is_sequence_not_str(v):
-                        results.update(Utilities.find_key_with_values(v, key_vals, return_keys))
-            elif is_sequence_not_str(json_obj):
-                for item in json_obj:
-                    results.update(Utilities.find_key_with_values(item, key_vals, return_keys))
-
-            return results
-            
-        if isinstance(json_obj, Mapping):
-            for k, v in json_obj.items():
-                res = key_vals.get(k, NULL)
-                if res != NULL and v in res:
-                    results.add(v)
-                elif isinstance(v, Mapping) or is_sequence_not_str(v):
-                    results.update(Utilities.find_key_with_values(v, key_vals, return_keys))
-        elif is_sequence_not_str(json_obj):
-            for item in json_obj:
-                results.update(Utilities.find_key_with_values(item, key_vals, return_keys))
-
-        return results
-
     @staticmethod
     def get_init_parameters(instance: Any) -> Mapping:
         x: tuple[str, Any]
@@ -294,17 +307,6 @@ class Utilities:
             return RefsKeys.CODE_REFS
         return ""
 
-    @staticmethod
-    def parse_reference(cls: Renderer, content: Mapping) -> Any:
-        if not isinstance(content, Mapping):
-            return
-        
-        return cls.get_ref(
-            Utilities.search_and_sanitize(
-                content, cls.depth_count, cls.loop_values
-            )
-        )
-
     @staticmethod
     def sanitize(data: Mapping, depth_count: int, loop_values: Sequence) -> int:
         if Utilities.validate_index(data, depth_count) == NULL:
@@ -322,7 +324,7 @@ class Utilities:
     @staticmethod
     def process_loop_iterator(
         cls: Renderer, iterator_value: Union[Mapping, Sequence]
-    ) -> Sequence:
+    ) -> Union[Iterable, dt.PagedSource]:
         
         if is_sequence_not_str(iterator_value):
             return iterator_value
@@ -343,9 +345,11 @@ class Utilities:
             if RefsKeys.REFS in iterator_value:
                 return []
             
-            result: Sequence = cls.get_ref(iterator_value)
+            result: Any = cls.get_ref(iterator_value)
             
-            if not is_sequence_not_str(result):
+            if callable(result) and not is_loop_source(result):
+                result = result()
+            if not is_loop_source(result):
                 return []
             
             return result
@@ -353,60 +357,42 @@ class Utilities:
         return []
 
 
+class CompileCacheHandler:
+    
     @staticmethod
-    def search_and_sanitize(
-        data: Union[Mapping, Sequence],
-        depth_count: int,
-        loop_values: Sequence,
-    ) -> Union[Mapping, Sequence]:
-        result: Union[Mapping, Sequence]
-        key: str
-        item: Any
-        value: Any
-        
-        if isinstance(data, Mapping):
-            result = {}
-            for key, value in data.items():
-                if isinstance(value, Mapping):
-                    if value.get(ControlKeys.CONTROL_TYPE, "") == LoopKeys.LOOP_INDEX:
-                        new_value = Utilities.sanitize(value, depth_count, loop_values)
-                        result[key] = new_value
-                    else:
-                        result[key] = Utilities.search_and_sanitize(value, depth_count, loop_values)
-                elif is_sequence_not_str(value):
-                    result[key] = [
-                        Utilities.search_and_sanitize(item, depth_count, loop_values)
-                        for item in value
-                    ]
-                else:
-                    result[key] = value
-            return result
-        elif is_sequence_not_str(data):
-            return [Utilities.search_and_sanitize(item, depth_count, loop_values) for item in data]
-        else:
-            return data
-
-class CompiledFileHandler:
+    def cache_path(file_path: str) -> str:
+        return f"{file_path}{COMPILE_CACHE_EXTENSION}"
     
     @staticmethod
-    def save(file_path: str, data: dt.CompiledModel) -> NoReturn:
+    def save(file_path: str, data: dt.CompileCacheModel) -> NoReturn:
         file: io.BufferedWriter
-        with open(file_path, "wb") as file:
+        with open(CompileCacheHandler.cache_path(file_path), "wb") as file:
             dill.dump(data, file)
     
     @staticmethod
-    def load(file_path: str) -> dt.CompiledModel:
+    def load(file_path: str) -> Optional[dt.CompileCacheModel]:
         file: io.BufferedReader
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), file_path)
-        with open(file_path, "rb") as file:
-            return dill.load(file)
+        data: dt.CompileCacheModel
+        path: str = CompileCacheHandler.cache_path(file_path)
+        
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as file:
+                data = dill.load(file)
+        except Exception:
+            return None
+        
+        if getattr(data, "version", None) != COMPILE_CACHE_VERSION:
+            return None
+        return data
 
 
 class TypeHintSerializer:
     
-    @classmethod
-    def decode(cls, data: str) -> dt.TypeHints:
+    @staticmethod
+    @lru_cache(maxsize=TYPE_HINT_CACHE_SIZE)
+    def decode(data: str) -> type:
         return dill.loads(
             base64.b64decode(data)
         )
@@ -425,7 +411,7 @@ class TypeHintSerializer:
     
     @classmethod
     def deserialize(cls, data: Mapping[str, str]) -> dt.TypeHints:
-        return dict(map(lambda x: (x[0], cls.decode(x[1])), data.items()))
+        return LazyModelMap(data, lambda name, value: cls.decode(value))
     
     @staticmethod
     def string_to_any(dtype: Union[type, str]) -> type:
@@ -433,22 +419,103 @@ class TypeHintSerializer:
 
 
 class RegistryFileOperations:
+    
+    __lock: threading.Lock = threading.Lock()
+    __registry: Optional[dt.ControlRegistryJsonScheme] = None
+    __stamp: Optional[tuple[int, int, int]] = None
 
     @classmethod
     def load_file(cls) -> dt.ControlRegistryJsonScheme:
+        stamp: Optional[tuple[int, int, int]] = cls.file_stamp()
+        
+        if stamp is not None and stamp == cls.__stamp:
+            return cls.__registry
+        
+        with cls.__lock:
+            stamp = cls.file_stamp()
+            if stamp is None or stamp != cls.__stamp:
+                cls.__registry = cls.__read_file()
+                cls.__stamp = cls.file_stamp()
+            return cls.__registry
+    
+    @classmethod
+    def __read_file(cls) -> dt.ControlRegistryJsonScheme:
         registry: Union[io.BufferedReader, io.BufferedWriter]
+        data: dt.JsonDict
+        
+        cls.move_legacy_file()
         if not os.path.exists(CONTROL_REGISTRY_PATH):
             with open(CONTROL_REGISTRY_PATH, "wb") as registry:
                 dill.dump(EMPTY_REGISTRY_FILE, registry, dill.HIGHEST_PROTOCOL)
         with open(CONTROL_REGISTRY_PATH, "rb") as registry:
-            return dill.load(registry)
-        raise RegistryFileNotFoundError()
+            data = dill.load(registry)
+        
+        if ControlRegKeys.CONTROL_TYPES in data:
+            data = cls.migrate(data)
+            try:
+                cls.write_file(data)
+            except OSError:
+                pass
+        
+        return cls.freeze(data)
+    
+    @staticmethod
+    def freeze(data: dt.JsonDict) -> dt.ControlRegistryJsonScheme:
+        return types.MappingProxyType(
+            {ControlRegKeys.CONTROLS:types.MappingProxyType(dict(data[ControlRegKeys.CONTROLS]))}
+        )
+    
+    @staticmethod
+    def file_stamp() -> Optional[tuple[int, int, int]]:
+        stat: os.stat_result
+        try:
+            stat = os.stat(CONTROL_REGISTRY_PATH)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+    
+    @classmethod
+    def clear_cache(cls) -> NoReturn:
+        with cls.__lock:
+            cls.__registry = None
+            cls.__stamp = None
+    
+    @classmethod
+    def move_legacy_file(cls) -> NoReturn:
+        if CONTROL_REGISTRY_PATH == LEGACY_CONTROL_REGISTRY_PATH:
+            return
+        if os.path.exists(LEGACY_CONTROL_REGISTRY_PATH):
+            os.replace(LEGACY_CONTROL_REGISTRY_PATH, CONTROL_REGISTRY_PATH)
+    
+    @staticmethod
+    def migrate(data: dt.JsonDict) -> dt.ControlRegistryJsonScheme:
+        name: str
+        control: dt.ControlJsonScheme
+        controls: Mapping[str, dt.ControlJsonScheme] = {
+            control[ControlRegKeys.NAME]:control
+            for control in data[ControlRegKeys.CONTROL_TYPES]
+        }
+        
+        return {
+            ControlRegKeys.CONTROLS:{
+                name:controls[name] for name in data[ControlRegKeys.CONTROLS]
+                if name in controls
+            }
+        }
 
     @classmethod
     def save_file(cls, file_data: dt.JsonDict) -> NoReturn:
+        with cls.__lock:
+            cls.write_file(file_data)
+            cls.__registry = cls.freeze(file_data)
+            cls.__stamp = cls.file_stamp()
+    
+    @staticmethod
+    def write_file(file_data: dt.JsonDict) -> NoReturn:
         registry: io.BufferedWriter
         with open(CONTROL_REGISTRY_PATH, "wb") as registry:
-            return dill.dump(file_data, registry, dill.HIGHEST_PROTOCOL)
+            return dill.dump(
+                {ControlRegKeys.CONTROLS:dict(file_data[ControlRegKeys.CONTROLS])}, 
+                registry, dill.HIGHEST_PROTOCOL
+            )
         raise RegistryFileNotFoundError()
-
-
@@ -0,0 +1,28 @@
+from benchmarks.generator import ProgramShape, ProgramGenerator
+from benchmarks.run import BenchmarkSuite, compare
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+
+class TestBenchmark:
+
+    def test_generator(self) -> NoReturn:
+        files: dict = ProgramGenerator(ProgramShape(controls=10, imports=2)).files()
+
+        assert len(files) == 4
+        assert sum(len(data["Controls"]) for data in files.values() if "Controls" in data) == 10
+
+    def test_suite(self, tmp_path) -> NoReturn:
+        report: dict = BenchmarkSuite(
+            ProgramShape(controls=8, routes=2, loop_depth=2, loop_size=2), 
+            repeat=1, path=str(tmp_path)
+        ).run()
+
+        assert set(report["stages"]) == {
+            "compile", "load", "initialize", "render:/", "render:/route_1", "render:all"
+        }
+        assert report["stages"]["compile"]["peak_memory_bytes"] > 0
+        assert not compare(report, report, 1.0)
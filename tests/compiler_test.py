@@ -0,0 +1,133 @@
+import os, json
+
+from src.fjml import Compiler, utils, error_types as err
+from benchmarks.generator import ProgramShape, ProgramGenerator
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+import pytest
+
+
+MAIN_SOURCE: str = "<ui.json>"
+
+
+def generate(path, **shape) -> str:
+    return ProgramGenerator(ProgramShape(**dict(dict(controls=8, routes=2, imports=2), **shape))).write(str(path))
+
+
+def compile_program(path: str, **options) -> Compiler:
+    compiler: Compiler = Compiler(path, os.path.join(path, "compiled.fjml"), **options)
+    compiler.compile()
+    return compiler
+
+
+def edit(path: str, name: str, func) -> NoReturn:
+    data: dict
+
+    with open(os.path.join(path, name), "r") as file:
+        data = json.load(file)
+    func(data)
+    with open(os.path.join(path, name), "w") as file:
+        json.dump(data, file)
+
+
+class TestIncremental:
+
+    def test_cached_sources(self, tmp_path) -> NoReturn:
+        path: str = generate(tmp_path)
+
+        assert len(compile_program(path, incremental=True).source_data) == 3
+        assert not compile_program(path, incremental=True).source_data
+
+    def test_dependents(self, tmp_path) -> NoReturn:
+        path: str = generate(tmp_path)
+        compile_program(path, incremental=True)
+        edit(
+            path, os.path.join("extra", "file_0.json"),
+            lambda data: data["Controls"][0]["settings"].update(padding=9)
+        )
+
+        compiler: Compiler = compile_program(path, incremental=True)
+        assert set(compiler.source_data) == {"file_0.json", MAIN_SOURCE}
+        assert compiler.parsed_controls["control_0"].settings["padding"] == 9
+
+    def test_registry_change(self, tmp_path, monkeypatch) -> NoReturn:
+        path: str = generate(tmp_path)
+        registry: dict = utils.RegistryFileOperations.load_file()
+        compile_program(path, incremental=True)
+
+        monkeypatch.setattr(
+            utils.RegistryFileOperations, "load_file",
+            classmethod(lambda cls: {"Controls":dict(
+                registry["Controls"],
+                Text=dict(registry["Controls"]["Text"], valid_settings=["value"])
+            )})
+        )
+        compiler: Compiler = compile_program(path, incremental=True)
+        text = compiler.parsed_controls["control_0"].settings["content"].settings["controls"][0]
+        assert len(compiler.source_data) == 2
+        assert "size" not in text.settings
+
+    def test_type_hint_change(self, tmp_path, monkeypatch) -> NoReturn:
+        path: str = generate(tmp_path)
+        registry: dict = utils.RegistryFileOperations.load_file()
+        text: dict = registry["Controls"]["Text"]
+        compile_program(path, incremental=True)
+        
+        monkeypatch.setattr(
+            utils.RegistryFileOperations, "load_file",
+            classmethod(lambda cls: {"Controls":dict(
+                registry["Controls"],
+                Text=dict(text, type_hints=dict(text["type_hints"], size=text["type_hints"]["value"]))
+            )})
+        )
+        assert len(compile_program(path, incremental=True).source_data) == 2
+    
+    def test_strict_option(self, tmp_path) -> NoReturn:
+        path: str = generate(tmp_path)
+        edit(
+            path, os.path.join("extra", "file_1.json"),
+            lambda data: data["Controls"][0]["settings"].update(padding="wide")
+        )
+
+        with pytest.warns(UserWarning, match="padding"):
+            compile_program(path, incremental=True)
+        with pytest.raises(err.InvalidTypeError):
+            compile_program(path, incremental=True, strict=True)
+
+
+class TestParallel:
+
+    def test_same_output(self, tmp_path) -> NoReturn:
+        path: str = generate(tmp_path, imports=6)
+        programs: list = []
+
+        for workers in (1, 4):
+            compile_program(path, workers=workers)
+            with open(os.path.join(path, "compiled.fjml"), "rb") as file:
+                programs.append(file.read())
+
+        assert programs[0] == programs[1]
+
+    def test_worker_warnings(self, tmp_path) -> NoReturn:
+        path: str = generate(tmp_path, imports=4)
+        edit(
+            path, os.path.join("extra", "file_2.json"),
+            lambda data: data["Controls"][0]["settings"].update(padding="wide")
+        )
+        
+        with pytest.warns(UserWarning, match="padding"):
+            compile_program(path, workers=4)
+        with pytest.raises(err.InvalidTypeError):
+            compile_program(path, workers=4, strict=True)
+    
+    def test_control_classes(self, tmp_path) -> NoReturn:
+        path: str = generate(tmp_path, imports=4)
+        compiler: Compiler = compile_program(path, workers=4)
+        nested = compiler.parsed_controls["control_0"].settings["content"]
+        
+        assert compiler.parsed_controls["control_0"].control is compiler.controls["Container"]
+        assert nested.control is compiler.controls[nested.control_name]
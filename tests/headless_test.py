@@ -0,0 +1,705 @@
+import os, json, time, asyncio, threading
+from typing import Any, Callable
+
+from src.fjml import (
+    load_program, Compiler, HeadlessPage, Instrumentation, RingBufferSink, 
+    JsonLinesSink, ChromeTraceSink, CustomResponsiveRow, data_types as dt, error_types as err
+)
+from src.fjml.program_format import CompiledFileHandler, CompiledProgram
+from src.fjml import operation_classes as opc
+from benchmarks.generator import ProgramShape, ProgramGenerator
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+import pytest
+import flet as ft
+
+
+PROGRAM: str = os.path.join("tests", "ui_test_program")
+WINDOWED_PROGRAM: dict = {
+    "Header":{
+        "program_name":"Windowed",
+        "import_folder":"extra",
+        "style_sheet_name":"style_sheet",
+        "action_import":{"import":"BenchActions", "from":"benchmarks.actions"}
+    },
+    "Imports":[],
+    "Controls":[],
+    "UI":[
+        {
+            "route":"/",
+            "settings":{
+                "controls":[
+                    {
+                        "control_type":"ListView",
+                        "settings":{
+                            "item_extent":20,
+                            "controls":{
+                                "control_type":"loop",
+                                "depth":1,
+                                "iterator":{"range":[10000]},
+                                "window":{"size":10, "buffer":5, "limit":30},
+                                "control":{
+                                    "control_type":"Text",
+                                    "settings":{
+                                        "data":{"control_type":"loop_index", "idx":[0, 0]}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                ]
+            }
+        }
+    ]
+}
+
+
+@pytest.fixture(scope="module")
+def compiled(tmp_path_factory) -> str:
+    path: str = str(tmp_path_factory.mktemp("headless") / "compiled.fjml")
+    Compiler(PROGRAM, path).compile()
+    return path
+
+
+
+def text_loop(iterator: dict, **options) -> dict:
+    return dict(
+        {
+            "control_type":"loop",
+            "depth":1,
+            "iterator":iterator,
+            "control":{
+                "control_type":"Text",
+                "settings":{"data":{"control_type":"loop_index", "idx":[0, 0]}}
+            }
+        }, **options
+    )
+
+
+class Rows(dt.PagedSource):
+
+    def __init__(self, count: int) -> NoReturn:
+        self.count: int = count
+        self.calls: list = []
+
+    def fetch_page(self, offset: int, limit: int) -> list:
+        self.calls.append((offset, limit))
+        return list(range(offset, min(offset + limit, self.count)))
+
+
+class SourceActions(dt.EventContainer):
+
+    def _importer(self) -> NoReturn:
+        async def stream():
+            for i in range(120):
+                yield i
+
+        async def label() -> ft.Text:
+            await asyncio.sleep(0)
+            return ft.Text("async")
+
+        def blocking() -> ft.Text:
+            time.sleep(0.01)
+            return ft.Text(threading.current_thread().name)
+
+        self.object_bucket.set_object("label", label)
+        self.object_bucket.set_object("blocking", blocking, offload=True, timeout=5)
+        self.clicked = []
+        self.generated = (i for i in range(10 ** 9))
+        self.streamed = stream()
+        self.paged = Rows(1000)
+
+    def _page_setup(self) -> NoReturn:
+        ...
+
+    def click(self, e: Any) -> NoReturn:
+        self.clicked.append(threading.current_thread().name)
+
+    def rows(self) -> Any:
+        yield from range(3)
+
+
+SOURCE_PROGRAM: dict = dict(
+    WINDOWED_PROGRAM,
+    Header=dict(
+        WINDOWED_PROGRAM["Header"], 
+        action_import={"import":"SourceActions", "from":"tests.headless_test"}
+    ),
+    UI=[
+        {
+            "route":"/",
+            "settings":{
+                "controls":[
+                    {"control_type":"Column", "settings":{"controls":text_loop(
+                        {"code_refs":"generated"}, max_items=5
+                    )}},
+                    {"control_type":"Column", "settings":{"controls":text_loop(
+                        {"code_refs":"streamed"}
+                    )}},
+                    {"control_type":"Column", "settings":{"controls":text_loop(
+                        {"code_refs":"paged"}, max_items=250
+                    )}},
+                    {"control_type":"Column", "settings":{"controls":text_loop(
+                        {"code_refs":"rows"}
+                    )}}
+                ]
+            }
+        }
+    ]
+)
+
+
+def write_program(path, program: dict, **options) -> str:
+    os.makedirs(path / "extra")
+    with open(path / "ui.json", "w") as file:
+        json.dump(program, file)
+    with open(path / "style_sheet.style.json", "w") as file:
+        json.dump({}, file)
+    
+    Compiler(str(path), str(path / "compiled.fjml"), **options).compile()
+    return str(path / "compiled.fjml")
+
+
+def static_program(path) -> str:
+    ProgramGenerator(ProgramShape(controls=4, routes=2, imports=0)).write(str(path))
+    Compiler(str(path), str(path / "compiled.fjml")).compile()
+    return str(path / "compiled.fjml")
+
+
+def scroll_event(control: ft.Control, pixels: float, extent: float) -> ft.ControlEvent:
+    return ft.ControlEvent(
+        target="", name="scroll", control=control, page=None,
+        data=json.dumps({
+            "t":"update", "p":pixels, "minse":0, "maxse":extent,
+            "vd":100, "sd":None, "dir":None, "os":None, "v":None
+        })
+    )
+
+
+class TestHeadless:
+
+    def test_routes(self, compiled: str) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        load_program(compiled, page)
+        page.go("/")
+        page.go("/route_test")
+
+        assert page.route_history == ["/", "/route_test"]
+        assert [view.route for view in page.views] == ["/", "/route_test"]
+        assert page.update_count > 2
+        assert page.tree[-1]["control"] == "View"
+        assert page.control_count > len(page.views)
+
+        page.pop_view()
+        assert [view.route for view in page.views] == ["/"]
+        page.close()
+
+    def test_storage(self) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        page.client_storage.set("theme", "dark")
+
+        assert page.client_storage.contains_key("theme")
+        assert page.client_storage.get_keys("th") == ["theme"]
+        page.session.remove("missing")
+        page.close()
+
+    def test_windowed_loop(self, tmp_path) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        
+        load_program(write_program(tmp_path, WINDOWED_PROGRAM), page)
+        page.go("/")
+        
+        view: ft.ListView = page.views[0].controls[0]
+        scroll: Callable = view.on_scroll.get_handler()
+        deltas: list = []
+        scroll_to: Callable = view.scroll_to
+        view.page = page
+        view.scroll_to = lambda **kwargs: (deltas.append(kwargs["delta"]), scroll_to(**kwargs))
+        assert [text.data for text in view.controls] == list(range(15))
+        
+        page.dispatch(scroll, scroll_event(view, 280, 300))
+        assert len(view.controls) == 25 and view.controls[-1].data == 24
+        assert not deltas
+        
+        for _ in range(3):
+            page.dispatch(scroll, scroll_event(view, 480, 500))
+        assert len(view.controls) <= 30 and view.controls[-1].data == 54
+        assert view.controls[0].data > 0
+        assert sum(deltas) == -view.controls[0].data * view.item_extent
+        
+        page.dispatch(scroll, scroll_event(view, 0, 500))
+        assert sum(deltas) == -view.controls[0].data * view.item_extent
+        page.close()
+
+    def test_lazy_sources(self, tmp_path) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        
+        load_program(write_program(tmp_path, SOURCE_PROGRAM), page)
+        page.go("/")
+        page.join()
+        
+        columns: list = page.views[0].controls
+        assert [text.data for text in columns[0].controls] == list(range(5))
+        assert [text.data for text in columns[1].controls] == list(range(120))
+        assert [text.data for text in columns[2].controls] == list(range(250))
+        assert [text.data for text in columns[3].controls] == list(range(3))
+        
+        page.on_route_change.__self__.view_cache.invalidate()
+        page.go("/")
+        page.join()
+        assert [text.data for text in page.views[0].controls[3].controls] == list(range(3))
+        page.close()
+
+    def test_literal_validation(self, tmp_path) -> NoReturn:
+        program: dict = dict(WINDOWED_PROGRAM, UI=[
+            {
+                "route":"/",
+                "settings":{
+                    "controls":[
+                        {"control_type":"Text", "settings":{"value":"text", "size":"big"}}
+                    ]
+                }
+            }
+        ])
+        
+        with pytest.warns(UserWarning, match="size"):
+            load_program(write_program(tmp_path / "loose", program), HeadlessPage())
+        with pytest.raises(err.InvalidTypeError):
+            write_program(tmp_path / "strict", program, strict=True)
+
+    def test_eval_sessions(self, compiled: str) -> NoReturn:
+        pages: list = [HeadlessPage(), HeadlessPage()]
+        backends: list = [
+            load_program(compiled, page).on_route_change.__self__ for page in pages
+        ]
+        
+        assert backends[0].eval_locals.evaluate("lambda: self")() is backends[0]
+        assert backends[1].eval_locals.evaluate("lambda: self")() is backends[1]
+        
+        backends[0].eval_locals.add("shared", 1)
+        assert "shared" not in backends[1].eval_locals.namespace
+        for page in pages:
+            page.close()
+    
+    def test_eval_namespace(self) -> NoReturn:
+        eval_locals: opc.EvalLocalData = opc.EvalLocalData(scope={"ft":ft})
+        
+        eval_locals.mass_add({"count":2, "ft":None})
+        assert eval_locals.evaluate("(total := count + 1)") == 3
+        assert eval_locals.evaluate("lambda: [count * i for i in range(2)]")() == [0, 2]
+        assert eval_locals.data == {"count":2, "ft":None}
+        
+        eval_locals.mass_delete(["count", "ft"])
+        assert eval_locals.evaluate("ft") is ft and not eval_locals.data
+        with pytest.raises(NameError):
+            eval_locals.evaluate("count")
+
+    def test_session_isolation(self, compiled: str) -> NoReturn:
+        program: CompiledProgram = CompiledFileHandler.load_shared(compiled)
+        pages: list = [HeadlessPage(), HeadlessPage()]
+        backends: list = [
+            load_program(compiled, page).on_route_change.__self__ for page in pages
+        ]
+        closure: list = list(program.dependencies.get("/"))
+        
+        backends[0].ui["/extra"] = backends[0].ui["/"]
+        backends[0].controls["extra"] = backends[0].controls["back_btn"]
+        backends[0].dependency_bucket.add_refs("/", ["extra"], update=True)
+        assert backends[0].dependency_bucket.get("/") == ["extra", *closure]
+        
+        for data in (backends[1], program):
+            assert "/extra" not in data.ui
+            assert "extra" not in data.controls
+        for dependencies in (backends[1].dependency_bucket, program.dependencies):
+            assert dependencies.get("/") == closure
+            assert "extra" not in dependencies.reverse
+            assert "extra" not in dependencies.get_data["/"]
+        for page in pages:
+            page.close()
+
+    def test_async_calls(self, tmp_path) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        program: dict = dict(SOURCE_PROGRAM, UI=[
+            {
+                "route":"/",
+                "settings":{
+                    "controls":[
+                        {
+                            "control_type":"Container", 
+                            "settings":{
+                                "content":{"call":"label"},
+                                "on_click":{"func":"click", "offload":True, "timeout":1}
+                            }
+                        },
+                        {"control_type":"Row", "settings":{"controls":[
+                            {"call":"blocking"}
+                        ]}}
+                    ]
+                }
+            }
+        ])
+        
+        load_program(write_program(tmp_path, program), page)
+        page.go("/")
+        page.join()
+        
+        container, row = page.views[0].controls
+        assert container.content.value == "async"
+        assert len(row.controls) == 1
+        assert row.controls[0].value.startswith("fjml-call")
+        
+        page.dispatch(container.on_click, ft.ControlEvent("", "click", "", container, None))
+        backend: Any = page.on_route_change.__self__
+        assert backend.clicked[0].startswith("fjml-call")
+        page.close()
+
+    def test_instrumentation(self, tmp_path) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        program: dict = dict(SOURCE_PROGRAM, UI=[
+            {
+                "route":"/",
+                "settings":{
+                    "controls":[
+                        {"control_type":"Container", "settings":{"on_click":{"func":"click"}}}
+                    ]
+                }
+            }
+        ])
+        path: str = write_program(tmp_path, program)
+        buffer: RingBufferSink = RingBufferSink(100)
+        backend: Any = load_program(path, page).on_route_change.__self__
+        
+        assert not backend.instrumentation.enabled
+        backend.instrumentation.add_sink(buffer)
+        backend.instrumentation.add_sink(JsonLinesSink(str(tmp_path / "trace.jsonl")))
+        backend.instrumentation.add_sink(ChromeTraceSink(str(tmp_path / "trace.json")))
+        page.go("/")
+        container: ft.Container = page.views[0].controls[0]
+        page.dispatch(container.on_click, ft.ControlEvent("", "click", "", container, None))
+        backend.instrumentation.close()
+        
+        route, = buffer.select("route")
+        assert route.name == "/" and route.data["views"] == 1 and route.data["updates"] >= 1
+        assert {record.name for record in buffer.select("control")} >= {"View", "Container"}
+        assert all(
+            record.data["parse"] + record.data["construct"] == pytest.approx(record.duration)
+            for record in buffer.select("control")
+        )
+        assert [record.data["event"] for record in buffer.select("event")] == ["on_click"]
+        with open(tmp_path / "trace.jsonl") as file:
+            assert len(file.readlines()) == len(buffer.records)
+        with open(tmp_path / "trace.json") as file:
+            assert len(json.load(file)) == len(buffer.records)
+        
+        write_program(tmp_path / "traced", program, instrumentation=Instrumentation([buffer]))
+        assert [record.name for record in buffer.select("compile")] == ["load", "parse", "save"]
+        page.close()
+
+    def test_view_cache(self, compiled: str, tmp_path) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        backend: Any = load_program(static_program(tmp_path), page).on_route_change.__self__
+        page.go("/")
+        assert not len(backend.view_cache)
+        
+        backend.view_cache.resize(size=16)
+        page.go("/")
+        home: ft.View = page.views[0]
+        page.go("/route_1")
+        test_view: ft.View = page.views[-1]
+        page.go("/")
+        
+        assert page.views[-1] is home and "/route_1" in backend.view_cache
+        page.go("/route_1")
+        assert page.views[-1] is test_view
+        
+        backend.view_cache.invalidate("/route_1")
+        page.go("/route_1")
+        assert page.views[-1] is not test_view
+        
+        backend.view_cache.resize(size=1)
+        assert len(backend.view_cache) == 1 and "/route_1" in backend.view_cache
+        backend.view_cache.resize(budget=0)
+        page.go("/")
+        assert len(backend.view_cache) == 0 and backend.view_cache.usage == 0
+        page.close()
+        
+        page = HeadlessPage()
+        backend = load_program(compiled, page).on_route_change.__self__
+        backend.view_cache.resize(size=16)
+        page.go("/")
+        home = page.views[0]
+        page.go("/")
+        assert page.views[0] is not home and not len(backend.view_cache)
+        page.close()
+    
+    def test_view_size(self) -> NoReturn:
+        small: int = opc.ViewCache.measure(ft.View("/", [ft.Column([ft.Text("a")])]))
+        large: int = opc.ViewCache.measure(ft.View("/", [ft.Column([ft.Text("a" * 100001)])]))
+        
+        assert small > 0 and large - small >= 100000
+
+    def test_set_view(self, tmp_path) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        backend: Any = load_program(static_program(tmp_path), page).on_route_change.__self__
+        backend.view_cache.resize(size=16)
+        page.go("/route_1")
+        view: ft.View = page.views[-1]
+        page.go("/")
+        assert "/route_1" in backend.view_cache
+        
+        backend.view_operations.set_view("/route_1", {
+            "controls":[{"refs":"control_0"}, {"control_type":"Text", "settings":{"value":"new"}}]
+        })
+        assert "/route_1" not in backend.view_cache
+        page.go("/route_1")
+        assert page.views[-1] is not view
+        assert page.views[-1].controls[0] is backend.control_0
+        assert page.views[-1].controls[1].value == "new"
+        
+        with pytest.raises(err.InvalidTypeError):
+            backend.view_operations.set_view("/route_1", [])
+        page.close()
+
+    def test_route_cancellation(self, tmp_path) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        started: threading.Event = threading.Event()
+        release: threading.Event = threading.Event()
+        buffer: RingBufferSink = RingBufferSink()
+        program: dict = dict(SOURCE_PROGRAM, UI=[
+            {"route":"/", "settings":{"controls":[{"control_type":"Text", "settings":{"value":"home"}}]}},
+            {"route":"/slow", "settings":{"controls":[
+                {"control_type":"Text", "settings":{"value":{"call":"gate"}}},
+                {"control_type":"Text", "settings":{"value":"after"}}
+            ]}}
+        ])
+        backend: Any = load_program(write_program(tmp_path, program), page).on_route_change.__self__
+        
+        def gate() -> str:
+            started.set()
+            release.wait(5)
+            return "slow"
+        
+        async def navigate() -> NoReturn:
+            page.route = "/slow"
+            first: asyncio.Future = asyncio.ensure_future(
+                page.on_route_change(ft.RouteChangeEvent("/slow"))
+            )
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            page.route = "/"
+            second: asyncio.Future = asyncio.ensure_future(
+                page.on_route_change(ft.RouteChangeEvent("/"))
+            )
+            await asyncio.sleep(0.01)
+            release.set()
+            await asyncio.gather(first, second)
+        
+        backend.object_bucket.set_object("gate", gate)
+        backend.instrumentation.add_sink(buffer)
+        page.loop.run_until_complete(navigate())
+        
+        assert [view.route for view in page.views] == ["/"]
+        assert page.views[0].controls[0].value == "home"
+        assert [(record.name, record.data.get("cancelled", False)) for record in buffer.select("route")] == [
+            ("/slow", True), ("/", False)
+        ]
+        assert backend.update_count == 2
+        
+        page.go("/slow")
+        assert [control.value for control in page.views[-1].controls] == ["slow", "after"]
+        page.close()
+
+    def test_cancelled_build_controls(self, tmp_path) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        started: threading.Event = threading.Event()
+        release: threading.Event = threading.Event()
+        seen: list = []
+        program: dict = dict(SOURCE_PROGRAM, Controls=[
+            {"var_name":"home_label", "control_type":"Text", "settings":{"value":"home"}},
+            {"var_name":"a_marker", "control_type":"Text", "settings":{"value":"marker"}},
+            {"var_name":"gated", "control_type":"Text", "settings":{"value":{"call":"gate"}}}
+        ], UI=[
+            {"route":"/", "settings":{"controls":[{"refs":"home_label"}]}},
+            {"route":"/slow", "settings":{"controls":[{"refs":"a_marker"}, {"refs":"gated"}]}}
+        ])
+        backend: Any = load_program(write_program(tmp_path, program), page).on_route_change.__self__
+        
+        def gate() -> str:
+            started.set()
+            release.wait(5)
+            return "slow"
+        
+        async def navigate() -> NoReturn:
+            page.route = "/slow"
+            first: asyncio.Future = asyncio.ensure_future(
+                page.on_route_change(ft.RouteChangeEvent("/slow"))
+            )
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            seen.extend([backend.home_label, backend.a_marker, backend.gated])
+            page.route = "/"
+            second: asyncio.Future = asyncio.ensure_future(
+                page.on_route_change(ft.RouteChangeEvent("/"))
+            )
+            await asyncio.sleep(0.01)
+            release.set()
+            await asyncio.gather(first, second)
+        
+        backend.object_bucket.set_object("gate", gate)
+        backend.view_cache.resize(size=16)
+        page.go("/")
+        home: ft.Text = backend.home_label
+        page.loop.run_until_complete(navigate())
+        
+        assert seen == [home, None, None]
+        assert page.views[0].controls == [home] and backend.home_label is home
+        assert backend.a_marker is None and backend.gated is None
+        page.close()
+
+    def test_update_batching(self, compiled: str) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        backend: Any = load_program(compiled, page).on_route_change.__self__
+        count: int = page.update_count
+        
+        async def mutate() -> int:
+            backend.update()
+            backend.update()
+            return page.update_count
+        
+        assert page.loop.run_until_complete(mutate()) == count
+        page.join()
+        assert page.update_count == count + 1
+        
+        with backend.batch():
+            backend.update()
+            with backend.batch():
+                backend.update()
+            assert page.update_count == count + 1
+        assert page.update_count == count + 2
+        
+        backend.update()
+        assert page.update_count == count + 3
+        page.close()
+
+    def test_threaded_batching(self, compiled: str) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        backend: Any = load_program(compiled, page).on_route_change.__self__
+        coalescer: Any = backend.updates
+        
+        def mutate() -> NoReturn:
+            for _ in range(500):
+                with coalescer:
+                    coalescer.request()
+        
+        threads: list = [threading.Thread(target=mutate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        page.join()
+        
+        assert coalescer.depth == 0 and not coalescer.active
+        assert not coalescer.pending
+        page.close()
+
+    def test_responsive_row_resize(self) -> NoReturn:
+        resized: list = []
+        text: ft.Text = ft.Text("a", col={"xs":6})
+        row: CustomResponsiveRow = CustomResponsiveRow(
+            [text], on_resize=lambda e: resized.append(e.width)
+        )
+        page: Any = type("Page", (), {"run_thread":lambda self, handler, *args: handler(*args)})()
+        event: Callable = lambda width: ft.ControlEvent(
+            "", "resize", json.dumps({"w":width, "h":300}), row, page
+        )
+        
+        asyncio.run(row.on_resize.get_handler()(event(500)))
+        asyncio.run(row.on_resize.get_handler()(event(500)))
+        
+        assert row.size == (500, 300) and resized == [500]
+        assert text.width == pytest.approx((500 - 10) * 0.5 - 20)
+        assert row.content.content.controls[0] is text
+
+    def test_loop_not_blocked(self, tmp_path) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        started: threading.Event = threading.Event()
+        release: threading.Event = threading.Event()
+        pending: list = []
+        home: dict = WINDOWED_PROGRAM["UI"][0]
+        program: dict = dict(WINDOWED_PROGRAM, Controls=[
+            {"var_name":"clock", "control_type":"Text", "settings":{"value":{"code_refs":"now"}}}
+        ], UI=[
+            {"route":"/", "settings":{"controls":[*home["settings"]["controls"], {"refs":"clock"}]}},
+            {"route":"/slow", "settings":{"controls":[
+                {"control_type":"Text", "settings":{"value":{"call":"gate"}}}
+            ]}}
+        ])
+        backend: Any = load_program(write_program(tmp_path, program), page).on_route_change.__self__
+        
+        def gate() -> str:
+            started.set()
+            release.wait(5)
+            return "slow"
+        
+        async def navigate() -> NoReturn:
+            view: ft.ListView = page.views[0].controls[0]
+            page.route = "/slow"
+            build: asyncio.Future = asyncio.ensure_future(
+                page.on_route_change(ft.RouteChangeEvent("/slow"))
+            )
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            
+            backend.now = "2"
+            rebuilt: asyncio.Future = backend.rebuild_control("clock")
+            scrolled: asyncio.Future = asyncio.ensure_future(
+                view.on_scroll.get_handler()(scroll_event(view, 280, 300))
+            )
+            await asyncio.sleep(0.05)
+            pending.extend([rebuilt.done(), scrolled.done()])
+            
+            release.set()
+            await asyncio.gather(build, scrolled)
+            pending.extend([await rebuilt, len(view.controls)])
+        
+        backend.object_bucket.set_object("gate", gate)
+        backend.now = "1"
+        page.go("/")
+        page.loop.run_until_complete(navigate())
+        
+        assert pending == [False, False, ["clock"], 25]
+        assert [view.route for view in page.views] == ["/", "/slow"]
+        page.close()
+
+    def test_invalidate(self, tmp_path) -> NoReturn:
+        page: HeadlessPage = HeadlessPage()
+        program: dict = dict(SOURCE_PROGRAM, Controls=[
+            {"var_name":"clock", "control_type":"Text", "settings":{"value":{"code_refs":"now"}}},
+            {"var_name":"panel", "control_type":"Column", "settings":{"controls":[
+                {"refs":"clock"}, {"control_type":"Text", "settings":{"value":"static"}}
+            ]}}
+        ], UI=[
+            {"route":"/", "settings":{"controls":[
+                {"refs":"panel"}, {"control_type":"Text", "settings":{"value":"other"}}
+            ]}}
+        ])
+        backend: Any = load_program(write_program(tmp_path, program), page).on_route_change.__self__
+        backend.now = "1"
+        page.go("/")
+        
+        view: ft.View = page.views[0]
+        other: ft.Text = view.controls[1]
+        count: int = page.update_count
+        assert backend.panel.controls[0] is backend.clock and backend.clock.value == "1"
+        
+        backend.now = "2"
+        assert backend.rebuild_control("clock") == ["clock", "panel"]
+        assert backend.clock.value == "2" and backend.panel.controls[0] is backend.clock
+        assert view.controls[0] is backend.panel and view.controls[1] is other
+        assert page.update_count == count + 1
+        
+        page.go("/")
+        assert "/" not in backend.view_cache and page.views[-1] is not view
+        assert page.views[-1].controls[0].controls[0].value == "2"
+        page.close()
@@ -0,0 +1,198 @@
+import asyncio
+from types import SimpleNamespace
+
+from src.fjml import utils, operation_classes as opc, data_types as dt, error_types as err
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+import pytest
+
+
+MARKUP: dict = {
+    "var_name":"main",
+    "control_type":"Column",
+    "settings":{
+        "controls":[
+            {"control_type":"Text", "settings":{"value":{"refs":"title"}}},
+            {
+                "control_type":"TextButton", 
+                "settings":{
+                    "on_click":{"call":"go_home"},
+                    "_unpack":{"styling":"Main.button"},
+                    "data":{"code_refs":"items"}
+                }
+            }
+        ]
+    }
+}
+
+
+class TestMarkupScan:
+
+    def test_scan(self) -> NoReturn:
+        scan: utils.MarkupScan = utils.Utilities.scan_markup(MARKUP)
+
+        assert scan.control_types == {"Column", "Text", "TextButton"}
+        assert scan.refs == {"title"}
+        assert scan.code_refs == {"items"}
+        assert scan.styles == {"Main.button"}
+        assert scan.events == {("call", "go_home")}
+        assert not scan.invalid_keys
+
+    def test_style_sheet(self) -> NoReturn:
+        with pytest.raises(KeyError):
+            opc.StyleSheet({"Main":{"button":{"refs":"title"}}})
+        with pytest.raises(ValueError):
+            opc.StyleSheet({"Main":{"button":{"control_type":"loop"}}})
+        assert opc.StyleSheet({"Main":{"button":{"control_type":"Text"}}}).scan.control_types == {"Text"}
+
+
+class TestRenderPlan:
+
+    def test_plan(self) -> NoReturn:
+        plan: dt.RenderPlan = dt.RenderPlan.from_settings(
+            {
+                "value":"text",
+                "content":dt.NestedControlModel("Text"),
+                "on_click":{"func":"go_home"},
+                "style":{"styling":"Main.text"},
+                "data":{"refs":"title"},
+                "controls":[{"control_type":"loop"}, {"eval":"1"}, "text"],
+                "_unpack":{"styling":"Main.button"}
+            }
+        )
+
+        assert plan.steps == (
+            ("on_click", None, "func"),
+            ("controls", 1, "eval"),
+            ("content", None, "nested"),
+            ("style", None, "style"),
+            ("data", None, "ref"),
+            ("controls", 0, "control"),
+        )
+        assert plan.list_keys == {"controls"}
+
+    def test_merge(self) -> NoReturn:
+        plan: dt.RenderPlan = dt.RenderPlan([("data", None, "ref"), ("value", None, "nested")])
+        merged: dt.RenderPlan = plan.merge(dt.RenderPlan([("data", None, "func")]))
+
+        assert merged.steps == (("data", None, "func"), ("value", None, "nested"))
+
+
+class TestLoopTemplate:
+
+    def test_fill(self) -> NoReturn:
+        control: dict = {
+            "control_type":"Text",
+            "settings":{
+                "value":{"control_type":"loop_index", "idx":[0, 1]},
+                "style":{"size":12},
+                "spans":[{"text":{"control_type":"loop_index", "idx":[0, 0]}}]
+            }
+        }
+        template: opc.LoopTemplate = opc.LoopTemplate(control)
+        result: dict = template.fill(1, [("a", "b")])
+
+        assert template.is_valid and not template.is_reference
+        assert result["settings"]["value"] == "b"
+        assert result["settings"]["spans"][0]["text"] == "a"
+        assert result["settings"]["style"] is control["settings"]["style"]
+        assert control["settings"]["value"]["control_type"] == "loop_index"
+
+    def test_static(self) -> NoReturn:
+        control: dict = {"control_type":"Text", "settings":{"value":"x"}}
+        template: opc.LoopTemplate = opc.LoopTemplate(control)
+
+        assert template.fill(1, [0]) is control
+        assert not opc.LoopTemplate({"control_type":"loop"}).is_valid
+
+
+class TestLoopSource:
+
+    def test_release(self) -> NoReturn:
+        source: dt.LoopSource = dt.LoopSource(iter(range(10)))
+
+        assert source.slice(0, 4) == [0, 1, 2, 3]
+        source.release(3)
+        assert source.items == [3] and source.offset == 3
+        assert source.slice(3, 6) == [3, 4, 5]
+        source.release(6)
+        assert source.items == []
+        assert source.slice(6, 20) == [6, 7, 8, 9] and source.exhausted
+
+    def test_async_release(self) -> NoReturn:
+        async def items():
+            for i in range(5):
+                yield i
+
+        async def read(source: dt.LoopSource) -> list:
+            first: list = await source.aslice(0, 2)
+            source.release(2)
+            return [first, await source.aslice(2, 10)]
+
+        source: dt.LoopSource = dt.LoopSource(items(), 4)
+        assert asyncio.run(read(source)) == [[0, 1], [2, 3]]
+        assert source.items == [2, 3] and source.offset == 2
+
+
+class TestRefAccessor:
+
+    def test_resolve(self) -> NoReturn:
+        data: dict = {"items":["x", {"name":"y"}]}
+        lookup = lambda ref_type, name: data.get(name, None)
+        accessor: opc.RefAccessor = opc.RefAccessor(
+            {"code_refs":"data", "group":[{"idx":"items"}, {"idx":1}, {"idx":"name"}]}
+        )
+
+        assert accessor.resolve(lambda ref_type, name: data) == "y"
+        assert opc.RefAccessor({"code_refs":"items", "idx":0}).resolve(lookup) == "x"
+        assert opc.RefAccessor({"code_refs":"items", "idx":5}).resolve(lookup) is None
+        assert opc.RefAccessor({"code_refs":"items", "attr":"real"}).resolve(lookup) is None
+        assert not opc.RefAccessor({"code_refs":"items", "attr":1}).is_valid
+        assert not opc.RefAccessor({"code_refs":"items", "group":"idx"}).is_valid
+
+    def test_cache(self) -> NoReturn:
+        ref: dict = {"code_refs":"a", "idx":1}
+        reference: opc.Reference = opc.Reference(
+            SimpleNamespace(backend=SimpleNamespace(get_attr=getattr))
+        )
+        accessor: opc.RefAccessor = reference.accessor(ref)
+
+        assert reference.accessor(ref) is accessor
+        assert reference.accessor(dict(ref)) is not accessor
+        assert len(reference.accessors) == 2
+
+
+class TestControlDependencies:
+
+    def test_closure(self) -> NoReturn:
+        dependencies: opc.ControlDependencies = opc.ControlDependencies.from_data(
+            {"page":["header", "body"], "body":["card"], "header":["card"]}, {}
+        )
+
+        assert dependencies.get("page") == ["card", "body", "header"]
+        assert dependencies.get("card") == []
+        assert dependencies.dependents("card") == ["card", "body", "header", "page"]
+        assert dependencies.reverse["card"] == {"body", "header"}
+
+    def test_update(self) -> NoReturn:
+        dependencies: opc.ControlDependencies = opc.ControlDependencies()
+
+        dependencies.add_refs("page", ["body"])
+        dependencies.add_refs("body", ["card"])
+        dependencies.update_cache()
+        dependencies.add_refs("card", ["icon"], update=True)
+
+        assert dependencies.get("page") == ["icon", "card", "body"]
+        assert dependencies.get("page") == dependencies.get("page", cache=False)
+
+    def test_cycle(self) -> NoReturn:
+        dependencies: opc.ControlDependencies = opc.ControlDependencies.from_data(
+            {"a":["b"], "b":["c"], "c":["a"]}, {}
+        )
+
+        with pytest.raises(err.CyclicReferenceError, match="a -> b -> c -> a"):
+            dependencies.get("a")
@@ -0,0 +1,86 @@
+import os
+
+from src.fjml import Compiler, data_types as dt, error_types as err
+from src.fjml.constants import PROGRAM_FILE_MAGIC, PROGRAM_FILE_VERSION
+from src.fjml.program_format import (
+    CompiledFileHandler, CompiledProgram, HEADER_FORMAT, 
+    encode_settings, encode_plan, object_reference
+)
+from benchmarks.generator import ProgramShape, ProgramGenerator
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+import pytest
+
+
+@pytest.fixture
+def compiled(tmp_path) -> tuple[Compiler, str]:
+    path: str = ProgramGenerator(ProgramShape(controls=6, routes=2, imports=2)).write(str(tmp_path))
+    compiler: Compiler = Compiler(path, os.path.join(path, "compiled.fjml"))
+    
+    compiler.compile()
+    return compiler, os.path.join(path, "compiled.fjml")
+
+
+def rewrite_header(path: str, magic: bytes, version: int) -> NoReturn:
+    data: bytearray
+
+    with open(path, "rb") as file:
+        data = bytearray(file.read())
+    HEADER_FORMAT.pack_into(data, 0, magic, version, HEADER_FORMAT.unpack_from(data)[2])
+    with open(path, "wb") as file:
+        file.write(data)
+
+
+class TestProgramFormat:
+
+    def test_round_trip(self, compiled: tuple[Compiler, str]) -> NoReturn:
+        compiler, path = compiled
+        program: CompiledProgram = CompiledFileHandler.load(path)
+
+        assert program.program_name == compiler.params.program_name
+        assert program.routes == compiler.routes
+        assert program.methods is compiler.params.action_code
+        assert program.dependencies.get_data == compiler.dependent_refs.get_data
+        assert program.dependencies.get("/") == compiler.dependent_refs.get("/")
+        for name, control in compiler.parsed_controls.items():
+            assert encode_plan(program.controls[name].plan) == encode_plan(control.plan)
+            assert encode_settings(program.controls[name].settings) == encode_settings(control.settings)
+        assert encode_settings(program.ui["/"].settings) == encode_settings(compiler.parsed_ui["/"].settings)
+
+    def test_lazy_sections(self, compiled: tuple[Compiler, str], monkeypatch) -> NoReturn:
+        read: list = []
+        program: CompiledProgram = CompiledFileHandler.load(compiled[1])
+        read_section = CompiledProgram.read_section
+        monkeypatch.setattr(
+            CompiledProgram, "read_section", 
+            lambda self, name: read.append(name) or read_section(self, name)
+        )
+
+        assert program.routes == {"/", "/route_1"}
+        assert program.program_name == "Benchmark"
+        assert read == ["program"]
+        program.controls["control_0"]
+        assert read[1:] == ["controls", "control_refs"]
+
+    def test_rejected_files(self, compiled: tuple[Compiler, str]) -> NoReturn:
+        path: str = compiled[1]
+
+        rewrite_header(path, PROGRAM_FILE_MAGIC, PROGRAM_FILE_VERSION + 1)
+        with pytest.raises(err.InvalidProgramFileError, match="version"):
+            CompiledFileHandler.load(path)
+
+        rewrite_header(path, b"NOPE", PROGRAM_FILE_VERSION)
+        with pytest.raises(err.InvalidProgramFileError, match="not an FJML program"):
+            CompiledFileHandler.load(path)
+
+    def test_unimportable_actions(self) -> NoReturn:
+        class Actions(dt.EventContainer):
+            ...
+
+        assert object_reference(dt.EventContainer) == ("src.fjml.data_types", "EventContainer")
+        with pytest.raises(err.UnimportableObjectError, match="<locals>"):
+            object_reference(Actions)
@@ -0,0 +1,68 @@
+from typing import Optional
+
+from src.fjml import utils
+from src.fjml.constants import TYPE_HINT_CACHE_SIZE
+from src.fjml.registry.control_register import ControlRegistryOperations
+
+try:
+    from typing import NoReturn
+except:
+    from typing_extensions import NoReturn
+
+import pytest
+
+
+def control(name: str, settings: list[str] = []) -> dict:
+    return dict(name=name, source="flet", attr=name, valid_settings=settings, type_hints={})
+
+
+class TestRegistry:
+
+    def test_migrate(self) -> NoReturn:
+        registry: dict = utils.RegistryFileOperations.migrate(
+            {
+                "Controls":["Text", "Row", "Column"],
+                "ControlTypes":[control("Row"), control("Text"), control("Stack")]
+            }
+        )
+
+        assert list(registry) == ["Controls"]
+        assert list(registry["Controls"]) == ["Text", "Row"]
+        assert registry["Controls"]["Row"]["name"] == "Row"
+
+    def test_join(self) -> NoReturn:
+        reg1: dict = {"Controls":{"Text":control("Text", ["value"])}}
+        reg2: dict = {"Controls":{"Text":control("Text"), "Card":control("Card")}}
+        joined: dict = ControlRegistryOperations.join_registry(reg1, reg2)
+
+        assert list(joined["Controls"]) == ["Text", "Card"]
+        assert joined["Controls"]["Text"]["valid_settings"] == ["value"]
+        assert "Card" not in reg1["Controls"]
+
+    def test_cache(self, tmp_path, monkeypatch) -> NoReturn:
+        path: str = str(tmp_path / "control_registry")
+        monkeypatch.setattr(utils, "CONTROL_REGISTRY_PATH", path)
+        monkeypatch.setattr(utils, "LEGACY_CONTROL_REGISTRY_PATH", path)
+        utils.RegistryFileOperations.clear_cache()
+
+        registry: dict = utils.RegistryFileOperations.load_file()
+        assert utils.RegistryFileOperations.load_file() is registry
+        assert dict(registry["Controls"]) == {}
+
+        utils.RegistryFileOperations.save_file({"Controls":{"Text":control("Text")}})
+        registry = utils.RegistryFileOperations.load_file()
+        assert list(registry["Controls"]) == ["Text"]
+        with pytest.raises(TypeError):
+            registry["Controls"]["Card"] = control("Card")
+
+        ControlRegistryOperations.delete_control("Text")
+        assert "Text" not in utils.RegistryFileOperations.load_file()["Controls"]
+        utils.RegistryFileOperations.clear_cache()
+
+    def test_type_hint_cache(self) -> NoReturn:
+        data: str = utils.TypeHintSerializer.encode(Optional[list[int]])
+        hint: type = utils.TypeHintSerializer.decode(data)
+
+        assert utils.TypeHintSerializer.decode(data) is hint
+        assert utils.TypeHintSerializer.decode.__wrapped__(data) == hint == Optional[list[int]]
+        assert utils.TypeHintSerializer.decode.cache_info().maxsize == TYPE_HINT_CACHE_SIZE
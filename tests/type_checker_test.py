@@ -61,3 +61,11 @@ class TestTypeChecker:
         assert not tc.type_check({"hello":[1,2,3,"world"]}, dict[str, list[int]])
         assert tc.type_check({"hello":[1,2,3,4]}, dict[str, list[int]])
 
+
+    def test_validator_cache(self) -> NoReturn:
+        check: tc.Validator = tc.validator(Optional[list[int]])
+        
+        assert check is tc.validator(Optional[list[int]])
+        assert check([1, 2]) and check(None)
+        assert not check(["hello"])
+        assert tc.validator(list[Union[str, int]]) is not check